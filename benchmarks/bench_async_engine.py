@@ -0,0 +1,118 @@
+"""Benchmark: AsyncDecisionEngine vs the synchronous decide-and-append path.
+
+``--tasks`` coroutines each issue ``--requests`` decisions concurrently. The
+sync variant runs gate, router and ``AuditChain.append`` inline on the event
+loop (the ``run_scenario`` flow); the async variant uses
+``AsyncDecisionEngine``. Reports p50/p99 decision latency, throughput and the
+p99 event-loop lag seen by a 1 ms ticker task. Pass ``--fsync`` to force every
+write to disk, which is where blocking the loop hurts most.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from decision_policy_engine.audit.trace import AuditChain
+from decision_policy_engine.engine import AsyncDecisionEngine, make_decision
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=False,
+)
+ACTION = ProposedAction(type="NETWORK_CALL", risk_level="LOW")
+CANDIDATES = {
+    ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+    ExecutionRoute.HYBRID: CostVector(200, 0.15, 0.20, 0.20),
+    ExecutionRoute.CLOUD: CostVector(300, 0.35, 0.30, 0.45),
+    ExecutionRoute.DEGRADED: CostVector(600, 0.02, 0.40, 0.00),
+}
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + 0.001
+        await asyncio.sleep(0.001)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def _run(decide, tasks: int, requests: int) -> tuple[list[float], list[float], float]:
+    latencies: list[float] = []
+    lags: list[float] = []
+    stop = asyncio.Event()
+
+    async def client() -> None:
+        for _ in range(requests):
+            started = time.perf_counter()
+            await decide()
+            latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(0)
+
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(tasks)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+    return latencies, lags, elapsed
+
+
+async def _sync_variant(path: Path, tasks: int, requests: int, fsync: bool):
+    with AuditChain(path, fsync=fsync) as chain:
+
+        async def decide() -> None:
+            chain.append(make_decision(CONTEXT, ACTION, CANDIDATES).event)
+
+        return await _run(decide, tasks, requests)
+
+
+async def _async_variant(path: Path, tasks: int, requests: int, fsync: bool):
+    async with AsyncDecisionEngine(path, fsync=fsync) as engine:
+
+        async def decide() -> None:
+            await engine.decide(CONTEXT, ACTION, CANDIDATES)
+
+        result = await _run(decide, tasks, requests)
+        await engine.flush()
+        return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--fsync", action="store_true")
+    args = parser.parse_args()
+
+    print(
+        f"{'variant':<8} {'p50 us':>9} {'p99 us':>9} {'decisions/s':>12} {'loop lag p99 ms':>16}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, variant in (("sync", _sync_variant), ("async", _async_variant)):
+            path = Path(tmp) / f"{name}.jsonl"
+            latencies, lags, elapsed = asyncio.run(
+                variant(path, args.tasks, args.requests, args.fsync)
+            )
+            rate = len(latencies) / elapsed
+            lag = _percentile(lags, 0.99) * 1e3 if lags else 0.0
+            print(
+                f"{name:<8} {statistics.median(latencies) * 1e6:>9.1f} "
+                f"{_percentile(latencies, 0.99) * 1e6:>9.1f} {rate:>12.0f} {lag:>16.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
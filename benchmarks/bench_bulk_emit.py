@@ -0,0 +1,84 @@
+"""Benchmark: serial hash_event + append_jsonl vs AuditChain vs emit_events.
+
+``serial`` is the per-event loop of ``hash_event`` and ``append_jsonl``
+(one open/write per event); ``chain`` seals and writes through
+``AuditChain.extend`` in batches; ``emit_events xN`` encodes chunks in N
+worker processes and chains them in order on the main thread. All variants
+produce byte-identical logs, which is checked. Parallel encoding only pays
+off with more than one core.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from decision_policy_engine.audit.bulk import emit_events
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import AuditChain, append_jsonl, hash_event
+from decision_policy_engine.models import CostVector, ExecutionRoute, PolicyDecision
+
+
+def _event(index: int) -> AuditEvent:
+    return AuditEvent(
+        timestamp_iso="2024-01-01T00:00:00+00:00",
+        trace_id=f"trace-{index % 97}",
+        decision_id=f"decision-{index:08d}",
+        action_type="NETWORK_CALL",
+        policy_decision=PolicyDecision.ALLOW,
+        route_selected=ExecutionRoute.HYBRID,
+        cost_vector=CostVector(200 + index % 50, 0.15, 0.2, 0.2),
+        reason="Allowed by policy.",
+        inputs_redacted={
+            "action": {"type": "NETWORK_CALL", "risk_level": "LOW", "metadata": {"n": index}},
+            "context": {"rtt_ms": index % 500, "network_available": True, "locale": "en-US"},
+        },
+    )
+
+
+def _serial(path: Path, events: list[AuditEvent]) -> None:
+    prev_hash = None
+    for event in events:
+        digest = hash_event(event, prev_hash)
+        append_jsonl(path, replace(event, prev_hash=prev_hash, hash=digest))
+        prev_hash = digest
+
+
+def _chain(path: Path, events: list[AuditEvent]) -> None:
+    with AuditChain(path) as chain:
+        for start in range(0, len(events), 1024):
+            chain.extend(events[start : start + 1024])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    events = [_event(index) for index in range(args.events)]
+    variants = [("serial", _serial), ("chain", _chain)]
+    for workers in dict.fromkeys(args.workers):
+        variants.append(
+            (f"emit_events x{workers}", lambda p, e, w=workers: emit_events(p, e, workers=w))
+        )
+    print(f"{'variant':<18} {'events/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        reference = None
+        for index, (name, function) in enumerate(variants):
+            path = Path(tmp) / f"{index}.jsonl"
+            started = time.perf_counter()
+            function(path, events)
+            elapsed = time.perf_counter() - started
+            content = path.read_bytes()
+            reference = reference or content
+            assert content == reference, f"{name} output differs"
+            print(f"{name:<18} {args.events / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Microbenchmark: Router.select_route vs CompiledRouter.select_route.
+
+Reports mean latency per call and bytes allocated per call (via tracemalloc).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from decision_policy_engine.decision.compiled import CompiledRouter
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=False,
+)
+CANDIDATES = {
+    ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+    ExecutionRoute.HYBRID: CostVector(200, 0.15, 0.20, 0.20),
+    ExecutionRoute.CLOUD: CostVector(300, 0.35, 0.30, 0.45),
+    ExecutionRoute.DEGRADED: CostVector(600, 0.02, 0.40, 0.00),
+}
+
+
+def _latency_ns(select, iterations: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        select(CONTEXT, CANDIDATES)
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def _allocated_bytes(select, iterations: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [select(CONTEXT, CANDIDATES) for _ in range(iterations)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del results
+    stats = after.compare_to(before, "filename")
+    return sum(stat.size_diff for stat in stats) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    compiled = CompiledRouter()
+    rows = [
+        ("Router.select_route", Router.select_route),
+        ("CompiledRouter.select_route", compiled.select_route),
+    ]
+    print(f"{'variant':<30} {'ns/call':>10} {'bytes/call':>12}")
+    for name, select in rows:
+        latency = _latency_ns(select, args.iterations)
+        allocated = _allocated_bytes(select, min(args.iterations, 10_000))
+        print(f"{name:<30} {latency:>10.0f} {allocated:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark: overhead of the metrics layer on the decision hot path.
+
+For each instrumented entry point reports the uninstrumented inner call, the
+public call with metrics disabled (the default) and with metrics enabled.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from decision_policy_engine.audit import encoding
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.engine import make_decision
+from decision_policy_engine.metrics import METRICS
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+from decision_policy_engine.policy.policy_gate import PolicyGate
+from decision_policy_engine.policy.rules import DEFAULT_RULE_TABLE
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=True,
+)
+ACTION = ProposedAction(type="DATA_EXPORT", risk_level="HIGH")
+CANDIDATES = {
+    ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+    ExecutionRoute.HYBRID: CostVector(200, 0.15, 0.20, 0.20),
+    ExecutionRoute.CLOUD: CostVector(300, 0.35, 0.30, 0.45),
+    ExecutionRoute.DEGRADED: CostVector(600, 0.02, 0.40, 0.00),
+}
+EVENT = make_decision(CONTEXT, ACTION, CANDIDATES).event
+ENCODED = encoding.encode_event(EVENT)
+
+
+def _ns_per_call(function, iterations: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            function()
+        best = min(best, (time.perf_counter_ns() - start) / iterations)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=50_000)
+    args = parser.parse_args()
+
+    rows = [
+        (
+            "PolicyGate.evaluate",
+            lambda: DEFAULT_RULE_TABLE.evaluate(CONTEXT, ACTION),
+            lambda: PolicyGate.evaluate(CONTEXT, ACTION),
+        ),
+        (
+            "Router.select_route",
+            lambda: Router._select_route(CONTEXT, CANDIDATES, False),
+            lambda: Router.select_route(CONTEXT, CANDIDATES),
+        ),
+        (
+            "event_hash",
+            lambda: encoding._event_hash(ENCODED, None),
+            lambda: encoding.event_hash(ENCODED, None),
+        ),
+        (
+            "seal_event",
+            lambda: encoding.encode_event(EVENT).line(None, encoding._event_hash(ENCODED, None)),
+            lambda: encoding.seal_event(EVENT, None),
+        ),
+    ]
+    print(f"{'entry point':<22} {'inner ns':>10} {'disabled ns':>12} {'enabled ns':>11}")
+    for name, inner, public in rows:
+        METRICS.disable()
+        base = _ns_per_call(inner, args.iterations)
+        disabled = _ns_per_call(public, args.iterations)
+        METRICS.enable()
+        enabled = _ns_per_call(public, args.iterations)
+        METRICS.disable()
+        print(f"{name:<22} {base:>10.0f} {disabled:>12.0f} {enabled:>11.0f}")
+    METRICS.reset()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark: construction time and memory of the slotted model classes.
+
+Compares ``Context``, ``CostVector``, ``ProposedAction`` and ``AuditEvent``
+with ``__dict__``-based copies equivalent to their earlier definitions
+(including the per-instance ``allowed`` set in ``ProposedAction``). Memory is
+measured with tracemalloc over ``--count`` live instances.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
+
+
+@dataclass(frozen=True)
+class LegacyCostVector:
+    latency_ms: int
+    privacy_risk: float
+    reliability_risk: float
+    dollar_cost: float
+
+
+@dataclass(frozen=True)
+class LegacyProposedAction:
+    type: str
+    risk_level: str
+    metadata: Mapping[str, object] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        allowed = {"LOW", "MEDIUM", "HIGH"}
+        if self.risk_level not in allowed:
+            raise ValueError(f"risk_level must be one of {sorted(allowed)}")
+
+
+@dataclass(frozen=True)
+class LegacyContext:
+    network_available: bool
+    rtt_ms: int
+    battery_level: float
+    user_present: bool
+    supervised_mode: bool
+    locale: str = "en-US"
+
+
+@dataclass(frozen=True)
+class LegacyAuditEvent:
+    timestamp_iso: str
+    trace_id: str
+    decision_id: str
+    action_type: str
+    policy_decision: PolicyDecision
+    route_selected: ExecutionRoute
+    cost_vector: object
+    reason: str
+    inputs_redacted: Mapping[str, object]
+    prev_hash: str | None = None
+    hash: str | None = None
+
+
+INPUTS = {"action": {"type": "NETWORK_CALL"}}
+
+
+def _factories(cost, action, context, event):
+    return {
+        "CostVector": lambda: cost(120, 0.05, 0.10, 0.02),
+        "ProposedAction": lambda: action("NETWORK_CALL", "LOW"),
+        "Context": lambda: context(True, 120, 0.6, True, False),
+        "AuditEvent": lambda: event(
+            "2024-01-01T00:00:00+00:00",
+            "trace",
+            "decision",
+            "NETWORK_CALL",
+            PolicyDecision.ALLOW,
+            ExecutionRoute.LOCAL,
+            None,
+            "ok",
+            INPUTS,
+        ),
+    }
+
+
+def _construct_ns(factory, iterations: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        factory()
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def _bytes_per_instance(factory, count: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / count - 8  # minus the list slot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500_000)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    legacy = _factories(LegacyCostVector, LegacyProposedAction, LegacyContext, LegacyAuditEvent)
+    current = _factories(CostVector, ProposedAction, Context, AuditEvent)
+    print(f"{'model':<16} {'ns before':>10} {'ns after':>10} {'B before':>9} {'B after':>9}")
+    for name in current:
+        print(
+            f"{name:<16} {_construct_ns(legacy[name], args.iterations):>10.0f} "
+            f"{_construct_ns(current[name], args.iterations):>10.0f} "
+            f"{_bytes_per_instance(legacy[name], args.count):>9.0f} "
+            f"{_bytes_per_instance(current[name], args.count):>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
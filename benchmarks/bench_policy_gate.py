@@ -0,0 +1,66 @@
+"""Benchmark: PolicyGate.evaluate against the original hand-written gate.
+
+``baseline`` is the if-chain the gate used before rules became declarative;
+``PolicyGate`` evaluates ``DEFAULT_RULE_TABLE``, whose dispatch buckets are
+compiled into generated functions. Each case is one ``(action.type,
+risk_level)`` combination, timed in ns per call (best of ``--repeat``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from decision_policy_engine.models import Context, PolicyDecision, ProposedAction
+from decision_policy_engine.policy.policy_gate import PolicyGate
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=False,
+)
+CASES = {
+    "DATA_EXPORT/HIGH": ProposedAction(type="DATA_EXPORT", risk_level="HIGH"),
+    "NETWORK_CALL/LOW": ProposedAction(type="NETWORK_CALL", risk_level="LOW"),
+    "DATA_PROCESS/LOW": ProposedAction(type="DATA_PROCESS", risk_level="LOW"),
+}
+
+
+def baseline(context: Context, action: ProposedAction) -> tuple[PolicyDecision, str]:
+    if action.risk_level == "HIGH" and not context.supervised_mode:
+        return PolicyDecision.SUPERVISED, "High risk action requires supervision."
+    if action.type == "NETWORK_CALL" and not context.network_available:
+        return PolicyDecision.DENY, "Network unavailable for network call."
+    if context.battery_level < 0.10 and action.type == "NETWORK_CALL":
+        return PolicyDecision.DENY, "Battery too low for network call."
+    return PolicyDecision.ALLOW, "Action permitted."
+
+
+def _ns_per_call(evaluate, action: ProposedAction, iterations: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            evaluate(CONTEXT, action)
+        best = min(best, (time.perf_counter_ns() - start) / iterations)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'case':<20} {'baseline ns':>12} {'PolicyGate ns':>14} {'ratio':>7}")
+    for name, action in CASES.items():
+        assert PolicyGate.evaluate(CONTEXT, action) == baseline(CONTEXT, action)
+        old = _ns_per_call(baseline, action, args.iterations, args.repeat)
+        new = _ns_per_call(PolicyGate.evaluate, action, args.iterations, args.repeat)
+        print(f"{name:<20} {old:>12.0f} {new:>14.0f} {new / old:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
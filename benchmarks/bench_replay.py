@@ -0,0 +1,84 @@
+"""Benchmark: what-if replay throughput and memory over growing logs.
+
+Writes logs of ``--sizes`` events with ``emit_events``, then replays each
+with a changed battery rule and changed router weights. Reports events/s for
+``--workers`` and the peak traced Python memory of the single-process run,
+which should stay flat as the log grows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from decision_policy_engine.audit.bulk import emit_events
+from decision_policy_engine.engine import make_decision, replay_log
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+from decision_policy_engine.policy.rules import DEFAULT_RULES, RuleTable
+
+WEIGHTS = {"latency_ms": 0.1, "privacy_risk": 0.1, "reliability_risk": 0.1, "dollar_cost": 0.7}
+
+
+def build_candidates(context: Context, action: ProposedAction) -> dict:
+    return {
+        ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+        ExecutionRoute.HYBRID: CostVector(max(200, context.rtt_ms), 0.15, 0.20, 0.20),
+        ExecutionRoute.CLOUD: CostVector(max(300, context.rtt_ms + 80), 0.35, 0.30, 0.45),
+        ExecutionRoute.DEGRADED: CostVector(600, 0.02, 0.40, 0.00),
+    }
+
+
+def _events(count: int):
+    rng = random.Random(0)
+    for index in range(count):
+        context = Context(
+            network_available=rng.random() < 0.9,
+            rtt_ms=rng.choice([30, 120, 400, 900]),
+            battery_level=round(rng.random(), 3),
+            user_present=True,
+            supervised_mode=rng.random() < 0.5,
+        )
+        action = ProposedAction(
+            type=rng.choice(["NETWORK_CALL", "DATA_PROCESS"]),
+            risk_level=rng.choice(["LOW", "MEDIUM", "HIGH"]),
+        )
+        yield make_decision(
+            context, action, build_candidates(context, action), decision_id=f"d-{index}"
+        ).event
+
+
+def _rules() -> RuleTable:
+    rules = [dict(rule) for rule in DEFAULT_RULES["rules"]]
+    rules[2]["when"] = {"context.battery_level": {"lt": 0.25}, "action.type": "NETWORK_CALL"}
+    return RuleTable({"rules": rules, "default": DEFAULT_RULES["default"]})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20_000, 80_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    args = parser.parse_args()
+
+    rules = _rules()
+    print(f"{'events':>8} {'workers':>7} {'events/s':>10} {'changed':>8} {'peak MiB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = Path(tmp) / f"audit-{size}.jsonl"
+            emit_events(path, _events(size), workers=1)
+            for workers in args.workers:
+                tracemalloc.start()
+                report = replay_log(
+                    path, rules=rules, weights=WEIGHTS, candidates=build_candidates,
+                    workers=workers,
+                )
+                peak = tracemalloc.get_traced_memory()[1] / 2**20
+                tracemalloc.stop()
+                print(f"{size:>8} {workers:>7} {report.events_per_s:>10,.0f} "
+                      f"{report.changed:>8} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
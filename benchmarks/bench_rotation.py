@@ -0,0 +1,85 @@
+"""Benchmark: single-file AuditChain vs RotatingAuditChain.
+
+Appends ``--events`` events in batches of ``--batch`` to one growing file and
+to a rotated log with ``--segment-mb`` segments (gzip or zstd compressed in
+the background), then streams the rotated log through ``verify_segments``.
+Reports append throughput, on-disk size and verification throughput.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.rotation import (
+    RotatingAuditChain,
+    segment_paths,
+    verify_segments,
+)
+from decision_policy_engine.audit.trace import AuditChain
+from decision_policy_engine.models import CostVector, ExecutionRoute, PolicyDecision
+
+
+def _event(index: int) -> AuditEvent:
+    return AuditEvent(
+        timestamp_iso="2024-01-01T00:00:00+00:00",
+        trace_id=f"trace-{index}",
+        decision_id=f"decision-{index:08d}",
+        action_type="NETWORK_CALL",
+        policy_decision=PolicyDecision.ALLOW,
+        route_selected=ExecutionRoute.HYBRID,
+        cost_vector=CostVector(200, 0.15, 0.2, 0.2),
+        reason="Allowed by policy.",
+        inputs_redacted={"context": {"rtt_ms": index % 500, "network_available": True}},
+    )
+
+
+def _append(chain, events: list[AuditEvent], batch: int) -> float:
+    started = time.perf_counter()
+    for start in range(0, len(events), batch):
+        chain.extend(events[start : start + batch])
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--segment-mb", type=float, default=8.0)
+    parser.add_argument("--compression", default="auto")
+    args = parser.parse_args()
+
+    events = [_event(index) for index in range(args.events)]
+    with tempfile.TemporaryDirectory() as tmp:
+        single_path = Path(tmp) / "single.jsonl"
+        with AuditChain(single_path) as chain:
+            single_s = _append(chain, events, args.batch)
+        single_bytes = single_path.stat().st_size
+
+        rotated = Path(tmp) / "rotated"
+        chain = RotatingAuditChain(
+            rotated,
+            max_bytes=int(args.segment_mb * 1024 * 1024),
+            compression=args.compression,
+        )
+        rotated_s = _append(chain, events, args.batch)
+        started = time.perf_counter()
+        chain.close()
+        drain_s = time.perf_counter() - started
+        segments = segment_paths(rotated)
+        rotated_bytes = sum(path.stat().st_size for path in segments)
+        report = verify_segments(rotated)
+
+    print(f"{'variant':<22} {'events/s':>12} {'MB on disk':>12}")
+    print(f"{'single file':<22} {args.events / single_s:>12,.0f} {single_bytes / 1e6:>12.1f}")
+    print(f"{'rotated':<22} {args.events / rotated_s:>12,.0f} {rotated_bytes / 1e6:>12.1f}")
+    print(f"segments: {len(segments)}, compression drain on close: {drain_s:.2f}s")
+    print(f"verify_segments: ok={report.ok} {report.events_per_s:,.0f} events/s "
+          f"({report.mb_per_s:.1f} MB/s uncompressed)")
+
+
+if __name__ == "__main__":
+    main()
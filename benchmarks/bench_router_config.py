@@ -0,0 +1,70 @@
+"""Benchmark: per-tenant routing weights, compiled per call vs shared per config.
+
+``per call`` builds a ``CompiledRouter`` from the tenant's weights mapping for
+every decision, as a handler without a cache would; ``router_for`` looks the
+tenant's ``RouterConfig`` router up in the shared cache; ``held`` keeps the
+router from one lookup. ``Router.select_route`` (module-level weights) is the
+baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from decision_policy_engine.decision.compiled import CompiledRouter, router_for
+from decision_policy_engine.decision.config import RouterConfig
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=False,
+)
+CANDIDATES = {
+    ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+    ExecutionRoute.HYBRID: CostVector(200, 0.15, 0.20, 0.20),
+    ExecutionRoute.CLOUD: CostVector(300, 0.35, 0.30, 0.45),
+    ExecutionRoute.DEGRADED: CostVector(600, 0.02, 0.40, 0.00),
+}
+TENANT_WEIGHTS = {
+    "latency_ms": 0.3,
+    "privacy_risk": 0.3,
+    "reliability_risk": 0.2,
+    "dollar_cost": 0.2,
+}
+
+
+def _latency_ns(decide, iterations: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        decide()
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    config = RouterConfig.from_weights(TENANT_WEIGHTS)
+    held = router_for(config)
+    rows = [
+        ("Router.select_route", lambda: Router.select_route(CONTEXT, CANDIDATES)),
+        (
+            "per call",
+            lambda: CompiledRouter(TENANT_WEIGHTS).select_route(CONTEXT, CANDIDATES),
+        ),
+        ("router_for", lambda: router_for(config).select_route(CONTEXT, CANDIDATES)),
+        ("held", lambda: held.select_route(CONTEXT, CANDIDATES)),
+    ]
+    print(f"{'variant':<22} {'ns/call':>10}")
+    for name, decide in rows:
+        print(f"{name:<22} {_latency_ns(decide, args.iterations):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
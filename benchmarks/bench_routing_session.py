@@ -0,0 +1,107 @@
+"""Benchmark: RoutingSession against rebuilding and rescoring per decision.
+
+Each decision sees a new context drawn from a small set of ``rtt_ms`` values,
+with the network dropping every fifth call. ``stateless`` rebuilds the
+candidates like ``examples/demo_cli.build_candidates`` and calls
+``Router.select_route``; ``session`` keeps the static routes scored and only
+rebuilds the rtt-dependent ones when ``rtt_ms`` changes. A second pass with
+``N`` extra static endpoints shows how the saving grows with candidate count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from decision_policy_engine.decision.registry import RouteRegistry
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.decision.session import RoutingSession
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute
+
+
+def _hybrid(context: Context) -> CostVector:
+    return CostVector(max(200, context.rtt_ms), 0.15, 0.20, 0.20)
+
+
+def _cloud(context: Context) -> CostVector:
+    return CostVector(max(300, context.rtt_ms + 80), 0.35, 0.30, 0.45)
+
+
+LOCAL = CostVector(120, 0.05, 0.10, 0.02)
+DEGRADED = CostVector(600, 0.02, 0.40, 0.00)
+
+
+def _contexts(count: int, rng: random.Random) -> list[Context]:
+    return [
+        Context(
+            network_available=index % 5 != 0,
+            rtt_ms=rng.choice([40, 120, 400]),
+            battery_level=0.6,
+            user_present=True,
+            supervised_mode=False,
+        )
+        for index in range(count)
+    ]
+
+
+def _ns_per_call(function, contexts: list[Context]) -> float:
+    start = time.perf_counter_ns()
+    for context in contexts:
+        function(context)
+    return (time.perf_counter_ns() - start) / len(contexts)
+
+
+def _builtin(contexts: list[Context]) -> None:
+    def stateless(context: Context):
+        candidates = {
+            ExecutionRoute.LOCAL: LOCAL,
+            ExecutionRoute.HYBRID: _hybrid(context),
+            ExecutionRoute.CLOUD: _cloud(context),
+            ExecutionRoute.DEGRADED: DEGRADED,
+        }
+        return Router.select_route(context, candidates)
+
+    session = RoutingSession(
+        {ExecutionRoute.LOCAL: LOCAL, ExecutionRoute.DEGRADED: DEGRADED},
+        dynamic={ExecutionRoute.HYBRID: _hybrid, ExecutionRoute.CLOUD: _cloud},
+    )
+    for name, function in (("stateless", stateless), ("session", session.select_route)):
+        print(f"{4:>6} {name:<12} {_ns_per_call(function, contexts):>10.0f}")
+
+
+def _endpoints(count: int, contexts: list[Context], rng: random.Random) -> None:
+    routes = [f"endpoint-{index}" for index in range(count)] + ["hybrid", "cloud"]
+    registry = RouteRegistry(routes, requires_network=["cloud"])
+    static = {
+        route: CostVector(rng.randint(0, 2000), rng.random(), rng.random(), rng.uniform(0, 10))
+        for route in routes[:count]
+    }
+
+    def stateless(context: Context):
+        candidates = dict(static)
+        candidates["hybrid"] = _hybrid(context)
+        candidates["cloud"] = _cloud(context)
+        return registry.select_route(context, candidates)
+
+    dynamic = {"hybrid": _hybrid, "cloud": _cloud}
+    session = RoutingSession(static, dynamic=dynamic, registry=registry)
+    for name, function in (("stateless", stateless), ("session", session.select_route)):
+        print(f"{count + 2:>6} {name:<12} {_ns_per_call(function, contexts):>10.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    contexts = _contexts(args.decisions, rng)
+    print(f"{'routes':>6} {'variant':<12} {'ns/call':>10}")
+    _builtin(contexts)
+    for count in (64, 256):
+        _endpoints(count, contexts[: max(100, args.decisions * 4 // count)], rng)
+
+
+if __name__ == "__main__":
+    main()
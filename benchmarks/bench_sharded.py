@@ -0,0 +1,88 @@
+"""Scaling benchmark: ShardedDecisionEngine throughput over 1..N shard processes.
+
+Each run decides ``--decisions`` requests spread over 1024 trace ids with
+``decide_many`` and writes one audit chain per shard. The in-process baseline
+runs ``make_decision`` plus ``AuditChain.extend`` in the calling process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from decision_policy_engine.audit.trace import AuditChain
+from decision_policy_engine.engine import (
+    DecisionRequest,
+    ShardedDecisionEngine,
+    make_decision,
+    verify_sharded,
+)
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=False,
+)
+ACTION = ProposedAction(type="NETWORK_CALL", risk_level="LOW")
+CANDIDATES = {
+    ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+    ExecutionRoute.HYBRID: CostVector(200, 0.15, 0.20, 0.20),
+    ExecutionRoute.CLOUD: CostVector(300, 0.35, 0.30, 0.45),
+    ExecutionRoute.DEGRADED: CostVector(600, 0.02, 0.40, 0.00),
+}
+
+
+def _requests(count: int) -> list[DecisionRequest]:
+    return [
+        DecisionRequest(CONTEXT, ACTION, CANDIDATES, trace_id=f"trace-{i % 1024}")
+        for i in range(count)
+    ]
+
+
+def _baseline(directory: Path, requests: list[DecisionRequest]) -> float:
+    started = time.perf_counter()
+    with AuditChain(directory / "baseline.jsonl") as chain:
+        chain.extend(
+            make_decision(r.context, r.action, r.candidates, trace_id=r.trace_id).event
+            for r in requests
+        )
+    return time.perf_counter() - started
+
+
+def _sharded(directory: Path, shards: int, requests: list[DecisionRequest], chunk: int) -> float:
+    with ShardedDecisionEngine(directory, shards=shards) as engine:
+        engine.tails()  # start the workers outside the timed region
+        started = time.perf_counter()
+        engine.decide_many(requests, chunk_size=chunk)
+        engine.tails()
+        elapsed = time.perf_counter() - started
+    if not verify_sharded(directory).ok:
+        raise SystemExit(f"verification failed for {shards} shards")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=100_000)
+    parser.add_argument("--max-shards", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    requests = _requests(args.decisions)
+    with tempfile.TemporaryDirectory() as tmp:
+        base = _baseline(Path(tmp), requests)
+        print(f"{'shards':>10} {'decisions/s':>12} {'speedup':>8}")
+        print(f"{'in-process':>10} {args.decisions / base:>12.0f} {1.0:>8.2f}")
+        for shards in range(1, args.max_shards + 1):
+            elapsed = _sharded(Path(tmp) / f"run-{shards}", shards, requests, args.chunk_size)
+            print(f"{shards:>10} {args.decisions / elapsed:>12.0f} {base / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark: single-writer AuditChain vs shared multi-process appends.
+
+``single`` is one process appending every event. ``shared xN`` splits the
+same events over N processes, each with its own ``AuditChain(shared=True)``
+on one file, so every batch takes the ``flock``, re-syncs the tail hash and
+writes. Batches amortize the lock; the resulting log is verified each time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import AuditChain
+from decision_policy_engine.audit.verify import verify_chain
+from decision_policy_engine.models import CostVector, ExecutionRoute, PolicyDecision
+
+
+def _event(worker: int, index: int) -> AuditEvent:
+    return AuditEvent(
+        timestamp_iso="2024-01-01T00:00:00+00:00",
+        trace_id=f"worker-{worker}",
+        decision_id=f"decision-{worker}-{index}",
+        action_type="NETWORK_CALL",
+        policy_decision=PolicyDecision.ALLOW,
+        route_selected=ExecutionRoute.HYBRID,
+        cost_vector=CostVector(200, 0.15, 0.2, 0.2),
+        reason="Allowed by policy.",
+        inputs_redacted={"context": {"rtt_ms": index % 500}},
+    )
+
+
+def _write(path: str, worker: int, events: int, batch: int, shared: bool) -> float:
+    pending = [_event(worker, index) for index in range(events)]
+    started = time.perf_counter()
+    with AuditChain(path, shared=shared) as chain:
+        for start in range(0, events, batch):
+            chain.extend(pending[start : start + batch])
+    return time.perf_counter() - started
+
+
+def _run(directory: Path, events: int, batch: int, processes: int) -> float:
+    path = str(directory / f"audit-{processes}-{batch}.jsonl")
+    per_process = events // processes
+    started = time.perf_counter()
+    if processes == 1:
+        _write(path, 0, per_process, batch, False)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [
+                pool.submit(_write, path, worker, per_process, batch, True)
+                for worker in range(processes)
+            ]
+            for future in futures:
+                future.result()
+    elapsed = time.perf_counter() - started
+    report = verify_chain(path)
+    assert report.ok and report.events == per_process * processes, report
+    return per_process * processes / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=40_000)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 16, 128])
+    args = parser.parse_args()
+
+    print(f"{'writers':<12} {'batch':>6} {'events/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for batch in args.batches:
+            for processes in args.processes:
+                name = "single" if processes == 1 else f"shared x{processes}"
+                rate = _run(Path(tmp), args.events, batch, processes)
+                print(f"{name:<12} {batch:>6} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
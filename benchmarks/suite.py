@@ -0,0 +1,340 @@
+"""Benchmark suite for the gate, router, audit encoding/hashing, audit I/O and pipeline.
+
+Usage::
+
+    python benchmarks/suite.py run --output results.json [--quick] [--filter router]
+    python benchmarks/suite.py compare baseline.json results.json [--threshold 0.10]
+
+``run`` times every case in samples of ``inner`` back-to-back calls and stores
+per-call latency percentiles and throughput as JSON. Workloads scale the
+number of route candidates, the size of ``action.metadata`` and the size of
+the existing audit log. ``compare`` reports the p50 change per case and exits
+with status 1 if any case is slower than the baseline by more than
+``--threshold`` (a fraction).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import (
+    AuditChain,
+    append_jsonl,
+    canonical_event_json,
+    hash_event,
+    redact_inputs,
+)
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
+from decision_policy_engine.policy.policy_gate import PolicyGate
+
+SCHEMA_VERSION = 1
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=True,
+)
+OFFLINE = Context(
+    network_available=False,
+    rtt_ms=0,
+    battery_level=0.75,
+    user_present=True,
+    supervised_mode=False,
+)
+ALL_CANDIDATES = {
+    ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+    ExecutionRoute.HYBRID: CostVector(200, 0.15, 0.20, 0.20),
+    ExecutionRoute.CLOUD: CostVector(300, 0.35, 0.30, 0.45),
+    ExecutionRoute.DEGRADED: CostVector(600, 0.02, 0.40, 0.00),
+}
+
+
+def _action(metadata_bytes: int) -> ProposedAction:
+    metadata = {"payload": "x" * metadata_bytes} if metadata_bytes else {}
+    return ProposedAction(type="DATA_EXPORT", risk_level="HIGH", metadata=metadata)
+
+
+def _event(metadata_bytes: int = 0) -> AuditEvent:
+    action = _action(metadata_bytes)
+    return AuditEvent(
+        timestamp_iso=datetime.now(timezone.utc).isoformat(),
+        trace_id=str(uuid4()),
+        decision_id=str(uuid4()),
+        action_type=action.type,
+        policy_decision=PolicyDecision.SUPERVISED,
+        route_selected=ExecutionRoute.LOCAL,
+        cost_vector=ALL_CANDIDATES[ExecutionRoute.LOCAL],
+        reason="High-risk action requires supervision.",
+        inputs_redacted=redact_inputs(CONTEXT, action),
+    )
+
+
+def _prefilled_log(directory: Path, events: int) -> Path:
+    path = directory / f"log-{events}-{uuid4().hex}.jsonl"
+    template = _event()
+    with AuditChain(path) as chain:
+        for start in range(0, events, 10_000):
+            chain.extend([template] * min(10_000, events - start))
+    return path
+
+
+def _decide_and_append(chain: AuditChain, action: ProposedAction) -> str:
+    policy_decision, reason = PolicyGate.evaluate(CONTEXT, action)
+    route, cost, _ = Router.select_route(CONTEXT, ALL_CANDIDATES)
+    event = AuditEvent(
+        timestamp_iso=datetime.now(timezone.utc).isoformat(),
+        trace_id=str(uuid4()),
+        decision_id=str(uuid4()),
+        action_type=action.type,
+        policy_decision=policy_decision,
+        route_selected=route,
+        cost_vector=cost,
+        reason=reason,
+        inputs_redacted=redact_inputs(CONTEXT, action),
+    )
+    return chain.append(event).hash
+
+
+@dataclass(frozen=True)
+class Case:
+    """One benchmark: ``make(tmp_dir, stack)`` returns the operation to time.
+
+    Resources opened by ``make`` are registered on ``stack`` for cleanup.
+    """
+
+    stage: str
+    params: dict[str, object]
+    make: Callable[[Path, ExitStack], Callable[[], object]]
+    inner: int = 100
+
+    @property
+    def name(self) -> str:
+        if not self.params:
+            return self.stage
+        args = ",".join(f"{key}={value}" for key, value in self.params.items())
+        return f"{self.stage}[{args}]"
+
+
+def _gate(context: Context) -> Callable[[Path, ExitStack], Callable[[], object]]:
+    action = _action(0)
+    return lambda tmp, stack: lambda: PolicyGate.evaluate(context, action)
+
+
+def _router(count: int) -> Callable[[Path, ExitStack], Callable[[], object]]:
+    candidates = dict(list(ALL_CANDIDATES.items())[:count])
+    return lambda tmp, stack: lambda: Router.select_route(CONTEXT, candidates)
+
+
+def _canonical(size: int) -> Callable[[Path, ExitStack], Callable[[], object]]:
+    event = _event(size)
+    return lambda tmp, stack: lambda: canonical_event_json(event, include_hash_fields=True)
+
+
+def _hash(size: int) -> Callable[[Path, ExitStack], Callable[[], object]]:
+    event = _event(size)
+    return lambda tmp, stack: lambda: hash_event(event, "0" * 64)
+
+
+def _append_jsonl(events: int) -> Callable[[Path, ExitStack], Callable[[], object]]:
+    event = _event()
+
+    def make(tmp: Path, stack: ExitStack) -> Callable[[], object]:
+        path = _prefilled_log(tmp, events)
+        return lambda: append_jsonl(path, event)
+
+    return make
+
+
+def _chain_open(events: int) -> Callable[[Path, ExitStack], Callable[[], object]]:
+    def make(tmp: Path, stack: ExitStack) -> Callable[[], object]:
+        path = _prefilled_log(tmp, events)
+        return lambda: AuditChain(path).close()
+
+    return make
+
+
+def _pipeline(reopen: bool, size: int) -> Callable[[Path, ExitStack], Callable[[], object]]:
+    action = _action(size)
+
+    def make(tmp: Path, stack: ExitStack) -> Callable[[], object]:
+        path = tmp / f"pipeline-{uuid4().hex}.jsonl"
+        if reopen:
+
+            def run() -> str:
+                with AuditChain(path) as chain:
+                    return _decide_and_append(chain, action)
+
+            return run
+        chain = stack.enter_context(AuditChain(path))
+        return lambda: _decide_and_append(chain, action)
+
+    return make
+
+
+def build_cases(quick: bool) -> list[Case]:
+    metadata_sizes = (0, 1024) if quick else (0, 1024, 16_384)
+    log_sizes = (1_000, 10_000) if quick else (1_000, 100_000, 1_000_000)
+    cases = [
+        Case("gate.evaluate", {"scenario": "supervised_high_risk"}, _gate(CONTEXT), 1000),
+        Case("gate.evaluate", {"scenario": "network_off"}, _gate(OFFLINE), 1000),
+    ]
+    cases += [
+        Case("router.select_route", {"candidates": count}, _router(count), 1000)
+        for count in (1, 2, 4)
+    ]
+    for size in metadata_sizes:
+        cases.append(Case("audit.canonical_event_json", {"metadata_bytes": size}, _canonical(size)))
+        cases.append(Case("audit.hash_event", {"metadata_bytes": size}, _hash(size)))
+    cases += [
+        Case("audit.append_jsonl", {"log_events": events}, _append_jsonl(events), 20)
+        for events in (0, log_sizes[-1])
+    ]
+    cases += [
+        Case("audit.chain_open", {"log_events": events}, _chain_open(events), 20)
+        for events in log_sizes
+    ]
+    cases.append(
+        Case("pipeline.run_scenario", {"chain": "reopen"}, _pipeline(True, 0), 20)
+    )
+    cases += [
+        Case(
+            "pipeline.run_scenario",
+            {"chain": "open", "metadata_bytes": size},
+            _pipeline(False, size),
+            20,
+        )
+        for size in metadata_sizes
+    ]
+    return cases
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_case(case: Case, directory: Path, samples: int) -> dict[str, object]:
+    with ExitStack() as stack:
+        operation = case.make(directory, stack)
+        for _ in range(case.inner):
+            operation()
+        per_call = []
+        for _ in range(samples):
+            start = time.perf_counter_ns()
+            for _ in range(case.inner):
+                operation()
+            per_call.append((time.perf_counter_ns() - start) / case.inner)
+    ordered = sorted(per_call)
+    mean = statistics.fmean(ordered)
+    return {
+        "name": case.name,
+        "stage": case.stage,
+        "params": case.params,
+        "unit": "ns",
+        "samples": samples,
+        "inner": case.inner,
+        "mean": mean,
+        "min": ordered[0],
+        "p50": _percentile(ordered, 0.50),
+        "p90": _percentile(ordered, 0.90),
+        "p99": _percentile(ordered, 0.99),
+        "ops_per_s": 1e9 / mean if mean else 0.0,
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for case in build_cases(args.quick):
+            if args.filter and args.filter not in case.name:
+                continue
+            result = run_case(case, Path(tmp), args.samples)
+            results.append(result)
+            print(f"{result['name']:<62} p50 {result['p50']:>12.0f} ns  "
+                  f"p99 {result['p99']:>12.0f} ns  {result['ops_per_s']:>12.0f} ops/s")
+    payload = {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    return 0
+
+
+def _load_results(path: Path) -> dict[str, dict[str, object]]:
+    payload = json.loads(Path(path).read_text())
+    if payload.get("schema") != SCHEMA_VERSION:
+        raise SystemExit(f"{path}: unsupported result schema {payload.get('schema')!r}")
+    return {item["name"]: item for item in payload["results"]}
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = _load_results(args.baseline)
+    current = _load_results(args.current)
+    regressions = 0
+    print(f"{'case':<62} {'base p50':>12} {'new p50':>12} {'change':>8}")
+    for name, item in current.items():
+        if name not in baseline:
+            print(f"{name:<62} {'-':>12} {item['p50']:>12.0f} {'new':>8}")
+            continue
+        before = baseline[name]["p50"]
+        change = item["p50"] / before - 1 if before else 0.0
+        flag = ""
+        if change > args.threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{name:<62} {before:>12.0f} {item['p50']:>12.0f} {change:>+8.1%}{flag}")
+    for name in sorted(baseline.keys() - current.keys()):
+        print(f"{name:<62} missing from current results")
+    print(f"{regressions} regression(s) above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", type=Path, default=None)
+    run_parser.add_argument("--samples", type=int, default=50)
+    run_parser.add_argument("--quick", action="store_true", help="smaller workloads")
+    run_parser.add_argument("--filter", default=None, help="only cases containing this text")
+    run_parser.set_defaults(handler=run)
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+    compare_parser.set_defaults(handler=compare)
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
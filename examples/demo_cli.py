@@ -3,14 +3,12 @@
 from __future__ import annotations
 
 import argparse
-import json
-from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import uuid4
 
 from decision_policy_engine.audit.events import AuditEvent
-from decision_policy_engine.audit.trace import append_jsonl, hash_event, redact_inputs
+from decision_policy_engine.audit.trace import AuditChain, redact_inputs
 from decision_policy_engine.decision.router import Router
 from decision_policy_engine.models import (
     Context,
@@ -95,17 +93,6 @@ def build_candidates(context: Context) -> dict[ExecutionRoute, CostVector]:
     }
 
 
-def _read_last_hash(path: Path) -> str | None:
-    if not path.exists():
-        return None
-    lines = path.read_text(encoding="utf-8").strip().splitlines()
-    if not lines:
-        return None
-    payload = json.loads(lines[-1])
-    value = payload.get("hash")
-    return str(value) if value else None
-
-
 def run_scenario(name: str) -> None:
     """Run a demo scenario and append an audit log."""
 
@@ -122,7 +109,6 @@ def run_scenario(name: str) -> None:
     timestamp_iso = datetime.now(timezone.utc).isoformat()
 
     output_path = Path("out") / "audit_log.jsonl"
-    prev_hash = _read_last_hash(output_path)
 
     event = AuditEvent(
         timestamp_iso=timestamp_iso,
@@ -134,12 +120,9 @@ def run_scenario(name: str) -> None:
         cost_vector=chosen_cost,
         reason=reason,
         inputs_redacted=redact_inputs(context, action),
-        prev_hash=prev_hash,
     )
-    event_hash = hash_event(event, prev_hash=prev_hash)
-    event = replace(event, hash=event_hash)
-
-    append_jsonl(output_path, event)
+    with AuditChain(output_path) as chain:
+        event_hash = chain.append(event).hash
 
     print(f"Scenario: {name}")
     print(f"Policy decision: {policy_decision} ({reason})")
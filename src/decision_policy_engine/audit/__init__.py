@@ -1,17 +1,31 @@
 """Audit utilities."""
 
 from .events import AuditEvent
+from .index import AuditIndex
+from .redaction import Redactor
+from .rotation import RotatingAuditChain
 from .trace import (
+    AuditChain,
     append_jsonl,
     canonical_event_json,
+    event_from_record,
     hash_event,
+    parse_event,
     redact_inputs,
 )
+from .writer import AuditWriter
 
 __all__ = [
+    "AuditChain",
     "AuditEvent",
+    "AuditIndex",
+    "AuditWriter",
+    "Redactor",
+    "RotatingAuditChain",
     "append_jsonl",
     "canonical_event_json",
+    "event_from_record",
     "hash_event",
+    "parse_event",
     "redact_inputs",
 ]
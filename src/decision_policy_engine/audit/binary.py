@@ -0,0 +1,352 @@
+"""Compact binary audit log format with a memory-mapped reader.
+
+Layout: an 8-byte header (``MAGIC``) followed by records, each a little-endian
+``uint32`` length, a one-byte kind and the payload. ``KIND_STRING`` records
+define the next interned string id; ``KIND_EVENT`` records hold one audit record
+as a tagged value tree whose object keys and enum-like values are interned.
+Records keep their JSONL key order, so converting back yields the exact
+canonical line and the stored hashes stay verifiable.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from types import TracebackType
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import canonical_event_json
+
+MAGIC = b"DPEAUD\x00\x01"
+KIND_STRING = 1
+KIND_EVENT = 2
+
+INTERNED_VALUE_KEYS = frozenset(
+    {"action_type", "policy_decision", "route_selected", "reason", "type", "risk_level", "locale"}
+)
+
+_TAG_NULL = 0
+_TAG_FALSE = 1
+_TAG_TRUE = 2
+_TAG_INT = 3
+_TAG_FLOAT = 4
+_TAG_STR = 5
+_TAG_INTERNED = 6
+_TAG_LIST = 7
+_TAG_OBJECT = 8
+_TAG_HASH = 9
+
+_HEADER = struct.Struct("<IB")
+_DOUBLE = struct.Struct("<d")
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _dumps_line(record: Mapping[str, object]) -> str:
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buffer: memoryview, position: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def _is_hash(value: str) -> bool:
+    return len(value) == 64 and _HEX_DIGITS.issuperset(value)
+
+
+class _Encoder:
+    def __init__(self, strings: dict[str, int]) -> None:
+        self.strings = strings
+        self.new_strings: list[str] = []
+
+    def intern(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings[value] = index
+            self.new_strings.append(value)
+        return index
+
+    def encode(self, value: object, out: bytearray, key: str | None = None) -> None:
+        if value is None:
+            out.append(_TAG_NULL)
+        elif value is True:
+            out.append(_TAG_TRUE)
+        elif value is False:
+            out.append(_TAG_FALSE)
+        elif type(value) is int:
+            out.append(_TAG_INT)
+            _write_varint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+        elif type(value) is float:
+            out.append(_TAG_FLOAT)
+            out += _DOUBLE.pack(value)
+        elif type(value) is str:
+            if key in INTERNED_VALUE_KEYS:
+                out.append(_TAG_INTERNED)
+                _write_varint(out, self.intern(value))
+            elif _is_hash(value):
+                out.append(_TAG_HASH)
+                out += bytes.fromhex(value)
+            else:
+                data = value.encode("utf-8")
+                out.append(_TAG_STR)
+                _write_varint(out, len(data))
+                out += data
+        elif type(value) is list:
+            out.append(_TAG_LIST)
+            _write_varint(out, len(value))
+            for item in value:
+                self.encode(item, out)
+        elif type(value) is dict:
+            out.append(_TAG_OBJECT)
+            _write_varint(out, len(value))
+            for item_key, item in value.items():
+                _write_varint(out, self.intern(item_key))
+                self.encode(item, out, item_key)
+        else:
+            raise TypeError(f"Unsupported JSON value: {type(value).__name__}")
+
+
+def _decode(buffer: memoryview, position: int, strings: list[str]) -> tuple[object, int]:
+    tag = buffer[position]
+    position += 1
+    if tag == _TAG_NULL:
+        return None, position
+    if tag == _TAG_TRUE:
+        return True, position
+    if tag == _TAG_FALSE:
+        return False, position
+    if tag == _TAG_INT:
+        zigzag, position = _read_varint(buffer, position)
+        return (zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)), position
+    if tag == _TAG_FLOAT:
+        return _DOUBLE.unpack_from(buffer, position)[0], position + 8
+    if tag == _TAG_INTERNED:
+        index, position = _read_varint(buffer, position)
+        return strings[index], position
+    if tag == _TAG_HASH:
+        return buffer[position : position + 32].hex(), position + 32
+    if tag == _TAG_STR:
+        size, position = _read_varint(buffer, position)
+        return str(buffer[position : position + size], "utf-8"), position + size
+    if tag == _TAG_LIST:
+        count, position = _read_varint(buffer, position)
+        items = []
+        for _ in range(count):
+            item, position = _decode(buffer, position, strings)
+            items.append(item)
+        return items, position
+    if tag == _TAG_OBJECT:
+        count, position = _read_varint(buffer, position)
+        result = {}
+        for _ in range(count):
+            index, position = _read_varint(buffer, position)
+            result[strings[index]], position = _decode(buffer, position, strings)
+        return result, position
+    raise ValueError(f"Unknown value tag {tag} at offset {position - 1}")
+
+
+class BinaryAuditWriter:
+    """Append audit records to a binary audit file.
+
+    Reopening an existing file reloads its string table so new records keep
+    referencing the same interned ids.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        strings: dict[str, int] = {}
+        if self.path.exists() and self.path.stat().st_size > 0:
+            with BinaryAuditReader(self.path) as reader:
+                strings = {value: index for index, value in enumerate(reader.strings)}
+                end = reader.end_offset
+            self._handle = open(self.path, "r+b")  # noqa: SIM115
+            self._handle.truncate(end)
+            self._handle.seek(end)
+        else:
+            self._handle = open(self.path, "wb")  # noqa: SIM115
+            self._handle.write(MAGIC)
+        self._encoder = _Encoder(strings)
+
+    def write_record(self, record: Mapping[str, object]) -> None:
+        """Append one parsed JSONL record (key order is preserved)."""
+
+        payload = bytearray()
+        self._encoder.encode(dict(record), payload)
+        out = bytearray()
+        for value in self._encoder.new_strings:
+            data = value.encode("utf-8")
+            out += _HEADER.pack(len(data) + 1, KIND_STRING)
+            out += data
+        self._encoder.new_strings.clear()
+        out += _HEADER.pack(len(payload) + 1, KIND_EVENT)
+        out += payload
+        self._handle.write(out)
+
+    def write_event(self, event: AuditEvent) -> None:
+        """Append an audit event in its canonical (hash-carrying) form."""
+
+        self.write_record(json.loads(canonical_event_json(event, include_hash_fields=True)))
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+            self._handle.close()
+
+    def __enter__(self) -> BinaryAuditWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class BinaryAuditReader:
+    """Memory-mapped reader over a binary audit file.
+
+    Opening the file scans record headers once to build the offset index and
+    string table; after that any record can be read by index. ``view`` returns
+    zero-copy ``memoryview`` slices of the mapping, which must be released
+    before ``close``. A partial trailing record is ignored.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._handle = open(self.path, "rb")  # noqa: SIM115
+        size = os.fstat(self._handle.fileno()).st_size
+        if size < len(MAGIC):
+            self._handle.close()
+            raise ValueError(f"{self.path} is not a binary audit file")
+        self._mmap = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        if self._buffer[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a binary audit file")
+
+        self.strings: list[str] = []
+        self._starts = array("Q")
+        self._ends = array("Q")
+        position = len(MAGIC)
+        while position + _HEADER.size <= size:
+            length, kind = _HEADER.unpack_from(self._buffer, position)
+            end = position + 4 + length
+            if end > size:
+                break
+            start = position + _HEADER.size
+            if kind == KIND_STRING:
+                self.strings.append(str(self._buffer[start:end], "utf-8"))
+            elif kind == KIND_EVENT:
+                self._starts.append(start)
+                self._ends.append(end)
+            position = end
+        self.end_offset = position
+        self.truncated = position != size
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def view(self, index: int) -> memoryview:
+        """Zero-copy view of the encoded payload of record ``index``."""
+
+        return self._buffer[self._starts[index] : self._ends[index]]
+
+    def record(self, index: int) -> dict[str, object]:
+        """Decode record ``index`` into a JSON-compatible dict."""
+
+        value, _ = _decode(self._buffer, self._starts[index], self.strings)
+        return value
+
+    def line(self, index: int) -> str:
+        """Canonical JSONL line (without newline) for record ``index``."""
+
+        return _dumps_line(self.record(index))
+
+    def __getitem__(self, index: int) -> dict[str, object]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+        return self.record(index)
+
+    def __iter__(self) -> Iterator[dict[str, object]]:
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def iter_lines(self) -> Iterator[bytes]:
+        """Yield JSONL lines (with newline), e.g. for ``verify_lines``."""
+
+        for record in self:
+            yield (_dumps_line(record) + "\n").encode("utf-8")
+
+    def close(self) -> None:
+        if self._handle.closed:
+            return
+        self._buffer.release()
+        self._mmap.close()
+        self._handle.close()
+
+    def __enter__(self) -> BinaryAuditReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def jsonl_to_binary(source: str | Path, destination: str | Path) -> int:
+    """Convert a JSONL audit log; returns the number of records.
+
+    Raises ``ValueError`` if a line is not in canonical form, since it could not
+    be reproduced byte-for-byte.
+    """
+
+    count = 0
+    with open(source, "rb") as handle, BinaryAuditWriter(destination) as writer:
+        for line_number, raw in enumerate(handle, start=1):
+            text = raw.decode("utf-8").rstrip("\n")
+            record = json.loads(text)
+            if _dumps_line(record) != text:
+                raise ValueError(f"Line {line_number} is not canonical JSON")
+            writer.write_record(record)
+            count += 1
+    return count
+
+
+def binary_to_jsonl(source: str | Path, destination: str | Path) -> int:
+    """Convert a binary audit file back to byte-identical JSONL."""
+
+    count = 0
+    with BinaryAuditReader(source) as reader, open(destination, "wb") as handle:
+        for line in reader.iter_lines():
+            handle.write(line)
+            count += 1
+    return count
@@ -0,0 +1,275 @@
+"""Single-pass canonical encoding of audit events."""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import asdict, fields, replace
+from hashlib import sha256
+from json.encoder import encode_basestring
+from time import perf_counter
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.metrics import METRICS
+from decision_policy_engine.models import CostVector
+
+HASH_FIELDS = ("hash", "prev_hash")
+# Omitted from the canonical JSON when ``None``.
+OPTIONAL_FIELDS = ("config_hash",)
+LINE_FIELDS = tuple(sorted(item.name for item in fields(AuditEvent)))
+BODY_FIELDS = tuple(name for name in LINE_FIELDS if name not in HASH_FIELDS)
+COST_FIELDS = tuple(sorted(item.name for item in fields(CostVector)))
+
+_REQUIRED_LINE_FIELDS = tuple(name for name in LINE_FIELDS if name not in OPTIONAL_FIELDS)
+_REQUIRED_BODY_FIELDS = tuple(name for name in BODY_FIELDS if name not in OPTIONAL_FIELDS)
+_KEY_PREFIX = {name: encode_basestring(name) + ":" for name in LINE_FIELDS + COST_FIELDS}
+_STRING_FIELDS = ("action_type", "decision_id", "reason", "timestamp_iso", "trace_id")
+_PLAIN_SCALARS = (int, float, bool, type(None))
+
+
+def normalize_value(value: object) -> object:
+    """Replace enum-like members (anything with ``.value``) by their values, recursively.
+
+    Applied to ``asdict`` output before canonical JSON encoding.
+    """
+
+    if isinstance(value, dict):
+        return {key: normalize_value(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [normalize_value(item) for item in value]
+    if hasattr(value, "value") and not isinstance(value, (str, bytes)):
+        return value.value
+    return value
+
+
+def _dumps(value: object) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def reference_event_json(event: AuditEvent, *, include_hash_fields: bool = False) -> str:
+    """Canonical JSON via ``asdict`` + normalization; the definition of the format."""
+
+    data = asdict(event)
+    if not include_hash_fields:
+        data.pop("hash", None)
+        data.pop("prev_hash", None)
+    for name in OPTIONAL_FIELDS:
+        if data[name] is None:
+            del data[name]
+    return _dumps(normalize_value(data))
+
+
+def _is_plain(value: object) -> bool:
+    """True if ``asdict`` + ``normalize_value`` would leave ``value`` unchanged."""
+
+    value_type = type(value)
+    if value_type is dict:
+        for key, item in value.items():
+            if not isinstance(key, str) or not _is_plain(item):
+                return False
+        return True
+    if value_type is list:
+        return all(_is_plain(item) for item in value)
+    return isinstance(value, str) or value_type in _PLAIN_SCALARS
+
+
+def _scalar(value: object) -> str | None:
+    value_type = type(value)
+    if value_type is float:
+        return float.__repr__(value) if math.isfinite(value) else _dumps(value)
+    if value_type is int:
+        return int.__repr__(value)
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is None:
+        return "null"
+    return None
+
+
+class EncodedEvent:
+    """Per-field canonical JSON fragments of one audit event.
+
+    The fragments are produced once and joined into either the hashed body
+    (no hash fields) or the full JSONL line. Optional fields without a
+    fragment are left out of both.
+    """
+
+    __slots__ = ("_fragments", "_body_fields", "_line_fields")
+
+    def __init__(self, fragments: dict[str, str]) -> None:
+        self._fragments = fragments
+        if len(fragments) == len(_REQUIRED_BODY_FIELDS):
+            self._body_fields = _REQUIRED_BODY_FIELDS
+            self._line_fields = _REQUIRED_LINE_FIELDS
+        else:
+            # Optional fields set, or extra fields of an ``AuditEvent`` subclass.
+            self._body_fields = tuple(sorted(fragments))
+            self._line_fields = tuple(sorted((*fragments, *HASH_FIELDS)))
+            for name in self._body_fields:
+                if name not in _KEY_PREFIX:
+                    _KEY_PREFIX[name] = encode_basestring(name) + ":"
+
+    def body(self) -> str:
+        """Canonical JSON without ``hash``/``prev_hash``."""
+
+        fragments = self._fragments
+        return (
+            "{"
+            + ",".join([_KEY_PREFIX[name] + fragments[name] for name in self._body_fields])
+            + "}"
+        )
+
+    def line(self, prev_hash: str | None, event_hash: str | None) -> str:
+        """Canonical JSON including the given hash fields."""
+
+        fragments = dict(self._fragments)
+        fragments["prev_hash"] = _scalar(prev_hash) or _dumps(normalize_value(prev_hash))
+        fragments["hash"] = _scalar(event_hash) or _dumps(normalize_value(event_hash))
+        return (
+            "{"
+            + ",".join([_KEY_PREFIX[name] + fragments[name] for name in self._line_fields])
+            + "}"
+        )
+
+    def line_template(self) -> tuple[str, str, str]:
+        """Split ``line`` around its hash values: ``head + hash + middle + prev_hash + tail``.
+
+        Lets the body fields be encoded elsewhere (e.g. in a worker process)
+        and the line finished once the chained hashes are known.
+        """
+
+        fragments = self._fragments
+        names = self._line_fields
+        # ``hash`` sorts before ``prev_hash``.
+        hash_position = names.index("hash")
+        prev_position = names.index("prev_hash")
+        pieces = [_KEY_PREFIX[name] + fragments[name] for name in names[:hash_position]]
+        pieces.append(_KEY_PREFIX["hash"])
+        head = "{" + ",".join(pieces)
+        pieces = [
+            _KEY_PREFIX[name] + fragments[name]
+            for name in names[hash_position + 1 : prev_position]
+        ]
+        pieces.append(_KEY_PREFIX["prev_hash"])
+        middle = "," + ",".join(pieces)
+        pieces = [_KEY_PREFIX[name] + fragments[name] for name in names[prev_position + 1 :]]
+        tail = "".join("," + piece for piece in pieces) + "}"
+        return head, middle, tail
+
+
+def encode_event(event: AuditEvent) -> EncodedEvent:
+    """Encode the body fields of ``event`` once."""
+
+    fragments = _fast_fragments(event)
+    if fragments is None:
+        # Every field ``asdict`` sees, so subclass fields are encoded as the reference does.
+        data = normalize_value(asdict(event))
+        fragments = {
+            name: _dumps(value)
+            for name, value in data.items()
+            if name not in HASH_FIELDS and (value is not None or name not in OPTIONAL_FIELDS)
+        }
+    return EncodedEvent(fragments)
+
+
+def _fast_fragments(event: AuditEvent) -> dict[str, str] | None:
+    if type(event) is not AuditEvent or type(event.cost_vector) is not CostVector:
+        return None
+    fragments: dict[str, str] = {}
+    for name in _STRING_FIELDS:
+        value = getattr(event, name)
+        if not isinstance(value, str):
+            return None
+        fragments[name] = encode_basestring(value)
+    for name in ("policy_decision", "route_selected"):
+        fragment = _scalar(getattr(event, name))
+        if fragment is None:
+            return None
+        fragments[name] = fragment
+
+    cost = event.cost_vector
+    parts = []
+    for name in COST_FIELDS:
+        fragment = _scalar(getattr(cost, name))
+        if fragment is None:
+            return None
+        parts.append(_KEY_PREFIX[name] + fragment)
+    fragments["cost_vector"] = "{" + ",".join(parts) + "}"
+
+    config_hash = event.config_hash
+    if config_hash is not None:
+        if not isinstance(config_hash, str):
+            return None
+        fragments["config_hash"] = encode_basestring(config_hash)
+
+    inputs = event.inputs_redacted
+    if not _is_plain(inputs):
+        return None
+    fragments["inputs_redacted"] = _dumps(inputs)
+    return fragments
+
+
+def event_hash(encoded: EncodedEvent, prev_hash: str | None) -> str:
+    """Chained hash of an encoded event, as computed by ``hash_event``."""
+
+    if METRICS.enabled:
+        return _event_hash_timed(encoded, prev_hash)
+    return _event_hash(encoded, prev_hash)
+
+
+def _event_hash_timed(encoded: EncodedEvent, prev_hash: str | None) -> str:
+    with METRICS.timer("dpe_serialization_seconds"):
+        payload = ((prev_hash or "") + encoded.body()).encode("utf-8")
+    with METRICS.timer("dpe_hash_seconds"):
+        return sha256(payload).hexdigest()
+
+
+def _event_hash(encoded: EncodedEvent, prev_hash: str | None) -> str:
+    payload = (prev_hash or "") + encoded.body()
+    return sha256(payload.encode("utf-8")).hexdigest()
+
+
+def seal_event(event: AuditEvent, prev_hash: str | None) -> tuple[AuditEvent, str]:
+    """Chain ``event`` onto ``prev_hash`` and return it with its JSONL line.
+
+    The body is serialized once and reused for both the hash and the line.
+    """
+
+    if METRICS.enabled:
+        return _seal_event_timed(event, prev_hash)
+    encoded = encode_event(event)
+    digest = _event_hash(encoded, prev_hash)
+    return replace(event, prev_hash=prev_hash, hash=digest), encoded.line(prev_hash, digest)
+
+
+def _seal_event_timed(event: AuditEvent, prev_hash: str | None) -> tuple[AuditEvent, str]:
+    # One serialization observation per event: the encode, hash-payload and
+    # line steps are summed rather than recorded separately.
+    started = perf_counter()
+    encoded = encode_event(event)
+    payload = ((prev_hash or "") + encoded.body()).encode("utf-8")
+    hashing = perf_counter()
+    digest = sha256(payload).hexdigest()
+    hashed = perf_counter()
+    line = encoded.line(prev_hash, digest)
+    METRICS.observe("dpe_serialization_seconds", hashing - started + perf_counter() - hashed)
+    METRICS.observe("dpe_hash_seconds", hashed - hashing)
+    return replace(event, prev_hash=prev_hash, hash=digest), line
+
+
+def canonical_json(event: AuditEvent, *, include_hash_fields: bool = False) -> str:
+    """Fast equivalent of ``reference_event_json``."""
+
+    if METRICS.enabled:
+        return METRICS.timed(
+            "dpe_serialization_seconds", (), _canonical_json, event, include_hash_fields
+        )
+    return _canonical_json(event, include_hash_fields)
+
+
+def _canonical_json(event: AuditEvent, include_hash_fields: bool) -> str:
+    encoded = encode_event(event)
+    if include_hash_fields:
+        return encoded.line(event.prev_hash, event.hash)
+    return encoded.body()
+
@@ -8,9 +8,14 @@ from dataclasses import dataclass
 from decision_policy_engine.models import CostVector, ExecutionRoute, PolicyDecision
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditEvent:
-    """Immutable audit record for decisions and routing."""
+    """Immutable audit record for decisions and routing.
+
+    ``config_hash`` identifies the ``RouterConfig`` that routed the decision;
+    it is left out of the canonical JSON when ``None``, so events without it
+    hash exactly as before the field existed.
+    """
 
     timestamp_iso: str
     trace_id: str
@@ -23,3 +28,4 @@ class AuditEvent:
     inputs_redacted: Mapping[str, object]
     prev_hash: str | None = None
     hash: str | None = None
+    config_hash: str | None = None
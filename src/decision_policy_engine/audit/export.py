@@ -0,0 +1,356 @@
+"""Streaming columnar export of JSONL audit logs.
+
+Events are flattened into typed columns and written in row groups of at most
+``row_group_size`` rows, so memory use does not grow with the log. Parquet is
+written when ``pyarrow`` is installed; otherwise the output is a ``.npz``
+archive of hand-written ``.npy`` members that ``numpy.load`` can open:
+
+* ``rgNNNNN/<column>`` holds one row group of a column,
+* ``rgNNNNN/<column>.mask`` (only when needed) marks null rows,
+* ``<column>.categories`` holds the dictionary of a category column, whose
+  row-group arrays are ``int32`` codes with ``-1`` for null,
+* string, json and dictionary arrays are variable-length: a ``uint8`` buffer
+  of concatenated UTF-8 plus a ``<name>.offsets`` ``int64`` array of
+  ``rows + 1`` Arrow-style offsets, so one long value does not pad the rest,
+* ``schema.json`` lists the columns, their kinds and the row-group count.
+
+Float columns use NaN for missing values.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import struct
+import sys
+import zipfile
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+try:  # Optional Parquet output.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pa = None
+    pq = None
+
+try:  # Optional, only needed to load the npz fallback.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+EXPORT_FORMATS = ("parquet", "npz")
+COLUMN_KINDS = ("string", "category", "float64", "bool", "json")
+
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ("timestamp_iso", "string"),
+    ("trace_id", "string"),
+    ("decision_id", "string"),
+    ("action_type", "category"),
+    ("policy_decision", "category"),
+    ("route_selected", "category"),
+    ("reason", "category"),
+    ("cost_vector.latency_ms", "float64"),
+    ("cost_vector.privacy_risk", "float64"),
+    ("cost_vector.reliability_risk", "float64"),
+    ("cost_vector.dollar_cost", "float64"),
+    ("inputs_redacted.action.risk_level", "category"),
+    ("inputs_redacted.action.metadata", "json"),
+    ("inputs_redacted.context.network_available", "bool"),
+    ("inputs_redacted.context.rtt_ms", "float64"),
+    ("inputs_redacted.context.battery_level", "float64"),
+    ("inputs_redacted.context.user_present", "bool"),
+    ("inputs_redacted.context.supervised_mode", "bool"),
+    ("inputs_redacted.context.locale", "category"),
+    ("config_hash", "category"),
+    ("prev_hash", "string"),
+    ("hash", "string"),
+)
+
+_PATHS = tuple(tuple(name.split(".")) for name, _ in COLUMNS)
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    """Summary of a columnar export."""
+
+    path: Path
+    format: str
+    rows: int
+    row_groups: int
+
+
+def _lookup(record: dict, path: tuple[str, ...]) -> object:
+    value: object = record
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def flatten_record(record: dict) -> list[object]:
+    """Column values of one parsed audit record, in ``COLUMNS`` order."""
+
+    row = []
+    for path, (_, kind) in zip(_PATHS, COLUMNS, strict=True):
+        value = _lookup(record, path)
+        if kind == "json" and value is not None:
+            value = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        row.append(value)
+    return row
+
+
+def _row_groups(log_path: Path, row_group_size: int) -> Iterator[list[list[object]]]:
+    columns: list[list[object]] = [[] for _ in COLUMNS]
+    rows = 0
+    with open(log_path, "rb") as handle:
+        for raw in handle:
+            if not raw.strip():
+                continue
+            for column, value in zip(columns, flatten_record(json.loads(raw)), strict=True):
+                column.append(value)
+            rows += 1
+            if rows == row_group_size:
+                yield columns
+                columns = [[] for _ in COLUMNS]
+                rows = 0
+    if rows:
+        yield columns
+
+
+def _npy_bytes(descr: str, count: int, data: bytes) -> bytes:
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({count},), }}"
+    padding = 64 - (len(_NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header = header + " " * (padding % 64) + "\n"
+    return _NPY_MAGIC + struct.pack("<H", len(header)) + header.encode("latin1") + data
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+        values.byteswap()
+    return values.tobytes()
+
+
+def _utf8_npy(values: Sequence[str]) -> tuple[bytes, bytes]:
+    """``(buffer, offsets)`` members holding ``values`` as variable-length UTF-8."""
+
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = array("q", [0])
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+    data = b"".join(encoded)
+    return (
+        _npy_bytes("|u1", len(data), data),
+        _npy_bytes("<i8", len(offsets), _little_endian(offsets)),
+    )
+
+
+class _NpzWriter:
+    def __init__(self, path: Path, compress: bool) -> None:
+        compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        self._zip = zipfile.ZipFile(path, "w", compression=compression, allowZip64=True)
+        self._dictionaries: list[dict[str, int]] = [{} for _ in COLUMNS]
+        self.row_groups = 0
+
+    def _member(self, name: str, payload: bytes) -> None:
+        with self._zip.open(name + ".npy", "w", force_zip64=True) as member:
+            member.write(payload)
+
+    def _strings(self, name: str, values: Sequence[str]) -> None:
+        data, offsets = _utf8_npy(values)
+        self._member(name, data)
+        self._member(name + ".offsets", offsets)
+
+    def write(self, columns: list[list[object]]) -> None:
+        prefix = f"rg{self.row_groups:05d}/"
+        for (name, kind), values, dictionary in zip(
+            COLUMNS, columns, self._dictionaries, strict=True
+        ):
+            count = len(values)
+            mask = None
+            if kind in ("string", "json"):
+                mask = [value is None for value in values]
+                strings = ["" if value is None else str(value) for value in values]
+                self._strings(prefix + name, strings)
+            elif kind == "float64":
+                data = array("d", [math.nan if value is None else float(value) for value in values])
+                payload = _npy_bytes("<f8", count, _little_endian(data))
+            elif kind == "category":
+                codes = array("i")
+                if codes.itemsize != 4:  # pragma: no cover - exotic platforms
+                    codes = array("l")
+                for value in values:
+                    if value is None:
+                        codes.append(-1)
+                    else:
+                        codes.append(dictionary.setdefault(str(value), len(dictionary)))
+                payload = _npy_bytes("<i4", count, _little_endian(codes))
+            elif kind == "bool":
+                mask = [value is None for value in values]
+                payload = _npy_bytes("|b1", count, bytes(bool(value) for value in values))
+            if kind not in ("string", "json"):
+                self._member(prefix + name, payload)
+            if mask is not None and any(mask):
+                self._member(prefix + name + ".mask", _npy_bytes("|b1", count, bytes(mask)))
+        self.row_groups += 1
+
+    def close(self, rows: int) -> None:
+        for (name, kind), dictionary in zip(COLUMNS, self._dictionaries, strict=True):
+            if kind == "category":
+                self._strings(name + ".categories", list(dictionary))
+        schema = {"columns": [list(column) for column in COLUMNS], "row_groups": self.row_groups,
+                  "rows": rows}
+        self._zip.writestr("schema.json", json.dumps(schema, sort_keys=True))
+        self._zip.close()
+
+
+def _arrow_type(kind: str) -> object:
+    return {
+        "string": pa.string(),
+        "json": pa.string(),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+    }[kind]
+
+
+def _arrow_table(columns: list[list[object]], schema: object) -> object:
+    arrays = []
+    for (_, kind), values in zip(COLUMNS, columns, strict=True):
+        if kind == "category":
+            arrays.append(
+                pa.array(values, type=pa.string()).dictionary_encode().cast(_arrow_type(kind))
+            )
+        elif kind == "float64":
+            arrays.append(pa.array([None if v is None else float(v) for v in values], pa.float64()))
+        else:
+            arrays.append(pa.array(values, type=_arrow_type(kind)))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def export_columnar(
+    log_path: str | Path,
+    output_path: str | Path,
+    *,
+    format: str | None = None,
+    row_group_size: int = 65_536,
+    compress: bool = False,
+) -> ExportResult:
+    """Export a JSONL audit log to Parquet or ``.npz`` in bounded row groups.
+
+    ``format`` defaults to ``"parquet"`` when pyarrow is installed and
+    ``"npz"`` otherwise. ``compress`` deflates the npz members (Parquet always
+    uses its default codec).
+    """
+
+    if format is None:
+        format = "parquet" if pq is not None else "npz"
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {list(EXPORT_FORMATS)}")
+    if format == "parquet" and pq is None:
+        raise ValueError("Parquet export requires pyarrow")
+    if row_group_size <= 0:
+        raise ValueError("row_group_size must be positive")
+
+    log_path = Path(log_path)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    rows = 0
+    row_groups = 0
+    if format == "parquet":
+        schema = pa.schema([(name, _arrow_type(kind)) for name, kind in COLUMNS])
+        with pq.ParquetWriter(output_path, schema) as writer:
+            for columns in _row_groups(log_path, row_group_size):
+                writer.write_table(_arrow_table(columns, schema), row_group_size=row_group_size)
+                rows += len(columns[0])
+                row_groups += 1
+    else:
+        writer = _NpzWriter(output_path, compress)
+        try:
+            for columns in _row_groups(log_path, row_group_size):
+                writer.write(columns)
+                rows += len(columns[0])
+        finally:
+            writer.close(rows)
+        row_groups = writer.row_groups
+    return ExportResult(output_path, format, rows, row_groups)
+
+
+def _load_strings(archive: object, key: str) -> object:
+    data = archive[key].tobytes()
+    bounds = archive[key + ".offsets"].tolist()
+    decoded = np.empty(len(bounds) - 1, dtype=object)
+    decoded[:] = [
+        data[low:high].decode("utf-8") for low, high in zip(bounds[:-1], bounds[1:], strict=True)
+    ]
+    return decoded
+
+
+def load_npz(path: str | Path, columns: Iterable[str] | None = None) -> dict[str, object]:
+    """Load an npz export into one NumPy array per column (requires numpy).
+
+    String, json and category columns are decoded to object arrays; nullable
+    string and bool columns have ``None`` where the mask is set.
+    """
+
+    if np is None:
+        raise ImportError("load_npz requires numpy")
+    with np.load(path) as archive:
+        schema = json.loads(archive["schema.json"])
+        kinds = dict(schema["columns"])
+        wanted = list(kinds) if columns is None else list(columns)
+        result: dict[str, object] = {}
+        for name in wanted:
+            kind = kinds[name]
+            parts = []
+            if kind == "category":
+                categories = _load_strings(archive, name + ".categories")
+            for group in range(schema["row_groups"]):
+                key = f"rg{group:05d}/{name}"
+                values = _load_strings(archive, key) if kind in ("string", "json") else archive[key]
+                if kind == "category":
+                    decoded = np.empty(len(values), dtype=object)
+                    present = values >= 0
+                    decoded[present] = categories[values[present]]
+                    values = decoded
+                elif key + ".mask" in archive.files:
+                    values = values.astype(object, copy=False)
+                    values[archive[key + ".mask"]] = None
+                parts.append(values)
+            if parts:
+                result[name] = np.concatenate(parts)
+            else:
+                result[name] = np.empty(0, dtype=np.float64 if kind == "float64" else object)
+        return result
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Export an audit log from the command line."""
+
+    parser = argparse.ArgumentParser(description="Export a JSONL audit log to columnar form.")
+    parser.add_argument("log", type=Path)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default=None)
+    parser.add_argument("--row-group-size", type=int, default=65_536)
+    parser.add_argument("--compress", action="store_true", help="deflate npz members")
+    args = parser.parse_args(argv)
+
+    result = export_columnar(
+        args.log,
+        args.output,
+        format=args.format,
+        row_group_size=args.row_group_size,
+        compress=args.compress,
+    )
+    print(f"Wrote {result.rows} rows in {result.row_groups} row groups to {result.path} "
+          f"({result.format})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""Sidecar index for JSONL audit logs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import parse_event
+
+_BATCH_ROWS = 10_000
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS events (
+    offset INTEGER PRIMARY KEY,
+    length INTEGER NOT NULL,
+    trace_id TEXT,
+    decision_id TEXT,
+    ts REAL,
+    bucket INTEGER,
+    route TEXT,
+    policy TEXT
+);
+CREATE INDEX IF NOT EXISTS events_trace ON events (trace_id);
+CREATE INDEX IF NOT EXISTS events_decision ON events (decision_id);
+CREATE INDEX IF NOT EXISTS events_bucket ON events (bucket, ts);
+CREATE INDEX IF NOT EXISTS events_route ON events (route);
+CREATE INDEX IF NOT EXISTS events_policy ON events (policy);
+"""
+
+
+def _epoch(value: str | datetime) -> float:
+    moment = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _fingerprint(line: bytes) -> int:
+    return int.from_bytes(hashlib.sha256(line).digest()[:8], "big", signed=True)
+
+
+class AuditIndex:
+    """SQLite sidecar mapping audit fields to byte offsets in a JSONL log.
+
+    The index records how many bytes of the log it has covered and catches up
+    from there on ``update`` (called automatically before queries), so events
+    appended by ``append_jsonl``, ``AuditWriter`` or ``AuditChain`` are picked
+    up incrementally. The last indexed line is fingerprinted, so a log that
+    shrank or was rewritten in place is re-indexed from scratch. Complete lines
+    that do not parse as audit records are skipped and counted in
+    ``skipped_lines``.
+    Timestamps are grouped into ``bucket_s``-second buckets for range queries.
+    """
+
+    def __init__(
+        self,
+        log_path: str | Path,
+        index_path: str | Path | None = None,
+        *,
+        bucket_s: int = 3600,
+    ) -> None:
+        self.log_path = Path(log_path)
+        self.index_path = (
+            Path(index_path)
+            if index_path is not None
+            else self.log_path.with_name(self.log_path.name + ".idx.sqlite")
+        )
+        self._connection = sqlite3.connect(self.index_path)
+        self._connection.executescript(_SCHEMA)
+        stored_bucket = self._meta("bucket_s")
+        if stored_bucket is not None and stored_bucket != bucket_s:
+            self._reset()
+        self._set_meta("bucket_s", bucket_s)
+        self._connection.commit()
+        self.bucket_s = bucket_s
+
+    def _meta(self, key: str) -> int | None:
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else int(row[0])
+
+    def _set_meta(self, key: str, value: int) -> None:
+        self._connection.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def _reset(self) -> None:
+        self._connection.execute("DELETE FROM events")
+        self._connection.execute("DELETE FROM meta WHERE key IN ('tail_offset', 'tail_hash')")
+        self._set_meta("indexed_bytes", 0)
+        self._set_meta("skipped_lines", 0)
+
+    @property
+    def indexed_bytes(self) -> int:
+        return self._meta("indexed_bytes") or 0
+
+    @property
+    def skipped_lines(self) -> int:
+        """Complete lines that could not be parsed and were left out of the index."""
+
+        return self._meta("skipped_lines") or 0
+
+    def _prefix_intact(self, handle: BinaryIO, start: int) -> bool:
+        tail_offset = self._meta("tail_offset")
+        if tail_offset is None:
+            return True
+        handle.seek(tail_offset)
+        return _fingerprint(handle.read(start - tail_offset)) == self._meta("tail_hash")
+
+    def _row(self, offset: int, raw: bytes) -> tuple | None:
+        try:
+            record = json.loads(raw)
+            timestamp = record.get("timestamp_iso")
+            epoch = _epoch(timestamp) if timestamp else None
+        except (ValueError, TypeError, AttributeError):
+            return None
+        return (
+            offset,
+            len(raw),
+            record.get("trace_id"),
+            record.get("decision_id"),
+            epoch,
+            None if epoch is None else int(epoch // self.bucket_s),
+            record.get("route_selected"),
+            record.get("policy_decision"),
+        )
+
+    def update(self) -> int:
+        """Index complete lines appended since the last update; returns the count."""
+
+        if not self.log_path.exists():
+            return 0
+        size = self.log_path.stat().st_size
+        start = self.indexed_bytes
+        if size == 0 and start == 0:
+            return 0
+
+        with open(self.log_path, "rb") as handle:
+            if size < start or not self._prefix_intact(handle, start):
+                with self._connection:
+                    self._reset()
+                start = 0
+            if size == start:
+                return 0
+            rows: list[tuple] = []
+            added = skipped = 0
+            offset = tail = start
+            last = b""
+            handle.seek(start)
+            for raw in handle:
+                if not raw.endswith(b"\n"):
+                    break
+                row = self._row(offset, raw)
+                if row is None:
+                    skipped += 1
+                else:
+                    rows.append(row)
+                tail, last = offset, raw
+                offset += len(raw)
+                if len(rows) >= _BATCH_ROWS:
+                    added += self._insert(rows, offset, tail, last, skipped)
+                    skipped = 0
+        if offset == start:
+            return 0
+        return added + self._insert(rows, offset, tail, last, skipped)
+
+    def _insert(
+        self, rows: list[tuple], indexed_bytes: int, tail: int, last: bytes, skipped: int
+    ) -> int:
+        count = len(rows)
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._set_meta("indexed_bytes", indexed_bytes)
+            self._set_meta("tail_offset", tail)
+            self._set_meta("tail_hash", _fingerprint(last))
+            self._set_meta("skipped_lines", self.skipped_lines + skipped)
+        rows.clear()
+        return count
+
+    def offsets(
+        self,
+        *,
+        trace_id: str | None = None,
+        decision_id: str | None = None,
+        route: str | None = None,
+        policy_decision: str | None = None,
+        start: str | datetime | None = None,
+        end: str | datetime | None = None,
+        limit: int | None = None,
+        refresh: bool = True,
+    ) -> list[tuple[int, int]]:
+        """Return ``(offset, length)`` of matching lines in log order.
+
+        ``start`` is inclusive and ``end`` exclusive; naive datetimes are UTC.
+        """
+
+        if refresh:
+            self.update()
+        clauses = []
+        params: list[object] = []
+        for column, value in (
+            ("trace_id", trace_id),
+            ("decision_id", decision_id),
+            ("route", route),
+            ("policy", policy_decision),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(getattr(value, "value", value))
+        if start is not None:
+            low = _epoch(start)
+            clauses.append("bucket >= ? AND ts >= ?")
+            params += [int(low // self.bucket_s), low]
+        if end is not None:
+            high = _epoch(end)
+            clauses.append("bucket <= ? AND ts < ?")
+            params += [int(high // self.bucket_s), high]
+        query = "SELECT offset, length FROM events"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY offset"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self._connection.execute(query, params)
+        return [(int(offset), int(length)) for offset, length in rows]
+
+    def find(self, **filters: object) -> list[AuditEvent]:
+        """Return matching events, reading each one directly at its offset."""
+
+        locations = self.offsets(**filters)
+        events = []
+        with open(self.log_path, "rb") as handle:
+            for offset, length in locations:
+                handle.seek(offset)
+                events.append(parse_event(handle.read(length)))
+        return events
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> AuditIndex:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,300 @@
+"""Merkle checkpoints over hash-chained JSONL audit logs.
+
+Checkpoints are kept in a sidecar (``<log>.merkle.jsonl``) so the log itself,
+and its linear ``prev_hash`` verification, are unchanged. Each checkpoint
+covers a consecutive batch of events and stores the RFC 6962 Merkle tree hash
+of their chain hashes, which lets a single event be proven against the
+checkpoint root with ``O(log batch)`` sibling hashes.
+"""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_right
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+from pathlib import Path
+
+from decision_policy_engine.audit.index import AuditIndex
+from decision_policy_engine.audit.verify import ChainVerifier
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def leaf_hash(event_hash: str) -> bytes:
+    """Merkle leaf for an event's chain hash."""
+
+    return sha256(_LEAF_PREFIX + bytes.fromhex(event_hash)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return sha256(_NODE_PREFIX + left + right).digest()
+
+
+def _split(size: int) -> int:
+    """Largest power of two strictly smaller than ``size``."""
+
+    return 1 << ((size - 1).bit_length() - 1)
+
+
+def _tree_hash(leaves: list[bytes], start: int, end: int) -> bytes:
+    size = end - start
+    if size == 1:
+        return leaves[start]
+    middle = start + _split(size)
+    return node_hash(_tree_hash(leaves, start, middle), _tree_hash(leaves, middle, end))
+
+
+def merkle_root(leaves: list[bytes]) -> bytes:
+    """RFC 6962 Merkle tree hash of a non-empty list of leaf hashes."""
+
+    if not leaves:
+        raise ValueError("merkle_root needs at least one leaf")
+    return _tree_hash(leaves, 0, len(leaves))
+
+
+def inclusion_path(leaves: list[bytes], index: int) -> list[bytes]:
+    """Sibling hashes from leaf ``index`` up to the root (RFC 6962 audit path)."""
+
+    if not 0 <= index < len(leaves):
+        raise ValueError("leaf index out of range")
+    path: list[bytes] = []
+    start, end = 0, len(leaves)
+    while end - start > 1:
+        middle = start + _split(end - start)
+        if index < middle:
+            path.append(_tree_hash(leaves, middle, end))
+            end = middle
+        else:
+            path.append(_tree_hash(leaves, start, middle))
+            start = middle
+    path.reverse()
+    return path
+
+
+def root_from_path(leaf: bytes, index: int, size: int, path: list[bytes]) -> bytes | None:
+    """Recompute the root from an audit path (RFC 9162, 2.1.3.2); ``None`` if malformed."""
+
+    if not 0 <= index < size:
+        return None
+    node, last = index, size - 1
+    result = leaf
+    for sibling in path:
+        if last == 0:
+            return None
+        if node & 1 or node == last:
+            result = node_hash(sibling, result)
+            while not node & 1 and node != 0:
+                node >>= 1
+                last >>= 1
+        else:
+            result = node_hash(result, sibling)
+        node >>= 1
+        last >>= 1
+    return result if last == 0 else None
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Merkle root over events ``first_event .. first_event + events - 1``."""
+
+    index: int
+    first_event: int
+    events: int
+    start_offset: int
+    end_offset: int
+    root: str
+    chain_hash: str
+
+
+@dataclass(frozen=True)
+class InclusionProof:
+    """Proof that an event hash is leaf ``leaf_index`` of a checkpoint tree."""
+
+    decision_id: str
+    event_hash: str
+    checkpoint: int
+    leaf_index: int
+    tree_size: int
+    path: tuple[str, ...]
+    root: str
+
+
+def verify_inclusion(proof: InclusionProof, root: str | None = None) -> bool:
+    """Check ``proof`` against ``root`` (defaults to the root it carries)."""
+
+    try:
+        leaf = leaf_hash(proof.event_hash)
+        path = [bytes.fromhex(item) for item in proof.path]
+    except ValueError:
+        return False
+    computed = root_from_path(leaf, proof.leaf_index, proof.tree_size, path)
+    return computed is not None and computed.hex() == (root or proof.root)
+
+
+def _batch_hashes(log_path: Path, start: int, end: int) -> tuple[list[str], list[str | None]]:
+    hashes: list[str] = []
+    decision_ids: list[str | None] = []
+    with open(log_path, "rb") as handle:
+        handle.seek(start)
+        for raw in handle.read(end - start).splitlines():
+            record = json.loads(raw)
+            hashes.append(record["hash"])
+            decision_ids.append(record.get("decision_id"))
+    return hashes, decision_ids
+
+
+class MerkleCheckpoints:
+    """Sidecar of Merkle checkpoints for a JSONL audit log.
+
+    ``update`` checkpoints every complete batch of ``batch_size`` events
+    appended since the last checkpoint (``final=True`` also checkpoints a
+    trailing partial batch). ``prove`` locates an event by ``decision_id``,
+    through an ``AuditIndex`` when one is given and by scanning otherwise, and
+    builds its inclusion proof from that event's batch only.
+    """
+
+    def __init__(
+        self,
+        log_path: str | Path,
+        sidecar_path: str | Path | None = None,
+        *,
+        batch_size: int = 1024,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.log_path = Path(log_path)
+        self.sidecar_path = (
+            Path(sidecar_path)
+            if sidecar_path is not None
+            else self.log_path.with_name(self.log_path.name + ".merkle.jsonl")
+        )
+        self.batch_size = batch_size
+        self.checkpoints: list[Checkpoint] = []
+        if self.sidecar_path.exists():
+            with open(self.sidecar_path, encoding="utf-8") as handle:
+                self.checkpoints = [Checkpoint(**json.loads(line)) for line in handle]
+        self._starts = [checkpoint.start_offset for checkpoint in self.checkpoints]
+
+    @property
+    def covered_bytes(self) -> int:
+        return self.checkpoints[-1].end_offset if self.checkpoints else 0
+
+    @property
+    def covered_events(self) -> int:
+        last = self.checkpoints[-1] if self.checkpoints else None
+        return last.first_event + last.events if last else 0
+
+    def _append(self, checkpoint: Checkpoint) -> None:
+        with open(self.sidecar_path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(asdict(checkpoint), sort_keys=True) + "\n")
+        self.checkpoints.append(checkpoint)
+        self._starts.append(checkpoint.start_offset)
+
+    def update(self, *, final: bool = False) -> list[Checkpoint]:
+        """Checkpoint newly appended events; returns the new checkpoints."""
+
+        start = self.covered_bytes
+        if self.log_path.stat().st_size < start:
+            raise ValueError(f"{self.log_path} is shorter than its Merkle checkpoints")
+        added: list[Checkpoint] = []
+        first_event = self.covered_events
+        leaves: list[bytes] = []
+        last_hash = ""
+        offset = batch_start = start
+        with open(self.log_path, "rb") as handle:
+            handle.seek(start)
+            for raw in handle:
+                if not raw.endswith(b"\n"):
+                    break
+                last_hash = json.loads(raw)["hash"]
+                leaves.append(leaf_hash(last_hash))
+                offset += len(raw)
+                if len(leaves) == self.batch_size:
+                    added.append(self._seal(leaves, first_event, batch_start, offset, last_hash))
+                    first_event += len(leaves)
+                    leaves = []
+                    batch_start = offset
+        if final and leaves:
+            added.append(self._seal(leaves, first_event, batch_start, offset, last_hash))
+        return added
+
+    def _seal(
+        self, leaves: list[bytes], first_event: int, start: int, end: int, chain_hash: str
+    ) -> Checkpoint:
+        checkpoint = Checkpoint(
+            index=len(self.checkpoints),
+            first_event=first_event,
+            events=len(leaves),
+            start_offset=start,
+            end_offset=end,
+            root=merkle_root(leaves).hex(),
+            chain_hash=chain_hash,
+        )
+        self._append(checkpoint)
+        return checkpoint
+
+    def _locate(self, decision_id: str, index: AuditIndex | None) -> int | None:
+        if index is not None:
+            offsets = index.offsets(decision_id=decision_id, limit=1)
+            return offsets[0][0] if offsets else None
+        offset = 0
+        with open(self.log_path, "rb") as handle:
+            for raw in handle:
+                if offset >= self.covered_bytes:
+                    break
+                if json.loads(raw).get("decision_id") == decision_id:
+                    return offset
+                offset += len(raw)
+        return None
+
+    def prove(self, decision_id: str, *, index: AuditIndex | None = None) -> InclusionProof:
+        """Inclusion proof for the first event with ``decision_id``.
+
+        Raises ``KeyError`` if no checkpointed event has that id.
+        """
+
+        offset = self._locate(decision_id, index)
+        if offset is None or offset >= self.covered_bytes:
+            raise KeyError(decision_id)
+        checkpoint = self.checkpoints[bisect_right(self._starts, offset) - 1]
+        hashes, decision_ids = _batch_hashes(
+            self.log_path, checkpoint.start_offset, checkpoint.end_offset
+        )
+        position = decision_ids.index(decision_id)
+        path = inclusion_path([leaf_hash(item) for item in hashes], position)
+        return InclusionProof(
+            decision_id=decision_id,
+            event_hash=hashes[position],
+            checkpoint=checkpoint.index,
+            leaf_index=position,
+            tree_size=checkpoint.events,
+            path=tuple(item.hex() for item in path),
+            root=checkpoint.root,
+        )
+
+    def verify(self) -> int | None:
+        """Recompute every checkpoint from the log; index of the first bad one or ``None``.
+
+        Each event's hash is re-derived from its record and its link to the
+        previous event checked, so an edited record fails its checkpoint.
+        """
+
+        verifier = ChainVerifier()
+        with open(self.log_path, "rb") as handle:
+            for checkpoint in self.checkpoints:
+                handle.seek(checkpoint.start_offset)
+                batch = handle.read(checkpoint.end_offset - checkpoint.start_offset)
+                leaves = []
+                for raw in batch.splitlines():
+                    if verifier.feed(raw) is not None:
+                        return checkpoint.index
+                    leaves.append(leaf_hash(verifier.last_hash))
+                if (
+                    len(leaves) != checkpoint.events
+                    or verifier.last_hash != checkpoint.chain_hash
+                    or merkle_root(leaves).hex() != checkpoint.root
+                ):
+                    return checkpoint.index
+        return None
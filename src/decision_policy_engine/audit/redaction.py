@@ -0,0 +1,150 @@
+"""Configurable redaction of decision inputs for audit events."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from hashlib import sha256
+
+from decision_policy_engine.audit.encoding import normalize_value
+from decision_policy_engine.models import Context, ProposedAction
+
+CONTEXT_FIELDS = (
+    "network_available",
+    "rtt_ms",
+    "battery_level",
+    "user_present",
+    "supervised_mode",
+    "locale",
+)
+HASH_PREFIX = "sha256:"
+
+_KEEP = 0
+_DROP = 1
+_TRUNCATE = 2
+_HASH = 3
+
+
+def hash_value(value: object) -> str:
+    """Stable digest of a JSON-compatible value, as stored for hashed keys."""
+
+    payload = json.dumps(
+        normalize_value(value), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return HASH_PREFIX + sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Redactor:
+    """Compiled projection of ``Context``/``ProposedAction`` into audit inputs.
+
+    Metadata keys are kept, dropped (``deny``, or not in ``allow`` when an
+    allowlist is given), truncated to ``truncate[key]`` characters (strings
+    only) or replaced by ``hash_value`` (``hash_keys``). The rules are compiled
+    into one operation per key up front. ``context_fields`` selects the
+    context fields to record. Projections of the last ``context_cache_size``
+    ``Context`` objects are kept (by identity, first in first out) and reused,
+    so returned mappings may share them and must be treated as read-only.
+
+    ``Redactor()`` produces exactly what ``redact_inputs`` does.
+    """
+
+    __slots__ = (
+        "_context_fields",
+        "_context_cache",
+        "_context_cache_size",
+        "_default_op",
+        "_operations",
+        "_passthrough",
+    )
+
+    def __init__(
+        self,
+        *,
+        allow: Iterable[str] | None = None,
+        deny: Iterable[str] = (),
+        truncate: Mapping[str, int] | None = None,
+        hash_keys: Iterable[str] = (),
+        context_fields: Iterable[str] = CONTEXT_FIELDS,
+        context_cache_size: int = 1024,
+    ) -> None:
+        truncate = dict(truncate or {})
+        hash_keys = frozenset(hash_keys)
+        deny = frozenset(deny)
+        for key, limit in truncate.items():
+            if limit < 0:
+                raise ValueError(f"truncate limit for {key!r} must be non-negative")
+            if key in hash_keys:
+                raise ValueError(f"metadata key {key!r} cannot be both truncated and hashed")
+        context_fields = tuple(context_fields)
+        unknown = sorted(set(context_fields) - set(CONTEXT_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown context fields: {unknown}")
+        if context_cache_size < 0:
+            raise ValueError("context_cache_size must be non-negative")
+
+        operations: dict[str, tuple[int, int]] = {}
+        for key in set(allow or ()) | set(truncate) | hash_keys | deny:
+            if key in deny or (allow is not None and key not in allow):
+                operations[key] = (_DROP, 0)
+            elif key in hash_keys:
+                operations[key] = (_HASH, 0)
+            elif key in truncate:
+                operations[key] = (_TRUNCATE, truncate[key])
+            else:
+                operations[key] = (_KEEP, 0)
+        self._operations = operations
+        self._default_op = (_KEEP, 0) if allow is None else (_DROP, 0)
+        self._passthrough = allow is None and not operations
+        self._context_fields = context_fields
+        self._context_cache: dict[int, tuple[Context, dict[str, object]]] = {}
+        self._context_cache_size = context_cache_size
+
+    def redact_metadata(self, metadata: Mapping[str, object]) -> dict[str, object]:
+        """Apply the compiled metadata rules to one mapping."""
+
+        if self._passthrough:
+            return dict(metadata)
+        operations = self._operations
+        default = self._default_op
+        result: dict[str, object] = {}
+        for key, value in metadata.items():
+            operation, limit = operations.get(key, default)
+            if operation == _KEEP:
+                result[key] = value
+            elif operation == _TRUNCATE:
+                result[key] = value[:limit] if isinstance(value, str) else value
+            elif operation == _HASH:
+                result[key] = hash_value(value)
+        return result
+
+    def project_context(self, context: Context) -> dict[str, object]:
+        """Context projection, reused when the same ``Context`` object recurs."""
+
+        cache = self._context_cache
+        entry = cache.get(id(context))
+        if entry is not None and entry[0] is context:
+            return entry[1]
+        projection = {name: getattr(context, name) for name in self._context_fields}
+        if self._context_cache_size:
+            cache[id(context)] = (context, projection)
+            if len(cache) > self._context_cache_size:
+                del cache[next(iter(cache))]
+        return projection
+
+    def __call__(self, context: Context, action: ProposedAction) -> dict[str, object]:
+        """Return the redacted inputs for one decision."""
+
+        entry = self._context_cache.get(id(context))
+        projection = entry[1] if entry is not None and entry[0] is context else None
+        return {
+            "action": {
+                "type": action.type,
+                "risk_level": action.risk_level,
+                "metadata": (
+                    dict(action.metadata)
+                    if self._passthrough
+                    else self.redact_metadata(action.metadata)
+                ),
+            },
+            "context": projection or self.project_context(context),
+        }
@@ -0,0 +1,298 @@
+"""Size- and time-based rotation of hash-chained audit logs into segments."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import os
+import re
+import shutil
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import AuditChain, parse_event
+from decision_policy_engine.audit.verify import VerificationReport, verify_lines
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+COMPRESSIONS = ("auto", "gzip", "zstd", "none")
+_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+_COPY_CHUNK = 1024 * 1024
+
+
+def _segment_pattern(prefix: str) -> re.Pattern[str]:
+    return re.compile(rf"^{re.escape(prefix)}\.(\d+)\.jsonl(\.gz|\.zst)?$")
+
+
+def segment_paths(directory: str | Path, prefix: str = "audit_log") -> list[Path]:
+    """Segments of a rotated log in chain order.
+
+    When a segment exists both plain and compressed (compression finished
+    but the original was not yet removed) the plain file is listed.
+    """
+
+    pattern = _segment_pattern(prefix)
+    found: dict[int, Path] = {}
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    for path in directory.iterdir():
+        match = pattern.match(path.name)
+        if match is None:
+            continue
+        number = int(match.group(1))
+        if number not in found or match.group(2) is None:
+            found[number] = path
+    return [found[number] for number in sorted(found)]
+
+
+def _open_segment(path: Path) -> io.BufferedIOBase:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read {path.name}")
+        raw = open(path, "rb")  # noqa: SIM115
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True))
+    return open(path, "rb")
+
+
+def iter_segment_lines(directory: str | Path, prefix: str = "audit_log") -> Iterator[bytes]:
+    """Yield raw JSONL lines across all segments in order, decompressing on the fly."""
+
+    for path in segment_paths(directory, prefix):
+        try:
+            handle = _open_segment(path)
+        except FileNotFoundError:
+            # Compressed in the background since it was listed.
+            compressed = [path.with_name(path.name + suffix) for suffix in _SUFFIXES.values()]
+            existing = [item for item in compressed if item.exists()]
+            if not existing:
+                raise
+            handle = _open_segment(existing[0])
+        with handle:
+            yield from handle
+
+
+def iter_segment_events(directory: str | Path, prefix: str = "audit_log") -> Iterator[AuditEvent]:
+    """Yield the events of a rotated log in order."""
+
+    for raw in iter_segment_lines(directory, prefix):
+        yield parse_event(raw)
+
+
+def verify_segments(
+    directory: str | Path,
+    prefix: str = "audit_log",
+    *,
+    anchor: str | None = None,
+) -> VerificationReport:
+    """Verify the chain of a rotated log across every segment boundary.
+
+    Line numbers and byte offsets in a reported break count from the start
+    of the first segment, over uncompressed bytes.
+    """
+
+    return verify_lines(iter_segment_lines(directory, prefix), anchor=anchor)
+
+
+def compress_segment(path: str | Path, compression: str = "gzip") -> Path:
+    """Compress a closed segment next to itself and remove the original.
+
+    The compressed file is written under a temporary name and renamed into
+    place, so readers never see a partial segment.
+    """
+
+    path = Path(path)
+    target = path.with_name(path.name + _SUFFIXES[compression])
+    partial = target.with_name(target.name + ".tmp")
+    with open(path, "rb") as source, open(partial, "wb") as raw:
+        if compression == "zstd":
+            if zstandard is None:
+                raise RuntimeError("zstandard is not installed")
+            zstandard.ZstdCompressor().copy_stream(source, raw)
+        else:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as sink:
+                shutil.copyfileobj(source, sink, _COPY_CHUNK)
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.replace(partial, target)
+    path.unlink()
+    return target
+
+
+def _last_hash(path: Path) -> str | None:
+    last = None
+    with _open_segment(path) as handle:
+        for raw in handle:
+            if raw.strip():
+                last = raw
+    return None if last is None else parse_event(last).hash
+
+
+class RotatingAuditChain:
+    """``AuditChain`` that rotates into numbered segments and carries the chain.
+
+    Events go to ``<prefix>.<NNNNNN>.jsonl`` in ``directory``. Before a write,
+    the active segment is closed once it holds ``max_bytes`` or more, or once
+    ``max_age_s`` has passed since this instance opened it. The next segment
+    starts with ``prev_hash`` equal to the previous segment's last hash, so
+    ``verify_segments`` checks one chain across all of them. A batch passed
+    to ``extend`` is never split across segments.
+
+    Closed segments are compressed on a background thread (``"auto"`` picks
+    zstd when ``zstandard`` is installed, gzip otherwise; ``"none"`` keeps
+    them plain). Uncompressed closed segments found on open are queued
+    again. ``close`` waits for pending compression and re-raises its errors.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        prefix: str = "audit_log",
+        max_bytes: int | None = 64 * 1024 * 1024,
+        max_age_s: float | None = None,
+        compression: str = "auto",
+        fsync: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {list(COMPRESSIONS)}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if max_age_s is not None and max_age_s <= 0:
+            raise ValueError("max_age_s must be positive")
+        if compression == "auto":
+            compression = "gzip" if zstandard is None else "zstd"
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self._max_bytes = max_bytes
+        self._max_age_s = max_age_s
+        self._compression = compression
+        self._fsync = fsync
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: list[Future[Path]] = []
+
+        pattern = _segment_pattern(prefix)
+        for path in segment_paths(self.directory, prefix):
+            # Compressed copy completed but the original was not removed yet.
+            if path.suffix == ".jsonl" and any(
+                path.with_name(path.name + suffix).exists() for suffix in _SUFFIXES.values()
+            ):
+                path.unlink()
+        segments = segment_paths(self.directory, prefix)
+        numbers = [int(pattern.match(path.name).group(1)) for path in segments]
+        if segments and segments[-1].suffix == ".jsonl":
+            self._number = numbers[-1]
+            closed = segments[:-1]
+        else:
+            self._number = numbers[-1] + 1 if numbers else 1
+            closed = segments
+        anchor = _last_hash(closed[-1]) if closed else None
+        self._chain = AuditChain(self._segment_path(self._number), fsync=fsync, anchor=anchor)
+        self._opened_at = clock()
+        for path in closed:
+            if path.suffix == ".jsonl":
+                self._schedule(path)
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"{self.prefix}.{number:06d}.jsonl"
+
+    @property
+    def active_path(self) -> Path:
+        """Segment currently being appended to."""
+
+        return self._chain.path
+
+    @property
+    def last_hash(self) -> str | None:
+        return self._chain.last_hash
+
+    @property
+    def segments(self) -> list[Path]:
+        return segment_paths(self.directory, self.prefix)
+
+    def _schedule(self, path: Path) -> None:
+        if self._compression == "none":
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-compress")
+        self._pending.append(self._pool.submit(compress_segment, path, self._compression))
+
+    def _due(self) -> bool:
+        if self._max_age_s is not None and self._clock() - self._opened_at >= self._max_age_s:
+            return True
+        return self._max_bytes is not None and self._chain.size >= self._max_bytes
+
+    def _rotate(self) -> None:
+        closed = self._chain
+        anchor = closed.last_hash
+        closed.close()
+        self._number += 1
+        self._chain = AuditChain(self._segment_path(self._number), fsync=self._fsync, anchor=anchor)
+        self._opened_at = self._clock()
+        self._schedule(closed.path)
+
+    def rotate(self) -> Path:
+        """Close the active segment now; returns the new active segment."""
+
+        with self._lock:
+            if self._chain.size > 0:
+                self._rotate()
+            return self._chain.path
+
+    def append(self, event: AuditEvent) -> AuditEvent:
+        """Chain and append one event; returns the sealed event."""
+
+        return self.extend([event])[0]
+
+    def extend(self, events: Iterable[AuditEvent]) -> list[AuditEvent]:
+        """Chain and append several events to the active segment with one write."""
+
+        with self._lock:
+            if self._chain.size > 0 and self._due():
+                self._rotate()
+            return self._chain.extend(events)
+
+    def wait(self) -> list[Path]:
+        """Wait for queued compression; returns the compressed segments."""
+
+        pending, self._pending = self._pending, []
+        return [future.result() for future in pending]
+
+    def close(self) -> None:
+        """Close the active segment and finish background compression."""
+
+        with self._lock:
+            self._chain.close()
+        try:
+            self.wait()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def __enter__(self) -> RotatingAuditChain:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
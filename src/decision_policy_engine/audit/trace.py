@@ -3,51 +3,96 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Mapping
-from dataclasses import asdict
-from hashlib import sha256
+import os
+import threading
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
+from time import perf_counter
+from types import TracebackType
+from typing import TypeVar
 
+from decision_policy_engine.audit.encoding import (
+    canonical_json,
+    encode_event,
+    event_hash,
+    seal_event,
+)
 from decision_policy_engine.audit.events import AuditEvent
-from decision_policy_engine.models import Context, ProposedAction
+from decision_policy_engine.metrics import METRICS, record_audit_write
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
 
+_T = TypeVar("_T")
 
-def _normalize(value: object) -> object:
-    if isinstance(value, dict):
-        return {key: _normalize(val) for key, val in value.items()}
-    if isinstance(value, list):
-        return [_normalize(item) for item in value]
-    if hasattr(value, "value") and not isinstance(value, (str, bytes)):
-        return value.value
-    return value
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None
 
 
 def canonical_event_json(event: AuditEvent, *, include_hash_fields: bool = False) -> str:
     """Return canonical JSON representation of an audit event."""
 
-    data = asdict(event)
-    if not include_hash_fields:
-        data.pop("hash", None)
-        data.pop("prev_hash", None)
-    normalized = _normalize(data)
-    return json.dumps(normalized, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return canonical_json(event, include_hash_fields=include_hash_fields)
 
 
 def hash_event(event: AuditEvent, prev_hash: str | None = None) -> str:
     """Generate a chained hash for the event."""
 
-    base = prev_hash or ""
-    payload = base + canonical_event_json(event, include_hash_fields=False)
-    return sha256(payload.encode("utf-8")).hexdigest()
+    return event_hash(encode_event(event), prev_hash)
 
 
 def append_jsonl(path: str | Path, event: AuditEvent) -> None:
     """Append an audit event to a JSONL file."""
 
     Path(path).parent.mkdir(parents=True, exist_ok=True)
-    line = canonical_event_json(event, include_hash_fields=True)
-    with open(path, "a", encoding="utf-8") as handle:
-        handle.write(line + "\n")
+    payload = (canonical_event_json(event, include_hash_fields=True) + "\n").encode("utf-8")
+    started = perf_counter() if METRICS.enabled else None
+    # One write() on an O_APPEND descriptor, so concurrent appenders never
+    # interleave within a line.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        _write_all(fd, payload)
+    finally:
+        os.close(fd)
+    if started is not None:
+        record_audit_write("append_jsonl", started, 1)
+
+
+def event_from_record(record: Mapping[str, object]) -> AuditEvent:
+    """Rebuild an ``AuditEvent`` from a parsed JSONL record."""
+
+    cost = record["cost_vector"]
+    return AuditEvent(
+        timestamp_iso=record["timestamp_iso"],
+        trace_id=record["trace_id"],
+        decision_id=record["decision_id"],
+        action_type=record["action_type"],
+        policy_decision=PolicyDecision(record["policy_decision"]),
+        route_selected=ExecutionRoute(record["route_selected"]),
+        cost_vector=CostVector(
+            latency_ms=cost["latency_ms"],
+            privacy_risk=cost["privacy_risk"],
+            reliability_risk=cost["reliability_risk"],
+            dollar_cost=cost["dollar_cost"],
+        ),
+        reason=record["reason"],
+        inputs_redacted=record["inputs_redacted"],
+        prev_hash=record.get("prev_hash"),
+        hash=record.get("hash"),
+        config_hash=record.get("config_hash"),
+    )
+
+
+def parse_event(line: str | bytes) -> AuditEvent:
+    """Parse one JSONL audit line into an ``AuditEvent``."""
+
+    return event_from_record(json.loads(line))
 
 
 def redact_inputs(context: Context, action: ProposedAction) -> Mapping[str, object]:
@@ -68,3 +113,209 @@ def redact_inputs(context: Context, action: ProposedAction) -> Mapping[str, obje
             "locale": context.locale,
         },
     }
+
+
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _write_all(fd: int, payload: bytes) -> None:
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, size)
+
+
+def _last_line(fd: int, end: int) -> tuple[int, bytes]:
+    """Return ``(start, line)`` for the line ending just before offset ``end``."""
+
+    chunks: list[bytes] = []
+    position = end
+    while position > 0:
+        size = min(_TAIL_BLOCK_SIZE, position)
+        position -= size
+        block = _pread(fd, size, position)
+        newline = block.rfind(b"\n")
+        if newline != -1:
+            chunks.append(block[newline + 1 :])
+            position += newline + 1
+            break
+        chunks.append(block)
+    return position, b"".join(reversed(chunks))
+
+
+def _seal_events(
+    events: Iterable[AuditEvent], prev_hash: str | None
+) -> tuple[list[AuditEvent], bytes, str | None]:
+    sealed: list[AuditEvent] = []
+    lines: list[str] = []
+    for event in events:
+        event, line = seal_event(event, prev_hash)
+        prev_hash = event.hash
+        sealed.append(event)
+        lines.append(line + "\n")
+    return sealed, "".join(lines).encode("utf-8"), prev_hash
+
+
+class AuditChain:
+    """Hash-chained JSONL audit log that keeps the tail hash in memory.
+
+    The tail hash is found once by reading backwards from EOF, so appends cost
+    the same regardless of log size. A partial last line left by a crash is
+    completed if it is a whole JSON record and truncated away otherwise. Each
+    ``append``/``extend`` call is a single ``write`` on an ``O_APPEND`` handle.
+    ``anchor`` is the ``prev_hash`` of the first event when the file is empty,
+    so a chain can continue from another file.
+
+    With ``shared=True`` several processes (or several ``AuditChain``
+    instances) may append to the same file: every ``extend`` takes an
+    exclusive ``flock`` on the file, re-reads the tail hash if another writer
+    grew the file since this one last wrote, then seals and writes the whole
+    batch before releasing the lock. Batching amortizes the lock over many
+    events. Shared mode needs ``fcntl`` (POSIX).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        fsync: bool = False,
+        anchor: str | None = None,
+        shared: bool = False,
+    ) -> None:
+        if shared and fcntl is None:
+            raise ValueError("shared AuditChain requires fcntl file locking")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fsync = fsync
+        self._anchor = anchor
+        self._shared = shared
+        self._lock = threading.Lock()
+        self._fd: int | None = os.open(
+            self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o644
+        )
+        try:
+            if shared:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                self._last_hash, self._size = self._recover(anchor)
+            finally:
+                if shared:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+        except BaseException:
+            os.close(self._fd)
+            self._fd = None
+            raise
+
+    def _recover(self, anchor: str | None) -> tuple[str | None, int]:
+        """Return the tail hash and file size, repairing a partial last line."""
+
+        fd = self._fd
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return anchor, 0
+        if _pread(fd, 1, size - 1) != b"\n":
+            start, partial = _last_line(fd, size)
+            try:
+                json.loads(partial)
+            except ValueError:
+                os.ftruncate(fd, start)
+                size = start
+            else:
+                os.write(fd, b"\n")
+                size += 1
+            if size == 0:
+                return anchor, 0
+        _, line = _last_line(fd, size - 1)
+        try:
+            value = json.loads(line).get("hash")
+        except (ValueError, AttributeError) as exc:
+            raise ValueError(f"Corrupt last audit record in {self.path}") from exc
+        return (str(value) if value else None), size
+
+    @property
+    def last_hash(self) -> str | None:
+        """Hash of the most recently appended event."""
+
+        return self._last_hash
+
+    @property
+    def size(self) -> int:
+        """Current size of the log file in bytes."""
+
+        with self._lock:
+            if self._fd is None:
+                raise ValueError("size of closed AuditChain")
+            return os.fstat(self._fd).st_size
+
+    def append(self, event: AuditEvent) -> AuditEvent:
+        """Chain and append one event; returns the sealed event."""
+
+        return self.extend([event])[0]
+
+    def extend(self, events: Iterable[AuditEvent]) -> list[AuditEvent]:
+        """Chain and append several events with a single write."""
+
+        return self._commit(lambda prev_hash: _seal_events(events, prev_hash))
+
+    def _commit(self, seal: Callable[[str | None], tuple[list[_T], bytes, str | None]]) -> list[_T]:
+        """Write what ``seal`` chains onto the current tail hash, under the locks.
+
+        ``seal(prev_hash)`` returns the sealed items, their encoded lines and
+        the new tail hash; it runs while the log is locked, so the tail it is
+        given is current even in shared mode.
+        """
+
+        with self._lock:
+            if self._fd is None:
+                raise ValueError("append to closed AuditChain")
+            if not self._shared:
+                return self._write_sealed(seal)
+            started = perf_counter() if METRICS.enabled else None
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                if started is not None:
+                    METRICS.observe("dpe_audit_lock_wait_seconds", perf_counter() - started)
+                if os.fstat(self._fd).st_size != self._size:
+                    self._last_hash, self._size = self._recover(self._anchor)
+                return self._write_sealed(seal)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _write_sealed(
+        self, seal: Callable[[str | None], tuple[list[_T], bytes, str | None]]
+    ) -> list[_T]:
+        sealed, payload, last_hash = seal(self._last_hash)
+        if not sealed:
+            return sealed
+        started = perf_counter() if METRICS.enabled else None
+        _write_all(self._fd, payload)
+        if self._fsync:
+            os.fsync(self._fd)
+        if started is not None:
+            record_audit_write("chain", started, len(sealed))
+        self._last_hash = last_hash
+        self._size += len(payload)
+        return sealed
+
+    def close(self) -> None:
+        """Close the log file. Safe to call more than once."""
+
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def __enter__(self) -> AuditChain:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,269 @@
+"""Streaming verification of hash-chained JSONL audit logs."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class ChainBreak:
+    """First record that failed verification."""
+
+    line_number: int
+    byte_offset: int
+    reason: str
+
+
+@dataclass(frozen=True)
+class VerificationReport:
+    """Outcome and throughput of a chain verification run."""
+
+    ok: bool
+    events: int
+    bytes_read: int
+    elapsed_s: float
+    last_hash: str | None
+    error: ChainBreak | None = None
+
+    @property
+    def events_per_s(self) -> float:
+        return self.events / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes_read / 1e6 / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+class ChainVerifier:
+    """Incremental verifier fed one raw JSONL line at a time.
+
+    Each record's hash is recomputed over its body (the record without
+    ``hash``/``prev_hash``, re-serialized in its on-disk key order) and its
+    ``prev_hash`` must equal the previous record's hash. When ``check_anchor``
+    is false the first record's ``prev_hash`` is accepted as-is.
+    """
+
+    def __init__(self, anchor: str | None = None, *, check_anchor: bool = True) -> None:
+        self.last_hash = anchor
+        self.first_prev_hash: str | None = None
+        self.events = 0
+        self._check_link = check_anchor
+
+    def feed(self, raw: bytes) -> str | None:
+        """Verify one line; return a failure reason or ``None``."""
+
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            return "record is not valid JSON"
+        if not isinstance(record, dict):
+            return "record is not a JSON object"
+        claimed = record.pop("hash", None)
+        prev_hash = record.pop("prev_hash", None)
+        if self._check_link and prev_hash != self.last_hash:
+            return "prev_hash does not match the previous record's hash"
+        body = json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+        computed = sha256(((prev_hash or "") + body).encode("utf-8")).hexdigest()
+        if claimed != computed:
+            return "hash does not match record contents"
+        if self.events == 0:
+            self.first_prev_hash = prev_hash
+        self._check_link = True
+        self.last_hash = claimed
+        self.events += 1
+        return None
+
+
+@dataclass(frozen=True)
+class _SegmentResult:
+    start: int
+    lines: int
+    events: int
+    bytes_read: int
+    first_prev_hash: str | None
+    last_hash: str | None
+    error: ChainBreak | None
+
+
+def verify_lines(
+    lines: Iterable[bytes],
+    *,
+    anchor: str | None = None,
+    check_anchor: bool = True,
+    start_offset: int = 0,
+) -> VerificationReport:
+    """Verify a stream of raw JSONL lines (each including its newline)."""
+
+    started = time.perf_counter()
+    verifier = ChainVerifier(anchor, check_anchor=check_anchor)
+    offset = start_offset
+    error = None
+    for line_number, raw in enumerate(lines, start=1):
+        reason = verifier.feed(raw)
+        if reason is not None:
+            error = ChainBreak(line_number, offset, reason)
+            break
+        offset += len(raw)
+    return VerificationReport(
+        ok=error is None,
+        events=verifier.events,
+        bytes_read=offset - start_offset,
+        elapsed_s=time.perf_counter() - started,
+        last_hash=verifier.last_hash,
+        error=error,
+    )
+
+
+def _read_lines(path: Path, start: int, end: int | None) -> Iterable[bytes]:
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        position = start
+        for raw in handle:
+            if end is not None and position >= end:
+                break
+            position += len(raw)
+            yield raw
+
+
+def _verify_segment(path: str, start: int, end: int) -> _SegmentResult:
+    verifier = ChainVerifier(check_anchor=False)
+    offset = start
+    lines = 0
+    error = None
+    for raw in _read_lines(Path(path), start, end):
+        lines += 1
+        reason = verifier.feed(raw)
+        if reason is not None:
+            error = ChainBreak(lines, offset, reason)
+            break
+        offset += len(raw)
+    return _SegmentResult(
+        start=start,
+        lines=lines,
+        events=verifier.events,
+        bytes_read=offset - start,
+        first_prev_hash=verifier.first_prev_hash,
+        last_hash=verifier.last_hash,
+        error=error,
+    )
+
+
+def _segment_bounds(path: Path, segments: int) -> list[tuple[int, int]]:
+    size = path.stat().st_size
+    cuts = [0]
+    with open(path, "rb") as handle:
+        for index in range(1, segments):
+            target = max(size * index // segments, cuts[-1])
+            if target > 0:
+                handle.seek(target - 1)
+                handle.readline()
+            cuts.append(min(handle.tell(), size))
+    cuts.append(size)
+    return [(start, end) for start, end in zip(cuts, cuts[1:], strict=False) if end > start]
+
+
+def verify_chain(
+    path: str | Path,
+    *,
+    anchor: str | None = None,
+    workers: int = 1,
+) -> VerificationReport:
+    """Verify every record and link of a JSONL audit log.
+
+    Memory use is constant in the log size. With ``workers > 1`` the file is
+    split on line boundaries, segments are verified in a process pool and the
+    boundary hashes are stitched together. ``anchor`` is the expected
+    ``prev_hash`` of the first record (``None`` for a fresh log).
+    """
+
+    path = Path(path)
+    if workers <= 1:
+        return verify_lines(_read_lines(path, 0, None), anchor=anchor)
+
+    started = time.perf_counter()
+    bounds = _segment_bounds(path, workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(
+            pool.map(_verify_segment, [str(path)] * len(bounds), *zip(*bounds, strict=True))
+        )
+
+    events = 0
+    bytes_read = 0
+    lines_before = 0
+    last_hash = anchor
+    error = None
+    for result in results:
+        if result.events and result.first_prev_hash != last_hash:
+            error = ChainBreak(
+                lines_before + 1,
+                result.start,
+                "prev_hash does not match the previous record's hash",
+            )
+            break
+        events += result.events
+        bytes_read += result.bytes_read
+        if result.error is not None:
+            error = ChainBreak(
+                lines_before + result.error.line_number,
+                result.error.byte_offset,
+                result.error.reason,
+            )
+            break
+        if result.events:
+            last_hash = result.last_hash
+        lines_before += result.lines
+
+    return VerificationReport(
+        ok=error is None,
+        events=events,
+        bytes_read=bytes_read,
+        elapsed_s=time.perf_counter() - started,
+        last_hash=last_hash,
+        error=error,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Verify an audit log from the command line; exit status 1 on a broken chain."""
+
+    parser = argparse.ArgumentParser(description="Verify a hash-chained JSONL audit log.")
+    parser.add_argument("path", type=Path, help="log file, or directory of rotated segments")
+    parser.add_argument("--prefix", default="audit_log", help="segment prefix for a directory")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--anchor", default=None, help="expected prev_hash of the first record")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.path.is_dir():
+        from decision_policy_engine.audit.rotation import verify_segments
+
+        report = verify_segments(args.path, args.prefix, anchor=args.anchor)
+    else:
+        report = verify_chain(args.path, anchor=args.anchor, workers=args.workers)
+    if args.json:
+        payload = asdict(report)
+        payload["events_per_s"] = report.events_per_s
+        payload["mb_per_s"] = report.mb_per_s
+        print(json.dumps(payload, sort_keys=True))
+    else:
+        status = "OK" if report.ok else "BROKEN"
+        print(f"{status}: {report.events} events, {report.bytes_read} bytes "
+              f"in {report.elapsed_s:.3f}s ({report.events_per_s:,.0f} events/s, "
+              f"{report.mb_per_s:.1f} MB/s)")
+        if report.error is not None:
+            print(f"First break at line {report.error.line_number} "
+                  f"(byte offset {report.error.byte_offset}): {report.error.reason}")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
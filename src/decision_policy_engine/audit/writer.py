@@ -0,0 +1,237 @@
+"""Buffered, group-commit audit log writer."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from types import TracebackType
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import canonical_event_json
+from decision_policy_engine.metrics import METRICS, record_audit_write
+
+FSYNC_POLICIES = ("never", "batch", "event")
+
+
+def _flush_loop(ref: weakref.ref[AuditWriter], stop: threading.Event, interval: float) -> None:
+    """Background deadline flusher; holds the writer only while flushing."""
+
+    timeout = interval
+    while not stop.wait(timeout):
+        writer = ref()
+        if writer is None:
+            return
+        with writer._lock:
+            if writer._fd is None:
+                return
+            writer._flush_if_due()
+            due = writer._due
+        del writer
+        # Sleep until the oldest event's real deadline; if that has passed
+        # without a flush (an injected clock running slow), poll every interval.
+        remaining = None if due is None else due - time.monotonic()
+        timeout = remaining if remaining is not None and remaining > 0 else interval
+
+
+class AuditWriter:
+    """Append audit events to a JSONL file through an open handle and a buffer.
+
+    Buffered lines are written with one ``write`` call when ``max_events`` or
+    ``max_buffer_bytes`` is reached, or once ``flush_interval_s`` has elapsed
+    since the oldest pending event. The deadline is enforced by a daemon
+    thread even when no further events arrive; with ``background_flush=False``
+    it is only checked on writes and ``flush_if_due`` calls. ``fsync`` selects
+    when data is forced to disk: ``"never"``, once per flushed ``"batch"`` or
+    after every ``"event"``. ``close`` always flushes and fsyncs. Lines on disk
+    are byte-identical to ``append_jsonl``. Methods may be called from several
+    threads.
+
+    Events leave the buffer only once written: if a write fails (``ENOSPC``,
+    ``EIO``) the error propagates and the unwritten events, including the tail
+    of a partially written line, stay buffered for the next flush. A failed
+    ``close`` leaves the file open so it can be retried.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_events: int = 256,
+        max_buffer_bytes: int = 64 * 1024,
+        flush_interval_s: float | None = 1.0,
+        fsync: str = "batch",
+        clock: Callable[[], float] = time.monotonic,
+        background_flush: bool = True,
+    ) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {list(FSYNC_POLICIES)}")
+        if max_events <= 0 or max_buffer_bytes <= 0:
+            raise ValueError("max_events and max_buffer_bytes must be positive")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd: int | None = os.open(
+            self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o644
+        )
+        self._max_events = max_events
+        self._max_buffer_bytes = max_buffer_bytes
+        self._flush_interval_s = flush_interval_s
+        self._fsync = fsync
+        self._clock = clock
+        self._buffer: list[bytes] = []
+        self._buffered_bytes = 0
+        self._oldest: float | None = None
+        # Real (monotonic) deadline of the oldest pending event, for the flusher.
+        self._due: float | None = None
+        self._unsynced = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if background_flush and flush_interval_s is not None and fsync != "event":
+            self._flusher = threading.Thread(
+                target=_flush_loop,
+                args=(weakref.ref(self), self._stop, flush_interval_s),
+                name="audit-writer-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._fd is None
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered events not yet written."""
+
+        return len(self._buffer)
+
+    def write(self, event: AuditEvent) -> None:
+        """Buffer one event, flushing if a size, count or time limit is reached."""
+
+        self.write_line(canonical_event_json(event, include_hash_fields=True))
+
+    def write_many(self, events: Iterable[AuditEvent]) -> None:
+        """Buffer several events."""
+
+        for event in events:
+            self.write(event)
+
+    def write_line(self, line: str) -> None:
+        """Buffer an already-encoded canonical JSON line (without newline)."""
+
+        with self._lock:
+            self._write_line(line)
+
+    def _write_line(self, line: str) -> None:
+        if self._fd is None:
+            raise ValueError("write to closed AuditWriter")
+        data = (line + "\n").encode("utf-8")
+        if not self._buffer:
+            self._oldest = self._clock()
+            if self._flush_interval_s is not None:
+                self._due = time.monotonic() + self._flush_interval_s
+        self._buffer.append(data)
+        self._buffered_bytes += len(data)
+        if self._fsync == "event":
+            self._flush(sync=True)
+        elif (
+            len(self._buffer) >= self._max_events
+            or self._buffered_bytes >= self._max_buffer_bytes
+        ):
+            self._flush(sync=self._fsync == "batch")
+        else:
+            self._flush_if_due()
+
+    def flush_if_due(self) -> bool:
+        """Flush when the oldest pending event has waited ``flush_interval_s``."""
+
+        with self._lock:
+            return self._flush_if_due()
+
+    def _flush_if_due(self) -> bool:
+        if (
+            self._buffer
+            and self._flush_interval_s is not None
+            and self._clock() - self._oldest >= self._flush_interval_s
+        ):
+            self._flush(sync=self._fsync != "never")
+            return True
+        return False
+
+    def flush(self) -> None:
+        """Write all buffered events, applying the fsync policy."""
+
+        with self._lock:
+            self._flush(sync=self._fsync != "never")
+
+    def _flush(self, *, sync: bool) -> None:
+        if self._fd is None:
+            raise ValueError("flush of closed AuditWriter")
+        started = time.perf_counter() if METRICS.enabled else None
+        events = len(self._buffer)
+        if self._buffer:
+            payload = memoryview(b"".join(self._buffer))
+            total = 0
+            try:
+                while total < len(payload):
+                    total += os.write(self._fd, payload[total:])
+            finally:
+                if total:
+                    self._unsynced = True
+                    self._drop_written(total)
+        if sync and self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = False
+        if started is not None and events:
+            record_audit_write("buffered", started, events)
+
+    def _drop_written(self, written: int) -> None:
+        """Remove the first ``written`` bytes from the buffer."""
+
+        buffer = self._buffer
+        if written >= self._buffered_bytes:
+            buffer.clear()
+            self._buffered_bytes = 0
+            self._oldest = None
+            self._due = None
+            return
+        self._buffered_bytes -= written
+        done = 0
+        while written >= len(buffer[done]):
+            written -= len(buffer[done])
+            done += 1
+        del buffer[:done]
+        if written:
+            buffer[0] = buffer[0][written:]
+
+    def close(self) -> None:
+        """Flush, fsync and close the file. Safe to call more than once."""
+
+        self._stop.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        with self._lock:
+            if self._fd is None:
+                return
+            self._flush(sync=True)
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self) -> None:
+        if getattr(self, "_fd", None) is not None:
+            self.close()
+
+    def __enter__(self) -> AuditWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
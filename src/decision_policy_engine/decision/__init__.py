@@ -1,6 +1,29 @@
 """Decision routing utilities."""
 
+from .cache import CachedDecision, CacheStats, DecisionCache, Quantization
+from .compiled import CompiledRouter, LazyRouteExplanation, router_for
+from .config import DEFAULT_ROUTER_CONFIG, RouterConfig
 from .cost import norm_cost, norm_latency
-from .router import Router
+from .registry import DEFAULT_ROUTE_REGISTRY, RankedRoute, RouteRegistry
+from .router import BatchRouteSelection, Router
+from .session import RoutingSession
 
-__all__ = ["norm_cost", "norm_latency", "Router"]
+__all__ = [
+    "DEFAULT_ROUTE_REGISTRY",
+    "DEFAULT_ROUTER_CONFIG",
+    "BatchRouteSelection",
+    "CachedDecision",
+    "CacheStats",
+    "CompiledRouter",
+    "DecisionCache",
+    "LazyRouteExplanation",
+    "norm_cost",
+    "norm_latency",
+    "Quantization",
+    "RankedRoute",
+    "RouteRegistry",
+    "Router",
+    "RouterConfig",
+    "RoutingSession",
+    "router_for",
+]
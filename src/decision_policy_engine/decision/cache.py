@@ -0,0 +1,199 @@
+"""Opt-in memoization of policy + routing decisions."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, fields
+
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
+from decision_policy_engine.policy.policy_gate import PolicyGate
+
+
+@dataclass(frozen=True)
+class Quantization:
+    """Bucket widths used to build cache keys; ``None`` keeps the exact value."""
+
+    rtt_ms: float | None = None
+    battery_level: float | None = None
+    latency_ms: float | None = None
+    privacy_risk: float | None = None
+    reliability_risk: float | None = None
+    dollar_cost: float | None = None
+
+    def __post_init__(self) -> None:
+        for item in fields(self):
+            width = getattr(self, item.name)
+            if width is not None and not width > 0:
+                raise ValueError(f"{item.name} bucket width must be positive")
+
+
+@dataclass(frozen=True)
+class CachedDecision:
+    """Combined policy and routing outcome returned by ``DecisionCache``."""
+
+    policy_decision: PolicyDecision
+    reason: str
+    route: ExecutionRoute
+    cost: CostVector
+    explanation: object
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+
+def _bucket(value: float, width: float | None) -> float:
+    if width is None:
+        return value
+    return math.floor(value / width)
+
+
+class DecisionCache:
+    """LRU/TTL cache wrapping ``PolicyGate.evaluate`` and ``Router.select_route``.
+
+    With the default ``Quantization`` keys use exact input values, so cached
+    outcomes are identical to the uncached path. With bucket widths set, inputs in
+    the same bucket share the outcome (and explanation) of the first one seen.
+    The returned ``cost`` is always taken from the caller's candidates.
+    Instances are not thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_s: float | None = None,
+        quantization: Quantization | None = None,
+        *,
+        gate: object = PolicyGate,
+        router: object = Router,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if ttl_s is not None and ttl_s <= 0:
+            raise ValueError("ttl_s must be positive")
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._quantization = quantization or Quantization()
+        self._evaluate = gate.evaluate
+        self._select_route = router.select_route
+        self._clock = clock
+        self._entries: OrderedDict[object, tuple[float, tuple]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _key(
+        self,
+        context: Context,
+        action: ProposedAction,
+        candidates: Mapping[ExecutionRoute, CostVector],
+    ) -> tuple:
+        q = self._quantization
+        return (
+            context.network_available,
+            _bucket(context.rtt_ms, q.rtt_ms),
+            _bucket(context.battery_level, q.battery_level),
+            context.user_present,
+            context.supervised_mode,
+            context.locale,
+            action.type,
+            action.risk_level,
+            tuple(sorted(action.metadata.items())),
+            tuple(
+                (
+                    route,
+                    _bucket(cost.latency_ms, q.latency_ms),
+                    _bucket(cost.privacy_risk, q.privacy_risk),
+                    _bucket(cost.reliability_risk, q.reliability_risk),
+                    _bucket(cost.dollar_cost, q.dollar_cost),
+                )
+                for route, cost in candidates.items()
+            ),
+        )
+
+    def decide(
+        self,
+        context: Context,
+        action: ProposedAction,
+        candidates: Mapping[ExecutionRoute, CostVector],
+    ) -> CachedDecision:
+        """Return the policy decision and route, computing them on a miss."""
+
+        try:
+            key = self._key(context, action, candidates)
+            hash(key)
+        except TypeError:
+            # Unhashable or unorderable metadata: evaluate without caching.
+            self._misses += 1
+            return self._compute(context, action, candidates)
+
+        entry = self._entries.get(key)
+        now = self._clock() if self._ttl_s is not None else 0.0
+        if entry is not None:
+            expires_at, value = entry
+            if self._ttl_s is None or now < expires_at:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                policy_decision, reason, route, explanation = value
+                return CachedDecision(
+                    policy_decision, reason, route, candidates[route], explanation
+                )
+            del self._entries[key]
+            self._expirations += 1
+
+        self._misses += 1
+        decision = self._compute(context, action, candidates)
+        expires_at = now + self._ttl_s if self._ttl_s is not None else 0.0
+        self._entries[key] = (
+            expires_at,
+            (decision.policy_decision, decision.reason, decision.route, decision.explanation),
+        )
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        return decision
+
+    def _compute(
+        self,
+        context: Context,
+        action: ProposedAction,
+        candidates: Mapping[ExecutionRoute, CostVector],
+    ) -> CachedDecision:
+        policy_decision, reason = self._evaluate(context, action)
+        route, cost, explanation = self._select_route(context, candidates)
+        return CachedDecision(policy_decision, reason, route, cost, explanation)
+
+    def stats(self) -> CacheStats:
+        """Return current hit/miss/eviction counters."""
+
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            size=len(self._entries),
+        )
+
+    def clear(self) -> None:
+        """Drop all cached entries; counters are kept."""
+
+        self._entries.clear()
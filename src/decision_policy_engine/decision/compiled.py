@@ -0,0 +1,242 @@
+"""Precompiled routing plan with a lazily built explanation."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING
+
+from decision_policy_engine.decision.config import RouterConfig
+from decision_policy_engine.decision.router import RouteExplanation
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute
+
+if TYPE_CHECKING:
+    from decision_policy_engine.decision.registry import RouteRegistry
+
+
+class LazyRouteExplanation:
+    """Route explanation that is only computed when an attribute is read.
+
+    The candidates mapping is referenced, not copied, so it must not be mutated
+    while the explanation may still be accessed.
+    """
+
+    __slots__ = ("_router", "_candidates", "_network_available", "_resolved")
+
+    def __init__(
+        self,
+        router: CompiledRouter | RouteRegistry,
+        candidates: Mapping[ExecutionRoute, CostVector],
+        network_available: bool,
+    ) -> None:
+        self._router = router
+        self._candidates = candidates
+        self._network_available = network_available
+        self._resolved: RouteExplanation | None = None
+
+    def resolve(self) -> RouteExplanation:
+        """Build (once) and return the full explanation."""
+
+        if self._resolved is None:
+            self._resolved = self._router.explain(self._candidates, self._network_available)
+        return self._resolved
+
+    @property
+    def weights(self) -> Mapping[str, float]:
+        return self.resolve().weights
+
+    @property
+    def normalized(self) -> Mapping[ExecutionRoute, Mapping[str, float]]:
+        return self.resolve().normalized
+
+    @property
+    def scores(self) -> Mapping[ExecutionRoute, float]:
+        return self.resolve().scores
+
+
+class CompiledRouter:
+    """Router with weights, normalization bounds and tie-break ranks fixed up front.
+
+    Built from a ``RouterConfig``; with ``weights`` only (or nothing), the
+    module-level bounds and tie-break order in effect at construction are used.
+    Produces the same routes and scores as ``Router.select_route`` for the
+    same weights and bounds. Use ``router_for`` to share one instance per config.
+    """
+
+    __slots__ = (
+        "_config",
+        "_weights",
+        "_weights_map",
+        "_latency_min",
+        "_latency_span",
+        "_cost_min",
+        "_cost_span",
+        "_ranks",
+        "_requires_network",
+        "_offline_fallbacks",
+    )
+
+    def __init__(
+        self,
+        weights: Mapping[str, float] | None = None,
+        *,
+        config: RouterConfig | None = None,
+    ) -> None:
+        if config is not None and weights is not None:
+            raise ValueError("Pass either weights or config, not both")
+        if config is None:
+            config = RouterConfig.current()
+        if weights is not None:
+            config = RouterConfig.from_weights(
+                weights,
+                latency_min_ms=config.latency_min_ms,
+                latency_max_ms=config.latency_max_ms,
+                cost_min=config.cost_min,
+                cost_max=config.cost_max,
+                tie_break_order=config.tie_break_order,
+                requires_network=config.requires_network,
+                offline_fallbacks=config.offline_fallbacks,
+            )
+        self._config = config
+        self._weights = config.weights
+        self._weights_map = dict(config.weights_map)
+        self._latency_min = config.latency_min_ms
+        self._latency_span = config.latency_span
+        self._cost_min = config.cost_min
+        self._cost_span = config.cost_span
+        self._ranks = {route: rank for rank, route in enumerate(config.tie_break_order)}
+        self._requires_network = frozenset(config.requires_network)
+        self._offline_fallbacks = config.offline_fallbacks
+
+    @property
+    def config(self) -> RouterConfig:
+        return self._config
+
+    @property
+    def weights(self) -> Mapping[str, float]:
+        return dict(self._weights_map)
+
+    def score(self, cost: CostVector) -> float:
+        """Return the weighted score of a cost vector."""
+
+        span = self._latency_span
+        latency = 0.0 if span <= 0 else (cost.latency_ms - self._latency_min) / span
+        latency = max(0.0, min(1.0, latency))
+        span = self._cost_span
+        dollar = 0.0 if span <= 0 else (cost.dollar_cost - self._cost_min) / span
+        dollar = max(0.0, min(1.0, dollar))
+        w_latency, w_privacy, w_reliability, w_dollar = self._weights
+        # Same operation order as ``sum`` in ``Router._score`` keeps scores bit-identical.
+        return (
+            w_latency * latency
+            + w_privacy * cost.privacy_risk
+            + w_reliability * cost.reliability_risk
+            + w_dollar * dollar
+        )
+
+    def score_many(self, costs: Iterable[CostVector]) -> list[float]:
+        """Scores of several cost vectors, bit-identical to ``score``."""
+
+        latency_min, latency_span = self._latency_min, self._latency_span
+        cost_min, cost_span = self._cost_min, self._cost_span
+        w_latency, w_privacy, w_reliability, w_dollar = self._weights
+        scores = []
+        for cost in costs:
+            latency = 0.0 if latency_span <= 0 else (cost.latency_ms - latency_min) / latency_span
+            dollar = 0.0 if cost_span <= 0 else (cost.dollar_cost - cost_min) / cost_span
+            scores.append(
+                w_latency * max(0.0, min(1.0, latency))
+                + w_privacy * cost.privacy_risk
+                + w_reliability * cost.reliability_risk
+                + w_dollar * max(0.0, min(1.0, dollar))
+            )
+        return scores
+
+    def select_route(
+        self,
+        context: Context,
+        candidates: Mapping[ExecutionRoute, CostVector],
+    ) -> tuple[ExecutionRoute, CostVector, LazyRouteExplanation]:
+        """Select a route without building per-route structures."""
+
+        network_available = context.network_available
+        chosen_route = None
+        if not network_available:
+            for route in self._offline_fallbacks:
+                if route in candidates:
+                    chosen_route = route
+                    break
+        if chosen_route is None:
+            ranks = self._ranks
+            requires_network = self._requires_network
+            best_score = 0.0
+            best_rank = 0
+            for route, cost in candidates.items():
+                if not network_available and route in requires_network:
+                    continue
+                rank = ranks.get(route)
+                if rank is None:
+                    raise ValueError(f"{route!r} is not in the tie-break order.")
+                score = self.score(cost)
+                if (
+                    chosen_route is None
+                    or score < best_score
+                    or (score == best_score and rank < best_rank)
+                ):
+                    chosen_route, best_score, best_rank = route, score, rank
+            if chosen_route is None:
+                raise ValueError("No candidates available for routing.")
+
+        explanation = LazyRouteExplanation(self, candidates, network_available)
+        return chosen_route, candidates[chosen_route], explanation
+
+    def explain(
+        self,
+        candidates: Mapping[ExecutionRoute, CostVector],
+        network_available: bool = True,
+    ) -> RouteExplanation:
+        """Build the full explanation ``Router.select_route`` would return."""
+
+        normalized_values: dict[ExecutionRoute, dict[str, float]] = {}
+        scores: dict[ExecutionRoute, float] = {}
+        for route, cost in candidates.items():
+            if not network_available and route in self._requires_network:
+                continue
+            latency = self._normalize(cost.latency_ms, self._latency_min, self._latency_span)
+            dollar = self._normalize(cost.dollar_cost, self._cost_min, self._cost_span)
+            normalized_values[route] = {
+                "latency_ms": latency,
+                "privacy_risk": cost.privacy_risk,
+                "reliability_risk": cost.reliability_risk,
+                "dollar_cost": dollar,
+            }
+            scores[route] = self.score(cost)
+        return RouteExplanation(
+            weights=dict(self._weights_map),
+            normalized=normalized_values,
+            scores=scores,
+        )
+
+    @staticmethod
+    def _normalize(value: float, low: float, span: float) -> float:
+        if span <= 0:
+            return 0.0
+        return max(0.0, min(1.0, (value - low) / span))
+
+
+_routers: dict[RouterConfig, CompiledRouter] = {}
+_routers_lock = threading.Lock()
+
+
+def router_for(config: RouterConfig) -> CompiledRouter:
+    """The shared ``CompiledRouter`` for ``config``, compiled on first use.
+
+    Look the router up once (per tenant, per request handler) and keep it;
+    calls on it do no configuration lookups.
+    """
+
+    router = _routers.get(config)
+    if router is None:
+        with _routers_lock:
+            router = _routers.setdefault(config, CompiledRouter(config=config))
+    return router
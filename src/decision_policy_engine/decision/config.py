@@ -0,0 +1,145 @@
+"""Immutable, validated routing configuration."""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from hashlib import sha256
+
+from decision_policy_engine.decision import cost as cost_module
+from decision_policy_engine.decision import router as router_module
+from decision_policy_engine.decision.router import COST_FIELDS
+from decision_policy_engine.models import ExecutionRoute
+
+
+def _route_value(route: Hashable) -> str | int:
+    """JSON value identifying ``route`` in the canonical configuration."""
+
+    if isinstance(route, bool) or not isinstance(route, (str, int)):
+        raise ValueError(f"Routes must be str, int or str-Enum members, got {route!r}")
+    return route.value if isinstance(route, Enum) else route
+
+
+@dataclass(frozen=True)
+class RouterConfig:
+    """Weights, normalization bounds and route rules for one router.
+
+    ``weights`` is a tuple in ``COST_FIELDS`` order. ``tie_break_order``
+    ranks the routes for score ties; offline, routes in ``requires_network``
+    are skipped and the first of ``offline_fallbacks`` present is chosen
+    without scoring (the defaults are the built-in ``Router`` rules). Spans
+    are precomputed once; scores divide by them exactly as ``Router`` does
+    (multiplying by an inverse span would change the last bit of some
+    scores). ``config_hash`` is a stable sha256 over the canonical JSON of the
+    configuration and is what audit events record. ``RouterConfig()`` uses
+    the built-in defaults; ``current()`` reads the module-level ``WEIGHTS``
+    and bounds as they are now.
+    """
+
+    weights: tuple[float, ...] = tuple(router_module.WEIGHTS[key] for key in COST_FIELDS)
+    latency_min_ms: float = cost_module.LATENCY_MIN_MS
+    latency_max_ms: float = cost_module.LATENCY_MAX_MS
+    cost_min: float = cost_module.COST_MIN
+    cost_max: float = cost_module.COST_MAX
+    tie_break_order: tuple[Hashable, ...] = tuple(router_module.TIE_BREAK_ORDER)
+    requires_network: tuple[Hashable, ...] = (ExecutionRoute.CLOUD,)
+    offline_fallbacks: tuple[Hashable, ...] = (ExecutionRoute.LOCAL, ExecutionRoute.DEGRADED)
+    latency_span: float = field(init=False, repr=False, compare=False)
+    cost_span: float = field(init=False, repr=False, compare=False)
+    config_hash: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        weights = tuple(self.weights)
+        if len(weights) != len(COST_FIELDS):
+            raise ValueError(f"weights must have {len(COST_FIELDS)} entries: {list(COST_FIELDS)}")
+        for value in weights + (
+            self.latency_min_ms,
+            self.latency_max_ms,
+            self.cost_min,
+            self.cost_max,
+        ):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"Router configuration values must be numbers, got {value!r}")
+            if not math.isfinite(value):
+                raise ValueError(f"Router configuration values must be finite, got {value!r}")
+        if self.latency_max_ms < self.latency_min_ms or self.cost_max < self.cost_min:
+            raise ValueError("Normalization maximums must not be below their minimums")
+        order = tuple(self.tie_break_order)
+        for route in order:
+            _route_value(route)
+        if len(set(order)) != len(order):
+            raise ValueError("tie_break_order must not repeat routes")
+        requires_network = tuple(self.requires_network)
+        offline_fallbacks = tuple(self.offline_fallbacks)
+        for route in requires_network + offline_fallbacks:
+            if route not in order:
+                raise ValueError(f"{route!r} is not in tie_break_order")
+        if set(requires_network) & set(offline_fallbacks):
+            raise ValueError("Offline fallbacks cannot require the network")
+        # Floats throughout, so equal configs always hash alike; int and float
+        # operands give identical quotients and products here.
+        object.__setattr__(self, "weights", tuple(float(value) for value in weights))
+        for name in ("latency_min_ms", "latency_max_ms", "cost_min", "cost_max"):
+            object.__setattr__(self, name, float(getattr(self, name)))
+        object.__setattr__(self, "tie_break_order", order)
+        # A set: kept in tie-break order so equal masks hash alike.
+        object.__setattr__(
+            self, "requires_network", tuple(sorted(set(requires_network), key=order.index))
+        )
+        object.__setattr__(self, "offline_fallbacks", offline_fallbacks)
+        object.__setattr__(self, "latency_span", self.latency_max_ms - self.latency_min_ms)
+        object.__setattr__(self, "cost_span", self.cost_max - self.cost_min)
+        object.__setattr__(self, "config_hash", sha256(self.canonical_json().encode()).hexdigest())
+
+    @classmethod
+    def from_weights(cls, weights: Mapping[str, float], **options: object) -> RouterConfig:
+        """Build a config from a ``WEIGHTS``-style mapping and other fields."""
+
+        if set(weights) != set(COST_FIELDS):
+            raise ValueError(f"weights must define exactly {list(COST_FIELDS)}")
+        return cls(tuple(weights[key] for key in COST_FIELDS), **options)
+
+    @classmethod
+    def current(cls) -> RouterConfig:
+        """Snapshot of the module-level ``WEIGHTS``, bounds and tie-break order."""
+
+        return cls(
+            tuple(router_module.WEIGHTS[key] for key in COST_FIELDS),
+            cost_module.LATENCY_MIN_MS,
+            cost_module.LATENCY_MAX_MS,
+            cost_module.COST_MIN,
+            cost_module.COST_MAX,
+            tuple(router_module.TIE_BREAK_ORDER),
+        )
+
+    @property
+    def weights_map(self) -> Mapping[str, float]:
+        return dict(zip(COST_FIELDS, self.weights, strict=True))
+
+    def canonical_json(self) -> str:
+        """Canonical JSON of the configuration, the input of ``config_hash``."""
+
+        def routes(values: tuple[Hashable, ...]) -> list[str | int]:
+            return [_route_value(route) for route in values]
+
+        return json.dumps(
+            {
+                "weights": self.weights_map,
+                "latency_min_ms": self.latency_min_ms,
+                "latency_max_ms": self.latency_max_ms,
+                "cost_min": self.cost_min,
+                "cost_max": self.cost_max,
+                "tie_break_order": routes(self.tie_break_order),
+                "requires_network": routes(self.requires_network),
+                "offline_fallbacks": routes(self.offline_fallbacks),
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+
+
+DEFAULT_ROUTER_CONFIG = RouterConfig()
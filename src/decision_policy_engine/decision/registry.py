@@ -0,0 +1,222 @@
+"""Routing over an open set of route identifiers."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass, replace
+
+from decision_policy_engine.decision.compiled import (
+    CompiledRouter,
+    LazyRouteExplanation,
+    router_for,
+)
+from decision_policy_engine.decision.config import RouterConfig
+from decision_policy_engine.decision.router import TIE_BREAK_ORDER, RouteExplanation
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute
+
+
+@dataclass(frozen=True)
+class RankedRoute:
+    """One entry of a ``RouteRegistry.top_k`` fallback chain."""
+
+    route: Hashable
+    cost: CostVector
+    score: float
+    rank: int
+
+
+class RouteRegistry:
+    """Router over str or int route identifiers with explicit tie-break ranks.
+
+    ``routes`` is either a sequence (rank = position) or a mapping of route to
+    a unique integer rank; lower ranks win score ties. Routes in
+    ``requires_network`` are skipped when the network is unavailable, and
+    offline the first route of ``offline_fallbacks`` present among the
+    candidates is chosen without scoring. Scores use ``CompiledRouter`` with
+    ``weights`` (the router defaults) or the weights and bounds of ``config``,
+    so they are bit-identical to ``Router.select_route``. The registry's own
+    ranks, network mask and fallbacks take the place of those in ``config``;
+    the ``config`` property (and so the recorded ``config_hash``) describes
+    them, so routes must be str, int or str-Enum members to hash stably.
+    ``DEFAULT_ROUTE_REGISTRY`` reproduces the built-in four routes
+    exactly.
+    """
+
+    __slots__ = ("_ranks", "_requires_network", "_offline_fallbacks", "_scorer", "_config")
+
+    def __init__(
+        self,
+        routes: Iterable[Hashable] | Mapping[Hashable, int],
+        *,
+        requires_network: Iterable[Hashable] = (),
+        offline_fallbacks: Iterable[Hashable] = (),
+        weights: Mapping[str, float] | None = None,
+        config: RouterConfig | None = None,
+    ) -> None:
+        if isinstance(routes, Mapping):
+            ranks = {route: int(rank) for route, rank in routes.items()}
+        else:
+            ranks = {}
+            for route in routes:
+                if route in ranks:
+                    raise ValueError(f"Duplicate route {route!r}")
+                ranks[route] = len(ranks)
+        if not ranks:
+            raise ValueError("A route registry needs at least one route")
+        if len(set(ranks.values())) != len(ranks):
+            raise ValueError("Route ranks must be unique")
+        self._ranks = ranks
+        self._requires_network = frozenset(requires_network)
+        self._offline_fallbacks = tuple(offline_fallbacks)
+        for route in self._requires_network | set(self._offline_fallbacks):
+            if route not in ranks:
+                raise ValueError(f"{route!r} is not a registered route")
+        if self._requires_network & set(self._offline_fallbacks):
+            raise ValueError("Offline fallbacks cannot require the network")
+        if config is None:
+            self._scorer = CompiledRouter(weights)
+        elif weights is not None:
+            raise ValueError("Pass either weights or config, not both")
+        else:
+            self._scorer = router_for(config)
+        self._config = replace(
+            self._scorer.config,
+            tie_break_order=self.routes,
+            requires_network=tuple(self._requires_network),
+            offline_fallbacks=self._offline_fallbacks,
+        )
+
+    @property
+    def routes(self) -> tuple[Hashable, ...]:
+        """Registered routes in tie-break order."""
+
+        return tuple(sorted(self._ranks, key=self._ranks.__getitem__))
+
+    @property
+    def ranks(self) -> Mapping[Hashable, int]:
+        return dict(self._ranks)
+
+    @property
+    def weights(self) -> Mapping[str, float]:
+        return self._scorer.weights
+
+    @property
+    def config(self) -> RouterConfig:
+        """Scoring weights and bounds with this registry's route rules."""
+
+        return self._config
+
+    @property
+    def requires_network(self) -> frozenset[Hashable]:
+        return self._requires_network
+
+    @property
+    def offline_fallbacks(self) -> tuple[Hashable, ...]:
+        return self._offline_fallbacks
+
+    def rank(self, route: Hashable) -> int:
+        try:
+            return self._ranks[route]
+        except KeyError:
+            raise ValueError(f"{route!r} is not a registered route") from None
+
+    def score(self, cost: CostVector) -> float:
+        return self._scorer.score(cost)
+
+    def score_many(self, costs: Iterable[CostVector]) -> list[float]:
+        return self._scorer.score_many(costs)
+
+    def _offline_choice(self, candidates: Mapping[Hashable, CostVector]) -> Hashable | None:
+        for route in self._offline_fallbacks:
+            if route in candidates:
+                return route
+        return None
+
+    def _score_usable(
+        self,
+        candidates: Mapping[Hashable, CostVector],
+        network_available: bool,
+        exclude: Iterable[Hashable] = (),
+    ) -> tuple[list[Hashable], list[float]]:
+        ranks = self._ranks
+        unknown = [route for route in candidates if route not in ranks]
+        if unknown:
+            raise ValueError(f"{unknown[0]!r} is not a registered route")
+        skipped = set(exclude)
+        if not network_available:
+            skipped |= self._requires_network
+        if skipped:
+            usable = [route for route in candidates if route not in skipped]
+        else:
+            usable = list(candidates)
+        return usable, self._scorer.score_many([candidates[route] for route in usable])
+
+    def select_route(
+        self,
+        context: Context,
+        candidates: Mapping[Hashable, CostVector],
+    ) -> tuple[Hashable, CostVector, LazyRouteExplanation]:
+        """Select the best route in one pass over the candidates."""
+
+        network_available = context.network_available
+        chosen = None if network_available else self._offline_choice(candidates)
+        if chosen is None:
+            routes, scores = self._score_usable(candidates, network_available)
+            if not routes:
+                raise ValueError("No candidates available for routing.")
+            ranks = self._ranks
+            best = min(range(len(routes)), key=lambda i: (scores[i], ranks[routes[i]]))
+            chosen = routes[best]
+        return chosen, candidates[chosen], LazyRouteExplanation(self, candidates, network_available)
+
+    def top_k(
+        self,
+        context: Context,
+        candidates: Mapping[Hashable, CostVector],
+        k: int,
+    ) -> list[RankedRoute]:
+        """The ``k`` best usable routes, best first, for fallback chains.
+
+        The first entry is always what ``select_route`` picks. Offline, the
+        fallback routes present come first in fallback order, followed by the
+        other usable routes by score.
+        """
+
+        if k <= 0:
+            raise ValueError("k must be positive")
+        network_available = context.network_available
+        ranks = self._ranks
+        pinned = () if network_available else self._offline_fallbacks
+        head = [route for route in pinned if route in candidates]
+        routes, scores = self._score_usable(candidates, network_available, exclude=head)
+        if not head and not routes:
+            raise ValueError("No candidates available for routing.")
+        result = []
+        for route in head[:k]:
+            cost = candidates[route]
+            result.append(RankedRoute(route, cost, self._scorer.score(cost), ranks[route]))
+        entries = [
+            (score, ranks[route], route) for route, score in zip(routes, scores, strict=True)
+        ]
+        for score, rank, route in heapq.nsmallest(k - len(result), entries):
+            result.append(RankedRoute(route, candidates[route], score, rank))
+        return result
+
+    def explain(
+        self,
+        candidates: Mapping[Hashable, CostVector],
+        network_available: bool = True,
+    ) -> RouteExplanation:
+        """Full per-route explanation, as ``Router.select_route`` builds it."""
+
+        blocked = () if network_available else self._requires_network
+        usable = {route: cost for route, cost in candidates.items() if route not in blocked}
+        return self._scorer.explain(usable, True)
+
+
+DEFAULT_ROUTE_REGISTRY = RouteRegistry(
+    TIE_BREAK_ORDER,
+    requires_network=(ExecutionRoute.CLOUD,),
+    offline_fallbacks=(ExecutionRoute.LOCAL, ExecutionRoute.DEGRADED),
+)
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from array import array
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
+from decision_policy_engine.decision import cost as cost_module
 from decision_policy_engine.decision.cost import norm_cost, norm_latency
+from decision_policy_engine.metrics import METRICS
 from decision_policy_engine.models import Context, CostVector, ExecutionRoute
 
+try:  # Optional acceleration for batch routing.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
 WEIGHTS = {
     "latency_ms": 0.45,
     "privacy_risk": 0.25,
@@ -21,6 +29,10 @@ TIE_BREAK_ORDER = [
     ExecutionRoute.CLOUD,
     ExecutionRoute.DEGRADED,
 ]
+TIE_BREAK_RANKS = {route: rank for rank, route in enumerate(TIE_BREAK_ORDER)}
+
+
+COST_FIELDS = ("latency_ms", "privacy_risk", "reliability_risk", "dollar_cost")
 
 
 @dataclass(frozen=True)
@@ -30,6 +42,20 @@ class RouteExplanation:
     scores: Mapping[ExecutionRoute, float]
 
 
+@dataclass(frozen=True)
+class BatchRouteSelection:
+    """Result of routing a batch of requests over a shared set of routes.
+
+    ``costs`` holds the chosen ``COST_FIELDS`` row per request and ``scores`` the
+    per-route scores (``nan`` where a route was filtered out), both as NumPy arrays
+    when NumPy was used and as lists otherwise.
+    """
+
+    routes: list[ExecutionRoute]
+    costs: object
+    scores: object | None = None
+
+
 class Router:
     """Select an execution route based on weighted cost vectors."""
 
@@ -51,6 +77,20 @@ class Router:
     ) -> tuple[ExecutionRoute, CostVector, RouteExplanation]:
         """Select a route given the context and candidates."""
 
+        if not METRICS.enabled:
+            return Router._select_route(context, candidates, False)
+        result = METRICS.timed(
+            "dpe_route_selection_seconds", (), Router._select_route, context, candidates, True
+        )
+        METRICS.inc("dpe_routes_selected_total", (("route", result[0].value),))
+        return result
+
+    @staticmethod
+    def _select_route(
+        context: Context,
+        candidates: Mapping[ExecutionRoute, CostVector],
+        timed: bool,
+    ) -> tuple[ExecutionRoute, CostVector, RouteExplanation]:
         filtered: dict[ExecutionRoute, CostVector] = dict(candidates)
         if not context.network_available:
             filtered.pop(ExecutionRoute.CLOUD, None)
@@ -61,13 +101,15 @@ class Router:
         scores: dict[ExecutionRoute, float] = {}
         normalized_values: dict[ExecutionRoute, dict[str, float]] = {}
         for route, cost in filtered.items():
-            score, normalized = Router._score(cost)
+            if timed:
+                score, normalized = METRICS.timed(
+                    "dpe_route_score_seconds", (("route", route.value),), Router._score, cost
+                )
+            else:
+                score, normalized = Router._score(cost)
             scores[route] = score
             normalized_values[route] = normalized
 
-        def _tie_break(route: ExecutionRoute) -> int:
-            return TIE_BREAK_ORDER.index(route)
-
         if not context.network_available and ExecutionRoute.LOCAL in filtered:
             chosen_route = ExecutionRoute.LOCAL
         elif (
@@ -77,10 +119,13 @@ class Router:
         ):
             chosen_route = ExecutionRoute.DEGRADED
         else:
-            chosen_route = min(
-                scores,
-                key=lambda route: (scores[route], _tie_break(route)),
-            )
+            try:
+                chosen_route = min(
+                    scores,
+                    key=lambda route: (scores[route], TIE_BREAK_RANKS[route]),
+                )
+            except KeyError as exc:
+                raise ValueError(f"{exc.args[0]!r} is not in the tie-break order.") from None
 
         explanation = RouteExplanation(
             weights=WEIGHTS,
@@ -88,3 +133,172 @@ class Router:
             scores=scores,
         )
         return chosen_route, filtered[chosen_route], explanation
+
+    @staticmethod
+    def select_routes_batch(
+        contexts: Sequence[Context],
+        costs: object,
+        routes: Sequence[ExecutionRoute] = tuple(TIE_BREAK_ORDER),
+        *,
+        return_scores: bool = False,
+        use_numpy: bool | None = None,
+    ) -> BatchRouteSelection:
+        """Select routes for ``len(contexts)`` requests in one call.
+
+        ``costs`` is an N x R x 4 matrix (a NumPy array, nested sequences or a flat
+        ``array('d')``) whose route axis follows ``routes`` and whose last axis
+        follows ``COST_FIELDS``. Results match ``select_route`` exactly.
+        """
+
+        n_rows = len(contexts)
+        n_routes = len(routes)
+        if len(set(routes)) != n_routes:
+            raise ValueError("Batch routes must be unique.")
+        unknown = [route for route in routes if route not in TIE_BREAK_RANKS]
+        if unknown:
+            raise ValueError(f"{unknown[0]!r} is not in the tie-break order.")
+        ranks = [TIE_BREAK_RANKS[route] for route in routes]
+        # Columns in tie-break order so the first minimum wins ties.
+        order = sorted(range(n_routes), key=ranks.__getitem__)
+        offline = [index for index in order if routes[index] != ExecutionRoute.CLOUD]
+        if ExecutionRoute.LOCAL in routes:
+            offline_fixed: int | None = routes.index(ExecutionRoute.LOCAL)
+        elif ExecutionRoute.DEGRADED in routes:
+            offline_fixed = routes.index(ExecutionRoute.DEGRADED)
+        else:
+            offline_fixed = None
+        network = [context.network_available for context in contexts]
+        if not order or (not offline and not all(network)):
+            raise ValueError("No candidates available for routing.")
+
+        weights = tuple(WEIGHTS[key] for key in COST_FIELDS)
+        if use_numpy is None:
+            use_numpy = np is not None and not isinstance(costs, array)
+        if use_numpy:
+            if np is None:
+                raise RuntimeError("NumPy is required for use_numpy=True.")
+            return Router._select_batch_numpy(
+                network, costs, routes, order, offline, offline_fixed, weights, return_scores
+            )
+
+        flat = costs if isinstance(costs, array) else array(
+            "d",
+            (value for row in costs for cost in row for value in cost),
+        )
+        if len(flat) != n_rows * n_routes * 4:
+            raise ValueError("costs must have shape (len(contexts), len(routes), 4).")
+
+        latency_min = cost_module.LATENCY_MIN_MS
+        latency_span = cost_module.LATENCY_MAX_MS - latency_min
+        cost_min = cost_module.COST_MIN
+        cost_span = cost_module.COST_MAX - cost_min
+        w_latency, w_privacy, w_reliability, w_dollar = weights
+
+        chosen_routes: list[ExecutionRoute] = []
+        chosen_costs: list[tuple[float, ...]] = []
+        all_scores: list[list[float]] = []
+        for row, available in enumerate(network):
+            base = row * n_routes * 4
+            row_scores = [0.0] * n_routes
+            for index in range(n_routes):
+                start = base + index * 4
+                latency, privacy, reliability, dollar = flat[start : start + 4]
+                if latency_span <= 0:
+                    norm_lat = 0.0
+                else:
+                    norm_lat = max(0.0, min(1.0, (latency - latency_min) / latency_span))
+                if cost_span <= 0:
+                    norm_dollar = 0.0
+                else:
+                    norm_dollar = max(0.0, min(1.0, (dollar - cost_min) / cost_span))
+                row_scores[index] = (
+                    w_latency * norm_lat
+                    + w_privacy * privacy
+                    + w_reliability * reliability
+                    + w_dollar * norm_dollar
+                )
+
+            if available:
+                chosen = min(order, key=row_scores.__getitem__)
+            elif offline_fixed is not None:
+                chosen = offline_fixed
+            else:
+                chosen = min(offline, key=row_scores.__getitem__)
+
+            start = base + chosen * 4
+            chosen_routes.append(routes[chosen])
+            chosen_costs.append(tuple(flat[start : start + 4]))
+            if return_scores:
+                if not available:
+                    for index in range(n_routes):
+                        if routes[index] == ExecutionRoute.CLOUD:
+                            row_scores[index] = float("nan")
+                all_scores.append(row_scores)
+
+        return BatchRouteSelection(
+            routes=chosen_routes,
+            costs=chosen_costs,
+            scores=all_scores if return_scores else None,
+        )
+
+    @staticmethod
+    def _select_batch_numpy(
+        network: list[bool],
+        costs: object,
+        routes: Sequence[ExecutionRoute],
+        order: list[int],
+        offline: list[int],
+        offline_fixed: int | None,
+        weights: tuple[float, ...],
+        return_scores: bool,
+    ) -> BatchRouteSelection:
+        matrix = np.asarray(costs, dtype=np.float64)
+        n_rows, n_routes = len(network), len(routes)
+        if matrix.size == n_rows * n_routes * 4:
+            matrix = matrix.reshape(n_rows, n_routes, 4)
+        if matrix.shape != (n_rows, n_routes, 4):
+            raise ValueError("costs must have shape (len(contexts), len(routes), 4).")
+
+        latency_min = cost_module.LATENCY_MIN_MS
+        latency_span = cost_module.LATENCY_MAX_MS - latency_min
+        cost_min = cost_module.COST_MIN
+        cost_span = cost_module.COST_MAX - cost_min
+        if latency_span <= 0:
+            norm_lat = np.zeros((n_rows, n_routes))
+        else:
+            norm_lat = np.maximum(
+                0.0, np.minimum(1.0, (matrix[:, :, 0] - latency_min) / latency_span)
+            )
+        if cost_span <= 0:
+            norm_dollar = np.zeros((n_rows, n_routes))
+        else:
+            norm_dollar = np.maximum(
+                0.0, np.minimum(1.0, (matrix[:, :, 3] - cost_min) / cost_span)
+            )
+        # Same operation order as ``sum`` in ``_score`` keeps results bit-identical.
+        scores = (
+            weights[0] * norm_lat
+            + weights[1] * matrix[:, :, 1]
+            + weights[2] * matrix[:, :, 2]
+            + weights[3] * norm_dollar
+        )
+
+        online_order = np.asarray(order, dtype=np.intp)
+        chosen = online_order[np.argmin(scores[:, online_order], axis=1)]
+        available = np.asarray(network, dtype=bool)
+        if not available.all():
+            if offline_fixed is not None:
+                chosen[~available] = offline_fixed
+            else:
+                offline_order = np.asarray(offline, dtype=np.intp)
+                offline_rows = scores[~available][:, offline_order]
+                chosen[~available] = offline_order[np.argmin(offline_rows, axis=1)]
+            if return_scores:
+                cloud = [i for i, route in enumerate(routes) if route == ExecutionRoute.CLOUD]
+                scores[np.ix_(~available, cloud)] = np.nan
+
+        return BatchRouteSelection(
+            routes=[routes[index] for index in chosen.tolist()],
+            costs=matrix[np.arange(n_rows), chosen],
+            scores=scores if return_scores else None,
+        )
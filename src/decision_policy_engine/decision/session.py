@@ -0,0 +1,178 @@
+"""Stateful routing for a candidate set that outlives single decisions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable, Mapping
+
+from decision_policy_engine.decision.compiled import LazyRouteExplanation
+from decision_policy_engine.decision.registry import DEFAULT_ROUTE_REGISTRY, RouteRegistry
+from decision_policy_engine.models import Context, CostVector
+
+CostBuilder = Callable[[Context], CostVector]
+
+
+class RoutingSession:
+    """Route repeatedly over the same candidates while the context changes.
+
+    Candidate scores are computed once and cached; ``update`` rescores only the
+    routes it is given. Routes in ``dynamic`` are built from the context by
+    their builder and are rebuilt only when one of the ``depends_on`` context
+    fields differs from the previous decision, and rescored only when the
+    rebuilt cost differs. The network filter toggles a mask precomputed from
+    the registry instead of copying the candidates, and the best route for each
+    network state is kept until a score change can affect it.
+
+    Decisions are identical to ``registry.select_route(context, candidates)``
+    (``Router.select_route`` for the default registry), where ``candidates``
+    is the session's current candidate mapping. Instances are not thread-safe.
+    """
+
+    def __init__(
+        self,
+        candidates: Mapping[Hashable, CostVector],
+        *,
+        dynamic: Mapping[Hashable, CostBuilder] | None = None,
+        depends_on: Iterable[str] = ("rtt_ms",),
+        registry: RouteRegistry = DEFAULT_ROUTE_REGISTRY,
+    ) -> None:
+        dynamic = dict(dynamic or {})
+        overlap = [route for route in dynamic if route in candidates]
+        if overlap:
+            raise ValueError(f"{overlap[0]!r} is both a static and a dynamic candidate")
+        self._registry = registry
+        self._builders = dynamic
+        self._depends_on = tuple(depends_on)
+        for name in self._depends_on:
+            if name not in Context.__dataclass_fields__:
+                raise ValueError(f"Unknown context field {name!r}")
+        self._context_key: tuple | None = None
+        self._routes: list[Hashable] = []
+        self._index: dict[Hashable, int] = {}
+        self._ranks: list[int] = []
+        self._online_only: list[bool] = []
+        self._scores: list[float] = []
+        self._costs: dict[Hashable, CostVector] = {}
+        self._best: dict[bool, int | None] = {}
+        self._pinned: Hashable | None = None
+        self._add(dict(candidates))
+
+    @property
+    def candidates(self) -> Mapping[Hashable, CostVector]:
+        """Current candidates, including the last costs built for dynamic routes."""
+
+        return dict(self._costs)
+
+    @property
+    def scores(self) -> Mapping[Hashable, float]:
+        """Cached score of every candidate."""
+
+        return dict(zip(self._routes, self._scores, strict=True))
+
+    def _add(self, costs: dict[Hashable, CostVector]) -> None:
+        requires_network = self._registry.requires_network
+        # Rank every new route first so an unregistered one leaves no partial state.
+        new_ranks = {
+            route: self._registry.rank(route) for route in costs if route not in self._index
+        }
+        for route, rank in new_ranks.items():
+            self._index[route] = len(self._routes)
+            self._routes.append(route)
+            self._ranks.append(rank)
+            self._online_only.append(route in requires_network)
+            self._scores.append(0.0)
+        self._costs = {**self._costs, **costs}
+        self._pinned = next(
+            (route for route in self._registry.offline_fallbacks if route in self._costs), None
+        )
+        self._best.clear()
+        self._rescore(costs)
+
+    def update(self, changes: Mapping[Hashable, CostVector]) -> None:
+        """Replace or add static candidate costs, rescoring only those routes."""
+
+        dynamic = [route for route in changes if route in self._builders]
+        if dynamic:
+            raise ValueError(f"{dynamic[0]!r} is a dynamic candidate")
+        changed = {
+            route: cost for route, cost in changes.items() if self._costs.get(route) != cost
+        }
+        if not changed:
+            return
+        if any(route not in self._index for route in changed):
+            self._add(changed)
+            return
+        # Copy on write keeps explanations handed out earlier consistent.
+        self._costs = {**self._costs, **changed}
+        self._rescore(changed)
+
+    def _rescore(self, changed: Mapping[Hashable, CostVector]) -> None:
+        index = self._index
+        positions = [index[route] for route in changed]
+        new_scores = self._registry.score_many(changed.values())
+        scores = self._scores
+        for position, score in zip(positions, new_scores, strict=True):
+            scores[position] = score
+        ranks = self._ranks
+        for network_available, best in list(self._best.items()):
+            if best is None or best in positions:
+                del self._best[network_available]
+                continue
+            best_key = (scores[best], ranks[best])
+            if any(
+                (scores[position], ranks[position]) < best_key
+                and (network_available or not self._online_only[position])
+                for position in positions
+            ):
+                del self._best[network_available]
+
+    def _refresh_dynamic(self, context: Context) -> None:
+        key = tuple(getattr(context, name) for name in self._depends_on)
+        if key == self._context_key:
+            return
+        built = {route: builder(context) for route, builder in self._builders.items()}
+        if all(route in self._index for route in built):
+            changed = {
+                route: cost for route, cost in built.items() if self._costs[route] != cost
+            }
+            if changed:
+                self._costs = {**self._costs, **changed}
+                self._rescore(changed)
+        else:
+            self._add(built)
+        # Only remember the context once every builder succeeded, so a failed
+        # refresh is retried instead of routing on the previous costs.
+        self._context_key = key
+
+    def _argmin(self, network_available: bool) -> int | None:
+        scores, ranks, online_only = self._scores, self._ranks, self._online_only
+        best = None
+        best_key = None
+        for position in range(len(scores)):
+            if not network_available and online_only[position]:
+                continue
+            key = (scores[position], ranks[position])
+            if best_key is None or key < best_key:
+                best, best_key = position, key
+        return best
+
+    def select_route(
+        self,
+        context: Context,
+    ) -> tuple[Hashable, CostVector, LazyRouteExplanation]:
+        """Select a route for ``context`` using the cached scores."""
+
+        if self._builders:
+            self._refresh_dynamic(context)
+        network_available = context.network_available
+        if not network_available and self._pinned is not None:
+            route = self._pinned
+        else:
+            try:
+                best = self._best[network_available]
+            except KeyError:
+                best = self._best[network_available] = self._argmin(network_available)
+            if best is None:
+                raise ValueError("No candidates available for routing.")
+            route = self._routes[best]
+        costs = self._costs
+        return route, costs[route], LazyRouteExplanation(self._registry, costs, network_available)
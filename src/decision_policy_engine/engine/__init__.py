@@ -0,0 +1,20 @@
+"""Decision engines combining the policy gate, router and audit trail."""
+
+from .async_engine import AsyncDecisionEngine
+from .core import Decision, DecisionRequest, make_decision
+from .replay import ReplayChange, ReplayReport, replay_log
+from .sharded import ShardedDecisionEngine, ShardedVerificationReport, shard_for, verify_sharded
+
+__all__ = [
+    "AsyncDecisionEngine",
+    "Decision",
+    "DecisionRequest",
+    "ReplayChange",
+    "ReplayReport",
+    "ShardedDecisionEngine",
+    "ShardedVerificationReport",
+    "make_decision",
+    "replay_log",
+    "shard_for",
+    "verify_sharded",
+]
@@ -0,0 +1,177 @@
+"""asyncio decision pipeline with a background audit writer."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from types import TracebackType
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import AuditChain, redact_inputs
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.engine.core import Decision, make_decision
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+from decision_policy_engine.policy.policy_gate import PolicyGate
+
+_STOP = object()
+
+
+class AsyncDecisionEngine:
+    """Decide inline on the event loop and chain audit events in the background.
+
+    ``decide`` runs the policy gate and router directly (both are pure CPU
+    work) and puts the audit event on a bounded queue; when the queue is full
+    callers wait, which bounds memory under load. A single writer task drains
+    the queue in FIFO order and hands each batch of up to ``batch_size`` events
+    to ``AuditChain.extend`` in a worker thread, so the chain order is exactly
+    the order in which ``decide`` enqueued its events and file I/O never runs
+    on the loop. A failed write is re-raised by the next ``decide``, ``flush``
+    or ``aclose``.
+    """
+
+    def __init__(
+        self,
+        audit_path: str | Path,
+        *,
+        gate: object = PolicyGate,
+        router: object = Router,
+        redactor: Callable[[Context, ProposedAction], Mapping[str, object]] = redact_inputs,
+        max_pending: int = 1024,
+        batch_size: int = 256,
+        fsync: bool = False,
+    ) -> None:
+        if max_pending <= 0 or batch_size <= 0:
+            raise ValueError("max_pending and batch_size must be positive")
+        self.audit_path = Path(audit_path)
+        self._gate = gate
+        self._router = router
+        self._redactor = redactor
+        self._max_pending = max_pending
+        self._batch_size = batch_size
+        self._fsync = fsync
+        self._chain: AuditChain | None = None
+        self._queue: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+        self._start_lock = asyncio.Lock()
+        self._error: BaseException | None = None
+
+    async def start(self) -> None:
+        """Open the audit chain and start the writer task (idempotent).
+
+        Concurrent callers share one startup, so an engine started lazily by
+        several ``decide`` calls at once still has a single chain and writer.
+        """
+
+        if self._writer is not None:
+            return
+        async with self._start_lock:
+            if self._writer is not None:
+                return
+            self._chain = await asyncio.to_thread(
+                AuditChain, self.audit_path, fsync=self._fsync
+            )
+            self._queue = asyncio.Queue(self._max_pending)
+            self._writer = asyncio.create_task(self._write_loop())
+
+    @property
+    def last_hash(self) -> str | None:
+        """Hash of the last event written (pending events are not included)."""
+
+        return None if self._chain is None else self._chain.last_hash
+
+    @property
+    def pending(self) -> int:
+        """Number of queued events not yet handed to the writer."""
+
+        return 0 if self._queue is None else self._queue.qsize()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("audit writer failed") from self._error
+
+    async def decide(
+        self,
+        context: Context,
+        action: ProposedAction,
+        candidates: Mapping[ExecutionRoute, CostVector],
+        *,
+        trace_id: str | None = None,
+        decision_id: str | None = None,
+    ) -> Decision:
+        """Evaluate and route one action and queue its audit event.
+
+        Returns once the event is queued, not when it is written; use
+        ``flush`` to wait for durability.
+        """
+
+        self._raise_if_failed()
+        if self._writer is None:
+            await self.start()
+        decision = make_decision(
+            context,
+            action,
+            candidates,
+            gate=self._gate,
+            router=self._router,
+            trace_id=trace_id,
+            decision_id=decision_id,
+            redactor=self._redactor,
+        )
+        await self._queue.put(decision.event)
+        return decision
+
+    async def _write_loop(self) -> None:
+        queue = self._queue
+        while True:
+            item = await queue.get()
+            batch: list[AuditEvent] = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+            while not stop and len(batch) < self._batch_size and not queue.empty():
+                item = queue.get_nowait()
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            try:
+                if batch and self._error is None:
+                    await asyncio.to_thread(self._chain.extend, batch)
+            except Exception as exc:  # surfaced to callers by _raise_if_failed
+                self._error = exc
+            finally:
+                for _ in range(len(batch) + stop):
+                    queue.task_done()
+            if stop:
+                return
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been written."""
+
+        if self._queue is not None:
+            await self._queue.join()
+        self._raise_if_failed()
+
+    async def aclose(self) -> None:
+        """Write pending events, stop the writer and close the log."""
+
+        if self._writer is not None:
+            await self._queue.put(_STOP)
+            await self._writer
+            self._writer = None
+        if self._chain is not None:
+            await asyncio.to_thread(self._chain.close)
+        self._raise_if_failed()
+
+    async def __aenter__(self) -> AsyncDecisionEngine:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
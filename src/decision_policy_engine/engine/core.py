@@ -0,0 +1,78 @@
+"""Shared decision flow: policy gate, routing and audit event construction."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import redact_inputs
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
+from decision_policy_engine.policy.policy_gate import PolicyGate
+
+
+@dataclass(frozen=True)
+class Decision:
+    """Outcome of one decision and its (not yet chained) audit event."""
+
+    policy_decision: PolicyDecision
+    reason: str
+    route: ExecutionRoute
+    cost: CostVector
+    explanation: object
+    event: AuditEvent
+
+
+def make_decision(
+    context: Context,
+    action: ProposedAction,
+    candidates: Mapping[ExecutionRoute, CostVector],
+    *,
+    gate: object = PolicyGate,
+    router: object = Router,
+    trace_id: str | None = None,
+    decision_id: str | None = None,
+    redactor: Callable[[Context, ProposedAction], Mapping[str, object]] = redact_inputs,
+) -> Decision:
+    """Run the gate and router and build the audit event, as ``run_scenario`` does.
+
+    ``redactor`` builds ``inputs_redacted``; pass a ``Redactor`` to drop,
+    truncate or hash metadata keys. Routers with a ``RouterConfig`` (compiled
+    routers and registries) have its hash recorded as ``config_hash``.
+    """
+
+    policy_decision, reason = gate.evaluate(context, action)
+    route, cost, explanation = router.select_route(context, candidates)
+    event = AuditEvent(
+        timestamp_iso=datetime.now(timezone.utc).isoformat(),
+        trace_id=trace_id or str(uuid4()),
+        decision_id=decision_id or str(uuid4()),
+        action_type=action.type,
+        policy_decision=policy_decision,
+        route_selected=route,
+        cost_vector=cost,
+        reason=reason,
+        inputs_redacted=redactor(context, action),
+        config_hash=getattr(getattr(router, "config", None), "config_hash", None),
+    )
+    return Decision(policy_decision, reason, route, cost, explanation, event)
+
+
+@dataclass(frozen=True)
+class DecisionRequest:
+    """Inputs for one decision, for batch and out-of-process engines."""
+
+    context: Context
+    action: ProposedAction
+    candidates: Mapping[ExecutionRoute, CostVector]
+    trace_id: str | None = None
+    decision_id: str | None = None
@@ -0,0 +1,355 @@
+"""What-if replay of recorded decisions under an alternative configuration."""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import itertools
+import json
+import sys
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+
+from decision_policy_engine.audit.rotation import iter_segment_lines
+from decision_policy_engine.decision.config import RouterConfig
+from decision_policy_engine.decision.registry import RouteRegistry
+from decision_policy_engine.decision.router import TIE_BREAK_ORDER
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+from decision_policy_engine.policy.rules import DEFAULT_RULE_TABLE, RuleTable, load_rules
+
+CandidateBuilder = Callable[[Context, ProposedAction], Mapping[ExecutionRoute, CostVector]]
+
+_CONTEXT_FIELDS = tuple(item.name for item in fields(Context))
+
+
+@dataclass(frozen=True)
+class ReplayChange:
+    """One recorded decision whose outcome differs under the candidate configuration."""
+
+    decision_id: str
+    recorded_policy: str
+    replayed_policy: str
+    recorded_route: str
+    replayed_route: str
+
+
+@dataclass
+class _Tally:
+    events: int = 0
+    skipped: int = 0
+    changed: int = 0
+    policy: Counter = field(default_factory=Counter)
+    routes: Counter = field(default_factory=Counter)
+    configs: Counter = field(default_factory=Counter)
+    examples: list[ReplayChange] = field(default_factory=list)
+
+    def merge(self, other: _Tally, max_examples: int) -> None:
+        self.events += other.events
+        self.skipped += other.skipped
+        self.changed += other.changed
+        self.policy.update(other.policy)
+        self.routes.update(other.routes)
+        self.configs.update(other.configs)
+        self.examples.extend(other.examples[: max_examples - len(self.examples)])
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    """Recorded vs replayed outcomes of a log.
+
+    ``policy_transitions`` and ``route_transitions`` count
+    ``(recorded, replayed)`` pairs, unchanged pairs included, so they break
+    changes down by outcome. Routes are only replayed when a candidate
+    builder was given; otherwise ``route_transitions`` is empty. ``skipped``
+    events were lines that are not JSON audit records (e.g. a torn final
+    write) or whose inputs could not be turned back into a ``Context`` and
+    ``ProposedAction`` (e.g. fields removed by redaction).
+    ``config_hashes`` counts the ``RouterConfig`` hashes the events were
+    recorded under (``None`` for events without one).
+    """
+
+    events: int
+    replayed: int
+    skipped: int
+    changed: int
+    policy_transitions: Mapping[tuple[str, str], int]
+    route_transitions: Mapping[tuple[str, str], int]
+    examples: tuple[ReplayChange, ...]
+    elapsed_s: float
+    config_hashes: Mapping[str | None, int] = field(default_factory=dict)
+
+    @property
+    def policy_changed(self) -> int:
+        return sum(count for (old, new), count in self.policy_transitions.items() if old != new)
+
+    @property
+    def route_changed(self) -> int:
+        return sum(count for (old, new), count in self.route_transitions.items() if old != new)
+
+    @property
+    def events_per_s(self) -> float:
+        return self.events / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+def reconstruct_inputs(inputs: Mapping[str, object]) -> tuple[Context, ProposedAction]:
+    """Rebuild the ``Context`` and ``ProposedAction`` recorded in ``inputs_redacted``.
+
+    Raises ``ValueError`` when required fields are missing or invalid.
+    Metadata is used as recorded, so redacted values stay redacted.
+    """
+
+    try:
+        context_data = inputs["context"]
+        action_data = inputs["action"]
+        context = Context(
+            **{name: context_data[name] for name in _CONTEXT_FIELDS if name in context_data}
+        )
+        action = ProposedAction(
+            type=action_data["type"],
+            risk_level=action_data["risk_level"],
+            metadata=dict(action_data.get("metadata", {})),
+        )
+    except (KeyError, TypeError, AttributeError) as exc:
+        raise ValueError(f"Cannot reconstruct decision inputs: {exc!r}") from exc
+    return context, action
+
+
+class _Replayer:
+    def __init__(
+        self,
+        rules: RuleTable,
+        weights: Mapping[str, float] | None,
+        config: RouterConfig | None,
+        candidates: CandidateBuilder | None,
+        max_examples: int,
+    ) -> None:
+        self._rules = rules
+        if config is None:
+            self._registry = RouteRegistry(
+                TIE_BREAK_ORDER,
+                requires_network=[ExecutionRoute.CLOUD],
+                offline_fallbacks=[ExecutionRoute.LOCAL, ExecutionRoute.DEGRADED],
+                weights=weights,
+            )
+        else:
+            self._registry = RouteRegistry(
+                config.tie_break_order,
+                requires_network=config.requires_network,
+                offline_fallbacks=config.offline_fallbacks,
+                config=config,
+            )
+        self._candidates = candidates
+        self._max_examples = max_examples
+
+    def run(self, lines: list[bytes]) -> _Tally:
+        tally = _Tally()
+        evaluate = self._rules.evaluate
+        build = self._candidates
+        select_route = self._registry.select_route
+        for raw in lines:
+            if not raw.strip():
+                continue
+            tally.events += 1
+            try:
+                record = json.loads(raw)
+                recorded_policy = record["policy_decision"]
+                recorded_route = record["route_selected"]
+                decision_id = record["decision_id"]
+                tally.configs[record.get("config_hash")] += 1
+                context, action = reconstruct_inputs(record["inputs_redacted"])
+            except (ValueError, KeyError, TypeError, AttributeError):
+                tally.skipped += 1
+                continue
+            replayed_policy = evaluate(context, action)[0].value
+            tally.policy[(recorded_policy, replayed_policy)] += 1
+            replayed_route = recorded_route
+            if build is not None:
+                replayed_route = select_route(context, build(context, action))[0].value
+                tally.routes[(recorded_route, replayed_route)] += 1
+            if replayed_policy != recorded_policy or replayed_route != recorded_route:
+                tally.changed += 1
+                if len(tally.examples) < self._max_examples:
+                    tally.examples.append(
+                        ReplayChange(
+                            decision_id,
+                            recorded_policy,
+                            replayed_policy,
+                            recorded_route,
+                            replayed_route,
+                        )
+                    )
+        return tally
+
+
+_replayer: _Replayer | None = None
+
+
+def _init_replayer(
+    rules: RuleTable,
+    weights: Mapping[str, float] | None,
+    config: RouterConfig | None,
+    candidates: CandidateBuilder | None,
+    max_examples: int,
+) -> None:
+    global _replayer
+    _replayer = _Replayer(rules, weights, config, candidates, max_examples)
+
+
+def _replay_chunk(lines: list[bytes]) -> _Tally:
+    return _replayer.run(lines)
+
+
+def _source_lines(source: str | Path | Iterable[bytes]) -> Iterator[bytes]:
+    if not isinstance(source, (str, Path)):
+        yield from source
+        return
+    path = Path(source)
+    if path.is_dir():
+        yield from iter_segment_lines(path)
+        return
+    with open(path, "rb") as handle:
+        yield from handle
+
+
+def replay_log(
+    source: str | Path | Iterable[bytes],
+    *,
+    rules: RuleTable | None = None,
+    weights: Mapping[str, float] | None = None,
+    config: RouterConfig | None = None,
+    candidates: CandidateBuilder | None = None,
+    workers: int = 1,
+    chunk_size: int = 4096,
+    max_examples: int = 20,
+) -> ReplayReport:
+    """Re-run recorded decisions through candidate ``rules`` and ``weights``.
+
+    ``source`` is a JSONL audit log, a directory of rotated segments or an
+    iterable of raw lines. Each event's ``inputs_redacted`` is turned back
+    into a ``Context`` and ``ProposedAction`` and evaluated with ``rules``
+    (default: the built-in rules) and, when ``candidates`` builds the route
+    candidates for those inputs, routed with ``weights`` (default: the router
+    weights). A ``RouterConfig`` may be given instead of ``weights`` to
+    replay routes under exact weights, bounds and tie-break order; compare
+    its ``config_hash`` with the report's ``config_hashes`` to check a replay
+    reproduces the configuration the log was recorded under. Outcomes are
+    compared with the recorded ones.
+
+    Events are streamed in chunks of ``chunk_size`` lines; with ``workers >
+    1`` chunks are replayed in a process pool with at most ``2 * workers``
+    in flight, and only counters are merged back, so memory is bounded
+    regardless of log size. ``candidates`` must be picklable when
+    ``workers > 1``.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if (weights is not None or config is not None) and candidates is None:
+        raise ValueError("Replaying routes with new weights needs a candidates builder")
+    if weights is not None and config is not None:
+        raise ValueError("Pass either weights or config, not both")
+    started = time.perf_counter()
+    setup = (rules or DEFAULT_RULE_TABLE, weights, config, candidates, max_examples)
+    lines = _source_lines(source)
+    chunks = iter(lambda: list(itertools.islice(lines, chunk_size)), [])
+    total = _Tally()
+    if workers <= 1:
+        replayer = _Replayer(*setup)
+        for chunk in chunks:
+            total.merge(replayer.run(chunk), max_examples)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_replayer, initargs=setup
+        ) as pool:
+            pending: deque[Future[_Tally]] = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_replay_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    total.merge(pending.popleft().result(), max_examples)
+            while pending:
+                total.merge(pending.popleft().result(), max_examples)
+
+    return ReplayReport(
+        events=total.events,
+        replayed=total.events - total.skipped,
+        skipped=total.skipped,
+        changed=total.changed,
+        policy_transitions=dict(total.policy),
+        route_transitions=dict(total.routes),
+        examples=tuple(total.examples),
+        elapsed_s=time.perf_counter() - started,
+        config_hashes=dict(total.configs),
+    )
+
+
+def _load_callable(spec: str) -> CandidateBuilder:
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"Expected 'module:function', got {spec!r}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Replay an audit log from the command line; exit status 1 if any decision changes."""
+
+    parser = argparse.ArgumentParser(description="Replay an audit log under candidate rules.")
+    parser.add_argument("source", type=Path, help="log file, or directory of rotated segments")
+    parser.add_argument("--rules", type=Path, default=None, help="JSON or TOML rule file")
+    parser.add_argument("--weights", default=None, help="router weights as a JSON object")
+    parser.add_argument("--candidates", default=None, help="candidate builder, module:function")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = replay_log(
+        args.source,
+        rules=load_rules(args.rules) if args.rules else None,
+        weights=json.loads(args.weights) if args.weights else None,
+        candidates=_load_callable(args.candidates) if args.candidates else None,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    if args.json:
+        payload = {
+            "events": report.events,
+            "replayed": report.replayed,
+            "skipped": report.skipped,
+            "changed": report.changed,
+            "policy_changed": report.policy_changed,
+            "route_changed": report.route_changed,
+            "policy_transitions": [
+                [old, new, count] for (old, new), count in sorted(report.policy_transitions.items())
+            ],
+            "route_transitions": [
+                [old, new, count] for (old, new), count in sorted(report.route_transitions.items())
+            ],
+            "examples": [asdict(change) for change in report.examples],
+            "config_hashes": [
+                [config_hash, count]
+                for config_hash, count in sorted(
+                    report.config_hashes.items(), key=lambda item: item[0] or ""
+                )
+            ],
+            "elapsed_s": report.elapsed_s,
+        }
+        print(json.dumps(payload, sort_keys=True))
+    else:
+        print(f"{report.changed} of {report.replayed} decisions change "
+              f"({report.skipped} skipped, {report.events_per_s:,.0f} events/s)")
+        for title, transitions in (
+            ("policy", report.policy_transitions),
+            ("route", report.route_transitions),
+        ):
+            for (old, new), count in sorted(transitions.items()):
+                if old != new:
+                    print(f"  {title} {old} -> {new}: {count}")
+    return 1 if report.changed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
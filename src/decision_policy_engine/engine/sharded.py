@@ -0,0 +1,286 @@
+"""Multi-process decision engine with one audit chain per shard."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from hashlib import sha256
+from pathlib import Path
+from types import TracebackType
+from uuid import uuid4
+
+from decision_policy_engine.audit.trace import AuditChain
+from decision_policy_engine.audit.verify import VerificationReport, verify_chain
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.engine.core import Decision, DecisionRequest, make_decision
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+from decision_policy_engine.policy.policy_gate import PolicyGate
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+_shard_chain: AuditChain | None = None
+
+
+def shard_for(trace_id: str, shards: int) -> int:
+    """Stable shard index for ``trace_id`` (independent of ``PYTHONHASHSEED``)."""
+
+    digest = sha256(trace_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def shard_path(directory: str | Path, index: int) -> Path:
+    return Path(directory) / f"shard-{index:03d}.jsonl"
+
+
+def root_hash(tails: Sequence[str | None]) -> str:
+    """Root hash over the ordered shard tail hashes."""
+
+    payload = json.dumps(list(tails), separators=(",", ":"))
+    return sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _init_shard(path: str, fsync: bool) -> None:
+    global _shard_chain
+    _shard_chain = AuditChain(path, fsync=fsync)
+
+
+def _decide_batch(
+    requests: Sequence[DecisionRequest], gate: object, router: object
+) -> list[Decision]:
+    decisions = [
+        make_decision(
+            request.context,
+            request.action,
+            request.candidates,
+            gate=gate,
+            router=router,
+            trace_id=request.trace_id,
+            decision_id=request.decision_id,
+        )
+        for request in requests
+    ]
+    sealed = _shard_chain.extend([decision.event for decision in decisions])
+    return [
+        replace(decision, event=event) for decision, event in zip(decisions, sealed, strict=True)
+    ]
+
+
+def _shard_last_hash() -> str | None:
+    return _shard_chain.last_hash
+
+
+@dataclass(frozen=True)
+class ShardedVerificationReport:
+    """Per-shard chain verification plus the manifest root check."""
+
+    ok: bool
+    root_hash: str
+    shards: tuple[VerificationReport, ...]
+    error: str | None = None
+
+    @property
+    def events(self) -> int:
+        return sum(report.events for report in self.shards)
+
+
+class ShardedDecisionEngine:
+    """Spread decisions over worker processes, one audit chain per shard.
+
+    Each shard is a single-process ``ProcessPoolExecutor`` that owns
+    ``shard-NNN.jsonl`` in ``directory``; a request goes to shard
+    ``shard_for(trace_id, shards)``, so all events of a trace land in one chain
+    in submission order. ``write_manifest`` (also run by ``close``) records
+    every shard's tail hash and a ``root_hash`` over them, which
+    ``verify_sharded`` checks against the shard files. ``gate`` and ``router``
+    are sent to the workers and must be picklable.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        shards: int | None = None,
+        gate: object = PolicyGate,
+        router: object = Router,
+        fsync: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        manifest = read_manifest(self.directory)
+        if shards is None:
+            shards = len(manifest["shards"]) if manifest else os.cpu_count() or 1
+        if shards <= 0:
+            raise ValueError("shards must be positive")
+        if manifest and len(manifest["shards"]) != shards:
+            raise ValueError(
+                f"{self.directory} holds {len(manifest['shards'])} shards, not {shards}"
+            )
+        self.shards = shards
+        self._gate = gate
+        self._router = router
+        self._executors: list[ProcessPoolExecutor] | None = [
+            ProcessPoolExecutor(
+                max_workers=1,
+                initializer=_init_shard,
+                initargs=(str(shard_path(self.directory, index)), fsync),
+            )
+            for index in range(shards)
+        ]
+
+    def _executor(self, index: int) -> ProcessPoolExecutor:
+        if self._executors is None:
+            raise ValueError("ShardedDecisionEngine is closed")
+        return self._executors[index]
+
+    def submit_batch(self, shard: int, requests: Sequence[DecisionRequest]) -> Future:
+        """Decide ``requests`` on one shard; the future yields sealed decisions."""
+
+        return self._executor(shard).submit(_decide_batch, list(requests), self._gate, self._router)
+
+    def submit(
+        self,
+        context: Context,
+        action: ProposedAction,
+        candidates: Mapping[ExecutionRoute, CostVector],
+        *,
+        trace_id: str | None = None,
+        decision_id: str | None = None,
+    ) -> Future:
+        """Queue one decision on its trace's shard; the future yields a list of one."""
+
+        trace_id = trace_id or str(uuid4())
+        request = DecisionRequest(context, action, candidates, trace_id, decision_id)
+        return self.submit_batch(shard_for(trace_id, self.shards), [request])
+
+    def decide(
+        self,
+        context: Context,
+        action: ProposedAction,
+        candidates: Mapping[ExecutionRoute, CostVector],
+        *,
+        trace_id: str | None = None,
+        decision_id: str | None = None,
+    ) -> Decision:
+        """Decide one action and return it with its sealed audit event."""
+
+        future = self.submit(
+            context, action, candidates, trace_id=trace_id, decision_id=decision_id
+        )
+        return future.result()[0]
+
+    def decide_many(
+        self, requests: Iterable[DecisionRequest], *, chunk_size: int = 512
+    ) -> list[Decision]:
+        """Decide many requests in parallel; results follow the input order.
+
+        Requests are grouped by shard and sent in chunks of ``chunk_size`` to
+        amortize inter-process overhead.
+        """
+
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        buckets: list[list[tuple[int, DecisionRequest]]] = [[] for _ in range(self.shards)]
+        count = 0
+        for position, request in enumerate(requests):
+            if request.trace_id is None:
+                request = replace(request, trace_id=str(uuid4()))
+            buckets[shard_for(request.trace_id, self.shards)].append((position, request))
+            count = position + 1
+
+        pending: list[tuple[list[int], Future]] = []
+        for shard, bucket in enumerate(buckets):
+            for start in range(0, len(bucket), chunk_size):
+                chunk = bucket[start : start + chunk_size]
+                future = self.submit_batch(shard, [request for _, request in chunk])
+                pending.append(([position for position, _ in chunk], future))
+
+        results: list[Decision | None] = [None] * count
+        for positions, future in pending:
+            for position, decision in zip(positions, future.result(), strict=True):
+                results[position] = decision
+        return results
+
+    def tails(self) -> list[str | None]:
+        """Tail hash of every shard after all previously submitted work."""
+
+        futures = [self._executor(index).submit(_shard_last_hash) for index in range(self.shards)]
+        return [future.result() for future in futures]
+
+    def write_manifest(self) -> dict[str, object]:
+        """Write ``manifest.json`` with the shard tails and their root hash."""
+
+        tails = self.tails()
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "shards": [
+                {"path": shard_path(self.directory, index).name, "last_hash": tail}
+                for index, tail in enumerate(tails)
+            ],
+            "root_hash": root_hash(tails),
+        }
+        target = self.directory / MANIFEST_NAME
+        temporary = target.with_name(target.name + ".tmp")
+        temporary.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+        os.replace(temporary, target)
+        return manifest
+
+    def close(self) -> None:
+        """Write the manifest and stop the shard processes."""
+
+        if self._executors is None:
+            return
+        try:
+            self.write_manifest()
+        finally:
+            for executor in self._executors:
+                executor.shutdown()
+            self._executors = None
+
+    def __enter__(self) -> ShardedDecisionEngine:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def read_manifest(directory: str | Path) -> dict[str, object] | None:
+    """Load ``manifest.json`` from a shard directory, or ``None`` if absent."""
+
+    path = Path(directory) / MANIFEST_NAME
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def verify_sharded(directory: str | Path, *, workers: int = 1) -> ShardedVerificationReport:
+    """Verify every shard chain and that its tails reproduce the manifest root."""
+
+    directory = Path(directory)
+    manifest = read_manifest(directory)
+    if manifest is None:
+        raise ValueError(f"No {MANIFEST_NAME} in {directory}")
+    reports = tuple(
+        verify_chain(directory / entry["path"], workers=workers) for entry in manifest["shards"]
+    )
+    tails = [report.last_hash for report in reports]
+    computed = root_hash(tails)
+    error = None
+    for index, (entry, report) in enumerate(zip(manifest["shards"], reports, strict=True)):
+        if not report.ok:
+            error = f"shard {index} chain is broken"
+            break
+        if entry["last_hash"] != report.last_hash:
+            error = f"shard {index} tail does not match the manifest"
+            break
+    if error is None and computed != manifest["root_hash"]:
+        error = "root hash does not match the manifest"
+    return ShardedVerificationReport(error is None, computed, reports, error)
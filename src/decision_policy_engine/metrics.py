@@ -0,0 +1,218 @@
+"""Optional in-process metrics for the decision hot path.
+
+Instrumented code checks ``METRICS.enabled`` once per call and takes its
+uninstrumented path when it is false (the default), so disabled metrics cost a
+single attribute lookup. Metrics never change decision outputs, hashes or
+audit lines.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import TypeVar
+
+T = TypeVar("T")
+Labels = tuple[tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0,
+)
+
+METRIC_HELP = {
+    "dpe_policy_evaluation_seconds": "Time spent in PolicyGate.evaluate.",
+    "dpe_policy_decisions_total": "Policy gate outcomes by PolicyDecision.",
+    "dpe_route_score_seconds": "Time spent scoring one candidate route.",
+    "dpe_route_selection_seconds": "Time spent in Router.select_route.",
+    "dpe_routes_selected_total": "Selected routes by ExecutionRoute.",
+    "dpe_serialization_seconds": "Time spent encoding audit events to canonical JSON.",
+    "dpe_hash_seconds": "Time spent computing chained audit hashes.",
+    "dpe_audit_write_seconds": "Time spent writing audit lines to disk.",
+    "dpe_audit_events_written_total": "Audit events written to disk.",
+    "dpe_audit_lock_wait_seconds": "Time spent waiting for the shared audit log lock.",
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _series(name: str, labels: Labels) -> str:
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _sample(value: float) -> str:
+    """Exact sample value: ints as-is, floats round-trip (``repr``)."""
+
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Bucket counts (non-cumulative; the last entry is ``+Inf``), sum and count."""
+
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+    sum: float
+    count: int
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of all series, keyed like ``name{label="value"}``."""
+
+    counters: dict[str, float]
+    histograms: dict[str, HistogramSnapshot]
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * (size + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """Thread-safe counters and fixed-bucket latency histograms.
+
+    Series are identified by a metric name and a tuple of ``(label, value)``
+    pairs. Recording methods work regardless of ``enabled``; the flag is what
+    instrumented code consults before timing anything.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("buckets must be strictly increasing")
+        self.enabled = False
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, Labels], float] = {}
+        self._histograms: dict[tuple[str, Labels], _Histogram] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def inc(self, name: str, labels: Labels = (), amount: float = 1) -> None:
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, labels: Labels = ()) -> None:
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(len(self.buckets))
+            histogram.counts[bisect_left(self.buckets, seconds)] += 1
+            histogram.sum += seconds
+            histogram.count += 1
+
+    def timed(self, name: str, labels: Labels, function: Callable[..., T], *args: object) -> T:
+        """Call ``function(*args)`` and record its duration."""
+
+        started = perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.observe(name, perf_counter() - started, labels)
+
+    @contextmanager
+    def timer(self, name: str, labels: Labels = ()) -> Iterator[None]:
+        """Record the duration of a ``with`` block."""
+
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - started, labels)
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            counters = {
+                _series(name, labels): value for (name, labels), value in self._counters.items()
+            }
+            histograms = {
+                _series(name, labels): HistogramSnapshot(
+                    self.buckets, tuple(item.counts), item.sum, item.count
+                )
+                for (name, labels), item in self._histograms.items()
+            }
+        return MetricsSnapshot(counters, histograms)
+
+    def prometheus_text(self) -> str:
+        """Render all series in the Prometheus text exposition format."""
+
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                ((key, tuple(item.counts), item.sum, item.count)
+                 for key, item in self._histograms.items()),
+                key=lambda entry: entry[0],
+            )
+        lines: list[str] = []
+        described: set[str] = set()
+
+        def describe(name: str, kind: str) -> None:
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in counters:
+            describe(name, "counter")
+            lines.append(f"{_series(name, labels)} {_sample(value)}")
+        for (name, labels), counts, total, count in histograms:
+            describe(name, "histogram")
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts, strict=True):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{_series(name + '_bucket', labels + (('le', le),))} {cumulative}")
+            lines.append(f"{_series(name + '_sum', labels)} {_sample(total)}")
+            lines.append(f"{_series(name + '_count', labels)} {count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_prometheus(self, path: str | Path) -> None:
+        """Atomically write ``prometheus_text`` to ``path`` (e.g. for a textfile collector)."""
+
+        path = Path(path)
+        temporary = path.with_name(path.name + ".tmp")
+        temporary.write_text(self.prometheus_text(), encoding="utf-8")
+        os.replace(temporary, path)
+
+
+METRICS = MetricsRegistry()
+
+
+def record_audit_write(writer: str, started: float, events: int) -> None:
+    """Record one audit write that began at ``perf_counter()`` time ``started``."""
+
+    labels = (("writer", writer),)
+    METRICS.observe("dpe_audit_write_seconds", perf_counter() - started, labels)
+    METRICS.inc("dpe_audit_events_written_total", labels, events)
@@ -6,8 +6,11 @@ from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 
+_RISK_LEVELS = frozenset({"LOW", "MEDIUM", "HIGH"})
+_RISK_LEVEL_ERROR = f"risk_level must be one of {sorted(_RISK_LEVELS)}"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CostVector:
     """Cost signal inputs used for routing decisions."""
 
@@ -34,7 +37,7 @@ class PolicyDecision(str, Enum):
     SUPERVISED = "SUPERVISED"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProposedAction:
     """Action proposal evaluated by the policy gate."""
 
@@ -43,12 +46,11 @@ class ProposedAction:
     metadata: Mapping[str, object] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        allowed = {"LOW", "MEDIUM", "HIGH"}
-        if self.risk_level not in allowed:
-            raise ValueError(f"risk_level must be one of {sorted(allowed)}")
+        if self.risk_level not in _RISK_LEVELS:
+            raise ValueError(_RISK_LEVEL_ERROR)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Context:
     """Execution context for evaluating policy and routing decisions."""
 
@@ -1,5 +1,6 @@
 """Policy gate package."""
 
 from .policy_gate import PolicyGate
+from .rules import DEFAULT_RULES, RuleTable, compile_rules, load_rules
 
-__all__ = ["PolicyGate"]
+__all__ = ["DEFAULT_RULES", "PolicyGate", "RuleTable", "compile_rules", "load_rules"]
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from decision_policy_engine.metrics import METRICS
 from decision_policy_engine.models import Context, PolicyDecision, ProposedAction
+from decision_policy_engine.policy.rules import DEFAULT_RULE_TABLE
+
+_evaluate = DEFAULT_RULE_TABLE.evaluator
 
 
 class PolicyGate:
@@ -10,15 +14,10 @@ class PolicyGate:
 
     @staticmethod
     def evaluate(context: Context, action: ProposedAction) -> tuple[PolicyDecision, str]:
-        """Evaluate a proposed action against policy rules."""
-
-        if action.risk_level == "HIGH" and not context.supervised_mode:
-            return PolicyDecision.SUPERVISED, "High risk action requires supervision."
-
-        if action.type == "NETWORK_CALL" and not context.network_available:
-            return PolicyDecision.DENY, "Network unavailable for network call."
-
-        if context.battery_level < 0.10 and action.type == "NETWORK_CALL":
-            return PolicyDecision.DENY, "Battery too low for network call."
+        """Evaluate a proposed action against the default policy rules."""
 
-        return PolicyDecision.ALLOW, "Action permitted."
+        if not METRICS.enabled:
+            return _evaluate(context, action)
+        result = METRICS.timed("dpe_policy_evaluation_seconds", (), _evaluate, context, action)
+        METRICS.inc("dpe_policy_decisions_total", (("policy_decision", result[0].value),))
+        return result
@@ -0,0 +1,406 @@
+"""Declarative policy rules compiled into a dispatch table."""
+
+from __future__ import annotations
+
+import json
+import math
+import operator
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+from decision_policy_engine.models import Context, PolicyDecision, ProposedAction
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover - Python 3.10
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+RISK_LEVELS = ("LOW", "MEDIUM", "HIGH")
+
+_OPERATORS: dict[str, Callable[[object, object], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "in": lambda value, operand: value in operand,
+    "not_in": lambda value, operand: value not in operand,
+}
+
+_CONTEXT_FIELDS = frozenset(item.name for item in fields(Context))
+_MISSING = object()
+
+# Fields read as plain attributes, by annotation; metadata values are untyped.
+_FIELD_TYPES = {f"context.{item.name}": item.type for item in fields(Context)}
+_FIELD_TYPES.update({"action.type": "str", "action.risk_level": "str"})
+_COMPARISONS = {"eq": "==", "ne": "!=", "lt": "<", "le": "<=", "gt": ">", "ge": ">="}
+# Tables with at most this many rules compile into one flat if-chain.
+_FLAT_RULES = 16
+_ORDERED = {
+    "bool": (int, float),
+    "int": (int, float),
+    "float": (int, float),
+    "str": (str,),
+}
+
+DEFAULT_RULES: Mapping[str, object] = {
+    "rules": [
+        {
+            "name": "high_risk_requires_supervision",
+            "when": {"action.risk_level": "HIGH", "context.supervised_mode": False},
+            "decision": "SUPERVISED",
+            "reason": "High risk action requires supervision.",
+        },
+        {
+            "name": "network_call_requires_network",
+            "when": {"action.type": "NETWORK_CALL", "context.network_available": False},
+            "decision": "DENY",
+            "reason": "Network unavailable for network call.",
+        },
+        {
+            "name": "network_call_requires_battery",
+            "when": {"context.battery_level": {"lt": 0.10}, "action.type": "NETWORK_CALL"},
+            "decision": "DENY",
+            "reason": "Battery too low for network call.",
+        },
+    ],
+    "default": {"decision": "ALLOW", "reason": "Action permitted."},
+}
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A rule with its indexed constraints removed and the rest precompiled.
+
+    ``condition`` is the generated Python expression over ``context`` and
+    ``action``; ``predicate`` evaluates it.
+    """
+
+    priority: int
+    name: str
+    decision: PolicyDecision
+    reason: str
+    condition: str
+    predicate: Callable[[Context, ProposedAction], bool]
+
+    def matches(self, context: Context, action: ProposedAction) -> bool:
+        return bool(self.predicate(context, action))
+
+
+class _Namespace(dict):
+    """Globals of generated rule code.
+
+    ``bool``, ``int``, ``str`` and finite ``float`` operands are inlined as
+    literals (their ``repr`` round-trips); anything else is bound by name.
+    """
+
+    def bind(self, value: object) -> str:
+        name = f"_v{len(self)}"
+        self[name] = value
+        return name
+
+    def constant(self, value: object) -> str:
+        if type(value) in (bool, int, str) or (type(value) is float and math.isfinite(value)):
+            return repr(value)
+        return self.bind(value)
+
+
+def _condition(field_path: str, op_name: str, operand: object, namespace: _Namespace) -> str:
+    """Python expression for one constraint, with operand types checked now."""
+
+    field_type = _FIELD_TYPES.get(field_path)
+    if field_type is None:
+        # Metadata: the value type is only known per call, so keep the guarded check.
+        return f"{namespace.bind(_check(field_path, op_name, operand))}(context, action)"
+    if op_name == "exists":
+        return "True" if operand else "False"
+    if op_name in ("in", "not_in"):
+        members = frozenset(operand) if _hashable(operand) else tuple(operand)
+        keyword = "in" if op_name == "in" else "not in"
+        return f"({field_path} {keyword} {namespace.bind(members)})"
+    symbol = _COMPARISONS.get(op_name)
+    if symbol is None:
+        raise ValueError(f"Unknown operator {op_name!r} for {field_path!r}")
+    if op_name not in ("eq", "ne") and (
+        (isinstance(operand, bool) and field_type != "bool")
+        or not isinstance(operand, _ORDERED[field_type])
+    ):
+        raise ValueError(
+            f"Operator {op_name!r} for {field_path!r} ({field_type}) cannot compare "
+            f"with {operand!r}"
+        )
+    return f"({field_path} {symbol} {namespace.constant(operand)})"
+
+
+def _compile_predicate(expression: str, namespace: _Namespace) -> Callable[..., bool]:
+    return eval(f"lambda context, action: {expression}", namespace)
+
+
+def _compile_evaluator(
+    branches: Iterable[tuple[str, CompiledRule]],
+    default: tuple[PolicyDecision, str],
+    namespace: _Namespace,
+) -> Callable[[Context, ProposedAction], tuple[PolicyDecision, str]]:
+    """One function testing ``(condition, rule)`` branches in order.
+
+    There are no per-rule calls on the hot path: the first true condition
+    returns its rule's outcome.
+    """
+
+    name = namespace.bind(None)
+    lines = [f"def {name}(context, action):"]
+    for condition, rule in branches:
+        lines.append(f"    if {condition}:")
+        lines.append(f"        return {namespace.bind((rule.decision, rule.reason))}")
+    lines.append(f"    return {namespace.bind(default)}")
+    exec("\n".join(lines), namespace)
+    return namespace[name]
+
+
+def _indexed_condition(
+    field_path: str, values: frozenset[str] | None, namespace: _Namespace
+) -> str:
+    if values is None:
+        return ""
+    if len(values) == 1:
+        return f"({field_path} == {namespace.constant(next(iter(values)))})"
+    return f"({field_path} in {namespace.bind(values)})"
+
+
+def _getter(field_path: str) -> Callable[[Context, ProposedAction], object]:
+    source, _, name = field_path.partition(".")
+    if source == "context" and name in _CONTEXT_FIELDS:
+        return lambda context, action: getattr(context, name)
+    if source == "action" and name in ("type", "risk_level"):
+        return lambda context, action: getattr(action, name)
+    if source == "action" and name.startswith("metadata.") and len(name) > 9:
+        key = name[9:]
+        return lambda context, action: action.metadata.get(key, _MISSING)
+    raise ValueError(f"Unknown rule field: {field_path!r}")
+
+
+def _check(field_path: str, op_name: str, operand: object) -> Callable[..., bool]:
+    getter = _getter(field_path)
+    if op_name == "exists":
+        expected = bool(operand)
+        return lambda context, action: (getter(context, action) is not _MISSING) is expected
+    op = _OPERATORS.get(op_name)
+    if op is None:
+        raise ValueError(f"Unknown operator {op_name!r} for {field_path!r}")
+    if op_name in ("in", "not_in"):
+        operand = frozenset(operand) if _hashable(operand) else tuple(operand)
+
+    def check(context: Context, action: ProposedAction) -> bool:
+        value = getter(context, action)
+        if value is _MISSING:
+            return False
+        try:
+            return bool(op(value, operand))
+        except TypeError:
+            return False
+
+    return check
+
+
+def _hashable(values: Iterable[object]) -> bool:
+    try:
+        frozenset(values)
+    except TypeError:
+        return False
+    return True
+
+
+def _conditions(field_path: str, condition: object) -> list[tuple[str, object]]:
+    if not isinstance(condition, Mapping):
+        return [("eq", condition)]
+    if not condition:
+        raise ValueError(f"Empty condition for {field_path!r}")
+    for op_name, operand in condition.items():
+        # A string would silently become a set of its characters.
+        if op_name in ("in", "not_in") and (
+            isinstance(operand, (str, bytes, Mapping)) or not isinstance(operand, Iterable)
+        ):
+            raise ValueError(
+                f"Operator {op_name!r} for {field_path!r} needs a list of values, "
+                f"got {operand!r}"
+            )
+    return list(condition.items())
+
+
+def _index_values(conditions: list[tuple[str, object]]) -> tuple[frozenset[str] | None, list]:
+    """Split equality/membership constraints (indexable) from the rest."""
+
+    allowed: frozenset[str] | None = None
+    remaining = []
+    for op_name, operand in conditions:
+        if op_name == "eq":
+            values = frozenset([operand])
+        elif op_name == "in":
+            values = frozenset(operand)
+        else:
+            remaining.append((op_name, operand))
+            continue
+        allowed = values if allowed is None else allowed & values
+    return allowed, remaining
+
+
+class RuleTable:
+    """Policy rules compiled once and dispatched on ``(action.type, risk_level)``.
+
+    Rules are evaluated in declaration order; the first match wins. Only rules
+    that can match the action's type and risk level are checked. Rules are
+    compiled into generated functions with the comparisons inlined (one
+    if-chain for small tables, one per ``(type, risk_level)`` bucket
+    otherwise), and operand types are checked when the table is built.
+    Tables pickle as their spec and are recompiled on load, so they can be
+    sent to worker processes.
+    """
+
+    def __init__(self, spec: Mapping[str, object] | Iterable[Mapping[str, object]]) -> None:
+        if isinstance(spec, Mapping):
+            raw_rules = spec.get("rules", [])
+            default = spec.get("default", DEFAULT_RULES["default"])
+        else:
+            raw_rules = spec
+            default = DEFAULT_RULES["default"]
+        raw_rules = list(raw_rules)
+        self._spec = {"rules": raw_rules, "default": default}
+        self.default_decision = PolicyDecision(default["decision"])
+        self.default_reason = str(default["reason"])
+
+        namespace = _Namespace()
+        indexed: list[tuple[frozenset[str] | None, frozenset[str] | None, CompiledRule]] = []
+        for priority, raw in enumerate(raw_rules):
+            indexed.append(self._compile(priority, raw, namespace))
+        self.rules = tuple(rule for _, _, rule in indexed)
+
+        known_types = sorted({t for types, _, _ in indexed if types is not None for t in types})
+        self._wildcard: dict[str, tuple[CompiledRule, ...]] = {}
+        for risk in RISK_LEVELS:
+            self._wildcard[risk] = tuple(
+                rule
+                for types, risks, rule in indexed
+                if types is None and (risks is None or risk in risks)
+            )
+        self._table: dict[tuple[str, str], tuple[CompiledRule, ...]] = {}
+        for action_type in known_types:
+            for risk in RISK_LEVELS:
+                self._table[(action_type, risk)] = tuple(
+                    rule
+                    for types, risks, rule in indexed
+                    if (types is None or action_type in types)
+                    and (risks is None or risk in risks)
+                )
+
+        default_result = (self.default_decision, self.default_reason)
+        if len(indexed) <= _FLAT_RULES:
+            # Few rules: one if-chain over all of them, type and risk tests first.
+            branches = []
+            for types, risks, rule in indexed:
+                tests = [
+                    _indexed_condition("action.type", types, namespace),
+                    _indexed_condition("action.risk_level", risks, namespace),
+                    "" if rule.condition == "True" else rule.condition,
+                ]
+                branches.append((" and ".join(test for test in tests if test) or "True", rule))
+            self._evaluate = _compile_evaluator(branches, default_result, namespace)
+            return
+
+        compiled: dict[tuple[CompiledRule, ...], Callable[..., tuple[PolicyDecision, str]]] = {}
+        for rules in (*self._wildcard.values(), *self._table.values()):
+            if rules not in compiled:
+                compiled[rules] = _compile_evaluator(
+                    ((rule.condition, rule) for rule in rules), default_result, namespace
+                )
+        wildcard = {risk: compiled[rules] for risk, rules in self._wildcard.items()}
+        buckets: dict[str, dict[str, Callable[..., tuple[PolicyDecision, str]]]] = {}
+        for (action_type, risk), rules in self._table.items():
+            buckets.setdefault(action_type, {})[risk] = compiled[rules]
+        name = namespace.bind(None)
+        source = (
+            f"def {name}(context, action):\n"
+            f"    return {namespace.bind(buckets)}.get(action.type, {namespace.bind(wildcard)})"
+            "[action.risk_level](context, action)"
+        )
+        exec(source, namespace)
+        self._evaluate = namespace[name]
+
+    def __reduce__(self) -> tuple[type[RuleTable], tuple[Mapping[str, object]]]:
+        return RuleTable, (self._spec,)
+
+    @staticmethod
+    def _compile(
+        priority: int, raw: Mapping[str, object], namespace: _Namespace
+    ) -> tuple[frozenset[str] | None, frozenset[str] | None, CompiledRule]:
+        name = str(raw.get("name", f"rule_{priority}"))
+        try:
+            decision = PolicyDecision(raw["decision"])
+            reason = str(raw["reason"])
+        except (KeyError, ValueError) as exc:
+            raise ValueError(f"Rule {name!r} needs a valid decision and reason") from exc
+
+        types: frozenset[str] | None = None
+        risks: frozenset[str] | None = None
+        expressions = []
+        for field_path, condition in dict(raw.get("when", {})).items():
+            conditions = _conditions(field_path, condition)
+            if field_path == "action.type":
+                types, conditions = _index_values(conditions)
+            elif field_path == "action.risk_level":
+                risks, conditions = _index_values(conditions)
+            expressions.extend(
+                _condition(field_path, op, operand, namespace) for op, operand in conditions
+            )
+
+        condition = " and ".join(expressions) or "True"
+        predicate = _compile_predicate(condition, namespace)
+        rule = CompiledRule(priority, name, decision, reason, condition, predicate)
+        return types, risks, rule
+
+    def candidates(self, action: ProposedAction) -> tuple[CompiledRule, ...]:
+        """Return the rules that may apply to ``action``, in priority order."""
+
+        rules = self._table.get((action.type, action.risk_level))
+        if rules is None:
+            rules = self._wildcard.get(action.risk_level, ())
+        return rules
+
+    def evaluate(self, context: Context, action: ProposedAction) -> tuple[PolicyDecision, str]:
+        """Evaluate a proposed action against the compiled rules."""
+
+        return self._evaluate(context, action)
+
+    @property
+    def evaluator(self) -> Callable[[Context, ProposedAction], tuple[PolicyDecision, str]]:
+        """The generated function behind ``evaluate``, for callers that skip the method call."""
+
+        return self._evaluate
+
+
+def compile_rules(spec: Mapping[str, object] | Iterable[Mapping[str, object]]) -> RuleTable:
+    """Compile a rule spec (``{"rules": [...], "default": {...}}`` or a rule list)."""
+
+    return RuleTable(spec)
+
+
+def load_rules(path: str | Path) -> RuleTable:
+    """Load and compile a JSON or TOML rule file."""
+
+    path = Path(path)
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise RuntimeError("TOML rule files require Python 3.11+ or the tomli package.")
+        with open(path, "rb") as handle:
+            spec = tomllib.load(handle)
+    else:
+        with open(path, encoding="utf-8") as handle:
+            spec = json.load(handle)
+    return RuleTable(spec)
+
+
+DEFAULT_RULE_TABLE = RuleTable(DEFAULT_RULES)
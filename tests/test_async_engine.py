@@ -0,0 +1,124 @@
+import asyncio
+import json
+
+import pytest
+
+from decision_policy_engine.audit.verify import verify_chain
+from decision_policy_engine.engine import AsyncDecisionEngine, make_decision
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    ProposedAction,
+)
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=True,
+)
+CANDIDATES = {
+    ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+    ExecutionRoute.HYBRID: CostVector(200, 0.15, 0.20, 0.20),
+}
+
+
+def _decision_ids(path) -> list[str]:
+    return [json.loads(line)["decision_id"] for line in path.read_text().splitlines()]
+
+
+def test_decide_matches_sync_flow_and_chains_in_order(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    action = ProposedAction(type="DATA_EXPORT", risk_level="HIGH")
+
+    async def scenario():
+        async with AsyncDecisionEngine(log, max_pending=4, batch_size=3) as engine:
+            decisions = [
+                await engine.decide(CONTEXT, action, CANDIDATES, decision_id=f"d{i}")
+                for i in range(20)
+            ]
+            await engine.flush()
+            return decisions, engine.last_hash
+
+    decisions, last_hash = asyncio.run(scenario())
+    expected = make_decision(CONTEXT, action, CANDIDATES)
+    assert decisions[0].policy_decision is expected.policy_decision
+    assert decisions[0].route is expected.route
+    assert _decision_ids(log) == [f"d{i}" for i in range(20)]
+    report = verify_chain(log)
+    assert report.ok and report.events == 20 and report.last_hash == last_hash
+
+
+def test_concurrent_decisions_are_chained_in_enqueue_order(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    action = ProposedAction(type="NETWORK_CALL", risk_level="LOW")
+    enqueued: list[str] = []
+
+    async def scenario():
+        async with AsyncDecisionEngine(log, max_pending=8, batch_size=5) as engine:
+
+            async def client(worker: int) -> None:
+                for i in range(25):
+                    decision = await engine.decide(
+                        CONTEXT, action, CANDIDATES, decision_id=f"w{worker}-{i}"
+                    )
+                    enqueued.append(decision.event.decision_id)
+                    assert engine.pending <= 8
+
+            await asyncio.gather(*(client(worker) for worker in range(8)))
+
+    asyncio.run(scenario())
+    assert _decision_ids(log) == enqueued
+    assert verify_chain(log).events == 200
+
+
+def test_concurrent_decisions_start_the_engine_once(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    action = ProposedAction(type="NETWORK_CALL", risk_level="LOW")
+
+    async def scenario():
+        engine = AsyncDecisionEngine(log)
+        await asyncio.gather(
+            *(engine.decide(CONTEXT, action, CANDIDATES, decision_id=f"d{i}") for i in range(5))
+        )
+        await asyncio.wait_for(engine.aclose(), timeout=10)
+        return {task for task in asyncio.all_tasks() if task is not asyncio.current_task()}
+
+    assert asyncio.run(scenario()) == set()
+    assert sorted(_decision_ids(log)) == [f"d{i}" for i in range(5)]
+    assert verify_chain(log).events == 5
+
+
+def test_engine_continues_an_existing_log(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    action = ProposedAction(type="NETWORK_CALL", risk_level="LOW")
+
+    async def scenario(count: int) -> None:
+        async with AsyncDecisionEngine(log) as engine:
+            for _ in range(count):
+                await engine.decide(CONTEXT, action, CANDIDATES)
+
+    asyncio.run(scenario(3))
+    asyncio.run(scenario(4))
+    report = verify_chain(log)
+    assert report.ok and report.events == 7
+
+
+def test_writer_failure_is_reported(tmp_path) -> None:
+    action = ProposedAction(type="NETWORK_CALL", risk_level="LOW")
+
+    async def scenario() -> None:
+        engine = AsyncDecisionEngine(tmp_path / "audit.jsonl")
+        await engine.start()
+        engine._chain.close()
+        await engine.decide(CONTEXT, action, CANDIDATES)
+        with pytest.raises(RuntimeError, match="audit writer failed"):
+            await engine.flush()
+        with pytest.raises(RuntimeError):
+            await engine.decide(CONTEXT, action, CANDIDATES)
+        with pytest.raises(RuntimeError):
+            await engine.aclose()
+
+    asyncio.run(scenario())
@@ -0,0 +1,121 @@
+import pytest
+
+from decision_policy_engine.audit.binary import (
+    BinaryAuditReader,
+    BinaryAuditWriter,
+    binary_to_jsonl,
+    jsonl_to_binary,
+)
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import AuditChain, redact_inputs
+from decision_policy_engine.audit.verify import verify_lines
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
+
+
+def _event(index: int) -> AuditEvent:
+    context = Context(
+        network_available=index % 2 == 0,
+        rtt_ms=50 + index,
+        battery_level=0.8 - index / 1000,
+        user_present=True,
+        supervised_mode=False,
+        locale="pt-BR",
+    )
+    metadata = {"attempt": index, "ratio": -0.0, "big": 10**30, "note": "ação\n", "tags": [1, None]}
+    action = ProposedAction(type="NETWORK_CALL", risk_level="MEDIUM", metadata=metadata)
+    return AuditEvent(
+        timestamp_iso=f"2024-01-01T00:00:{index % 60:02d}+00:00",
+        trace_id=f"trace-{index}",
+        decision_id=f"decision-{index}",
+        action_type=action.type,
+        policy_decision=PolicyDecision.ALLOW,
+        route_selected=ExecutionRoute.HYBRID,
+        cost_vector=CostVector(200 + index, 0.15, 0.2, 1e-7),
+        reason="Action permitted.",
+        inputs_redacted=redact_inputs(context, action),
+    )
+
+
+def _write_log(path, count: int) -> None:
+    with AuditChain(path) as chain:
+        chain.extend(_event(index) for index in range(count))
+
+
+def test_binary_round_trip_is_byte_identical(tmp_path) -> None:
+    source = tmp_path / "audit.jsonl"
+    _write_log(source, 30)
+
+    assert jsonl_to_binary(source, tmp_path / "audit.bin") == 30
+    assert binary_to_jsonl(tmp_path / "audit.bin", tmp_path / "back.jsonl") == 30
+
+    assert (tmp_path / "back.jsonl").read_bytes() == source.read_bytes()
+    assert (tmp_path / "audit.bin").stat().st_size < source.stat().st_size / 2
+
+
+def test_binary_reader_seeks_and_verifies(tmp_path) -> None:
+    source = tmp_path / "audit.jsonl"
+    _write_log(source, 20)
+    lines = source.read_text(encoding="utf-8").splitlines()
+    jsonl_to_binary(source, tmp_path / "audit.bin")
+
+    with BinaryAuditReader(tmp_path / "audit.bin") as reader:
+        assert len(reader) == 20
+        assert reader.line(13) == lines[13]
+        assert reader[-1]["decision_id"] == "decision-19"
+        view = reader.view(0)
+        assert isinstance(view, memoryview)
+        view.release()
+        assert verify_lines(reader.iter_lines()).ok
+
+
+def test_binary_writer_appends_with_shared_string_table(tmp_path) -> None:
+    source = tmp_path / "audit.jsonl"
+    _write_log(source, 4)
+    records = []
+    with BinaryAuditReader(_convert(source, tmp_path / "a.bin")) as reader:
+        records = list(reader)
+
+    with BinaryAuditWriter(tmp_path / "b.bin") as writer:
+        writer.write_record(records[0])
+    with BinaryAuditWriter(tmp_path / "b.bin") as writer:
+        for record in records[1:]:
+            writer.write_record(record)
+
+    with BinaryAuditReader(tmp_path / "b.bin") as reader:
+        assert list(reader) == records
+        assert len(reader.strings) == len(set(reader.strings))
+
+
+def test_binary_reader_ignores_partial_tail_and_rejects_non_binary(tmp_path) -> None:
+    source = tmp_path / "audit.jsonl"
+    _write_log(source, 3)
+    target = _convert(source, tmp_path / "audit.bin")
+    target.write_bytes(target.read_bytes()[:-5])
+
+    with BinaryAuditReader(target) as reader:
+        assert len(reader) == 2
+        assert reader.truncated
+
+    with pytest.raises(ValueError):
+        BinaryAuditReader(source)
+
+
+def _convert(source, target):
+    jsonl_to_binary(source, target)
+    return target
+
+
+def test_binary_writer_accepts_audit_events(tmp_path) -> None:
+    with AuditChain(tmp_path / "audit.jsonl") as chain:
+        event = chain.append(_event(0))
+    with BinaryAuditWriter(tmp_path / "audit.bin") as writer:
+        writer.write_event(event)
+
+    with BinaryAuditReader(tmp_path / "audit.bin") as reader:
+        assert reader.line(0) + "\n" == (tmp_path / "audit.jsonl").read_text(encoding="utf-8")
@@ -0,0 +1,71 @@
+from dataclasses import replace
+from functools import partial
+
+import pytest
+
+from decision_policy_engine.audit.bulk import emit_events
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.redaction import Redactor
+from decision_policy_engine.audit.trace import AuditChain, append_jsonl, hash_event
+from decision_policy_engine.audit.verify import verify_chain
+from decision_policy_engine.models import CostVector, ExecutionRoute, PolicyDecision
+
+
+def _event(index: int) -> AuditEvent:
+    inputs: dict[str, object] = {"index": index, "note": "résumé ✓" if index % 3 else "plain"}
+    if index % 5 == 0:
+        # Enum values take the slow asdict path of the encoder.
+        inputs["route"] = ExecutionRoute.CLOUD
+    return AuditEvent(
+        timestamp_iso="2024-01-01T00:00:00+00:00",
+        trace_id=f"trace-{index % 7}",
+        decision_id=f"decision-{index}",
+        action_type="DATA_PROCESS",
+        policy_decision=PolicyDecision.ALLOW,
+        route_selected=ExecutionRoute.LOCAL,
+        cost_vector=CostVector(100 + index, 0.1, 0.25, index / 3),
+        reason="ok",
+        inputs_redacted=inputs,
+    )
+
+
+def _serial(path, events, prev_hash=None) -> None:
+    for event in events:
+        digest = hash_event(event, prev_hash)
+        append_jsonl(path, replace(event, prev_hash=prev_hash, hash=digest))
+        prev_hash = digest
+
+
+def _redacted(redactor: Redactor, index: int) -> AuditEvent:
+    event = _event(index)
+    return replace(event, inputs_redacted=redactor.redact_metadata(event.inputs_redacted))
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_emit_events_matches_serial_path(tmp_path, workers: int) -> None:
+    events = [_event(index) for index in range(250)]
+    _serial(tmp_path / "serial.jsonl", events)
+
+    result = emit_events(tmp_path / "bulk.jsonl", iter(events), workers=workers, chunk_size=16)
+    assert (tmp_path / "bulk.jsonl").read_bytes() == (tmp_path / "serial.jsonl").read_bytes()
+    assert result.events == 250
+    assert result.bytes_written == (tmp_path / "bulk.jsonl").stat().st_size
+    assert result.last_hash == verify_chain(tmp_path / "bulk.jsonl").last_hash
+
+
+def test_emit_events_continues_chain_and_runs_prepare_in_workers(tmp_path) -> None:
+    head = [_event(index) for index in range(10)]
+    with AuditChain(tmp_path / "log.jsonl") as chain:
+        chain.extend(head)
+        prepare = partial(_redacted, Redactor(deny=["note"]))
+        result = emit_events(chain, range(10, 40), workers=2, chunk_size=7, prepare=prepare)
+        assert chain.last_hash == result.last_hash
+
+    expected = head + [prepare(index) for index in range(10, 40)]
+    _serial(tmp_path / "serial.jsonl", expected)
+    assert (tmp_path / "log.jsonl").read_bytes() == (tmp_path / "serial.jsonl").read_bytes()
+    assert b"note" not in (tmp_path / "log.jsonl").read_bytes().splitlines()[-1]
+
+    assert emit_events(tmp_path / "empty.jsonl", [], workers=1).events == 0
+    with pytest.raises(ValueError, match="chunk_size"):
+        emit_events(tmp_path / "empty.jsonl", [], chunk_size=0)
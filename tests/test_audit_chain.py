@@ -1,7 +1,13 @@
+import json
 from dataclasses import replace
 
 from decision_policy_engine.audit.events import AuditEvent
-from decision_policy_engine.audit.trace import hash_event, redact_inputs
+from decision_policy_engine.audit.trace import (
+    AuditChain,
+    append_jsonl,
+    hash_event,
+    redact_inputs,
+)
 from decision_policy_engine.models import (
     Context,
     CostVector,
@@ -58,3 +64,81 @@ def test_chained_hash_is_stable() -> None:
 
     assert hash1 == hash_event(event1, prev_hash=None)
     assert hash2 == hash_event(event2, prev_hash=hash1)
+
+
+def _manual_chain(count: int) -> list[AuditEvent]:
+    events = []
+    prev_hash = None
+    for index in range(count):
+        event = replace(_base_event(), decision_id=f"decision-{index}", prev_hash=prev_hash)
+        prev_hash = hash_event(event, prev_hash=prev_hash)
+        events.append(replace(event, hash=prev_hash))
+    return events
+
+
+def test_audit_chain_matches_manual_chaining(tmp_path) -> None:
+    expected = _manual_chain(5)
+    reference = tmp_path / "reference.jsonl"
+    for event in expected:
+        append_jsonl(reference, event)
+
+    path = tmp_path / "chain.jsonl"
+    with AuditChain(path) as chain:
+        sealed = [chain.append(replace(_base_event(), decision_id="decision-0"))]
+    with AuditChain(path) as chain:
+        assert chain.last_hash == expected[0].hash
+        sealed += chain.extend(
+            replace(_base_event(), decision_id=f"decision-{index}") for index in range(1, 5)
+        )
+
+    assert sealed == expected
+    assert path.read_bytes() == reference.read_bytes()
+
+
+def test_audit_chain_recovers_from_truncated_last_line(tmp_path) -> None:
+    path = tmp_path / "chain.jsonl"
+    with AuditChain(path) as chain:
+        first, second = chain.extend([_base_event(), _base_event()])
+    data = path.read_bytes()
+    path.write_bytes(data[: len(data) - 40])
+
+    with AuditChain(path) as chain:
+        assert chain.last_hash == first.hash
+        third = chain.append(_base_event())
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["hash"] for line in lines] == [first.hash, third.hash]
+    assert third.prev_hash == first.hash
+
+
+def test_audit_chain_completes_record_missing_newline(tmp_path) -> None:
+    path = tmp_path / "chain.jsonl"
+    with AuditChain(path) as chain:
+        first = chain.append(_base_event())
+    path.write_bytes(path.read_bytes().rstrip(b"\n"))
+
+    with AuditChain(path) as chain:
+        assert chain.last_hash == first.hash
+        second = chain.append(_base_event())
+
+    assert second.prev_hash == first.hash
+    assert path.read_bytes().count(b"\n") == 2
+
+
+def test_audit_chain_reads_tail_larger_than_block(tmp_path) -> None:
+    context = Context(
+        network_available=True,
+        rtt_ms=50,
+        battery_level=0.8,
+        user_present=True,
+        supervised_mode=True,
+    )
+    action = ProposedAction(type="DATA_PROCESS", risk_level="LOW", metadata={"blob": "x" * 200_000})
+    event = replace(_base_event(), inputs_redacted=redact_inputs(context, action))
+    path = tmp_path / "chain.jsonl"
+    with AuditChain(path) as chain:
+        chain.append(_base_event())
+        last = chain.append(event)
+
+    with AuditChain(path) as chain:
+        assert chain.last_hash == last.hash
@@ -0,0 +1,138 @@
+import json
+import random
+from dataclasses import dataclass, replace
+from enum import Enum, IntEnum
+from hashlib import sha256
+
+import pytest
+
+from decision_policy_engine.audit.encoding import encode_event, reference_event_json, seal_event
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import canonical_event_json, hash_event
+from decision_policy_engine.models import CostVector, ExecutionRoute, PolicyDecision
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class Level(IntEnum):
+    ONE = 1
+
+
+@dataclass(frozen=True)
+class Point:
+    x: int
+    value: str
+
+
+def _random_scalar(rng: random.Random) -> object:
+    return rng.choice(
+        [
+            None,
+            True,
+            False,
+            rng.randint(-(10**20), 10**20),
+            rng.uniform(-1e6, 1e6),
+            rng.random(),
+            float("inf"),
+            1e-320,
+            "".join(rng.choice('aZ09 "\\\n\tçé漢\U0001f600/') for _ in range(rng.randint(0, 8))),
+            ExecutionRoute.CLOUD,
+            Level.ONE,
+            Color.RED,
+        ]
+    )
+
+
+def _random_value(rng: random.Random, depth: int = 0) -> object:
+    kind = rng.random()
+    if depth > 3 or kind < 0.5:
+        return _random_scalar(rng)
+    if kind < 0.7:
+        return {f"k{rng.randint(0, 30)}": _random_value(rng, depth + 1) for _ in range(4)}
+    if kind < 0.85:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    if kind < 0.93:
+        return tuple(_random_value(rng, depth + 1) for _ in range(2))
+    return Point(rng.randint(0, 9), "v")
+
+
+def _random_event(rng: random.Random) -> AuditEvent:
+    inputs = {"context": {"rtt_ms": rng.randint(0, 3000)}}
+    for _ in range(rng.randint(0, 4)):
+        inputs[f"field{rng.randint(0, 5)}"] = _random_value(rng)
+    return AuditEvent(
+        timestamp_iso="2024-01-01T00:00:00+00:00",
+        trace_id=f"trace-{rng.random()}",
+        decision_id="déc-" + str(rng.randint(0, 100)),
+        action_type=rng.choice(["NETWORK_CALL", "EXPORTé"]),
+        policy_decision=rng.choice(list(PolicyDecision)),
+        route_selected=rng.choice(list(ExecutionRoute)),
+        cost_vector=CostVector(
+            rng.choice([rng.randint(0, 2000), rng.uniform(0, 2000)]),
+            rng.random(),
+            rng.random(),
+            rng.choice([0, 0.0, rng.uniform(0, 10)]),
+        ),
+        reason=rng.choice(["ok", "Battery too low for network call."]),
+        inputs_redacted=inputs,
+        prev_hash=rng.choice([None, "a" * 64]),
+        hash=rng.choice([None, "b" * 64]),
+    )
+
+
+def test_fast_encoding_is_byte_identical_to_reference() -> None:
+    rng = random.Random(1234)
+    checked = 0
+    for _ in range(1500):
+        event = _random_event(rng)
+        try:
+            reference_event_json(event)
+        except TypeError:
+            with pytest.raises(TypeError):
+                canonical_event_json(event)
+            continue
+        checked += 1
+
+        for include_hash_fields in (False, True):
+            assert canonical_event_json(
+                event, include_hash_fields=include_hash_fields
+            ) == reference_event_json(event, include_hash_fields=include_hash_fields)
+
+        prev_hash = event.prev_hash
+        body = reference_event_json(event)
+        expected_hash = sha256(((prev_hash or "") + body).encode("utf-8")).hexdigest()
+        assert hash_event(event, prev_hash=prev_hash) == expected_hash
+
+        sealed, line = seal_event(event, prev_hash)
+        assert sealed == replace(event, hash=expected_hash)
+        assert line == reference_event_json(sealed, include_hash_fields=True)
+
+    assert checked > 500
+
+
+@dataclass(frozen=True, slots=True)
+class TenantEvent(AuditEvent):
+    tenant: str = "acme"
+    zone: Color = Color.RED
+
+
+def test_subclass_fields_are_encoded_like_the_reference() -> None:
+    rng = random.Random(77)
+    for _ in range(50):
+        base = _random_event(rng)
+        try:
+            reference_event_json(base)
+        except TypeError:
+            continue
+        event = TenantEvent(**{name: getattr(base, name) for name in base.__dataclass_fields__})
+        for include_hash_fields in (False, True):
+            assert canonical_event_json(
+                event, include_hash_fields=include_hash_fields
+            ) == reference_event_json(event, include_hash_fields=include_hash_fields)
+        _, line = seal_event(event, event.prev_hash)
+        assert '"tenant":"acme"' in line and '"zone":"red"' in line
+        head, middle, tail = encode_event(event).line_template()
+        sealed = json.loads(line)
+        assert f'{head}"{sealed["hash"]}"{middle}{json.dumps(sealed["prev_hash"])}{tail}' == line
@@ -0,0 +1,138 @@
+import json
+import math
+
+import pytest
+
+from decision_policy_engine.audit import export as export_module
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.export import COLUMNS, export_columnar, flatten_record, load_npz
+from decision_policy_engine.audit.trace import AuditChain, redact_inputs
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def _event(index: int) -> AuditEvent:
+    context = Context(
+        network_available=index % 2 == 0,
+        rtt_ms=10 * index,
+        battery_level=index / 100,
+        user_present=True,
+        supervised_mode=index % 3 == 0,
+        locale="pt-BR" if index % 4 else "en-US",
+    )
+    action = ProposedAction(type="DATA_PROCESS", risk_level="LOW", metadata={"n": index})
+    return AuditEvent(
+        timestamp_iso=f"2024-01-01T00:00:{index % 60:02d}+00:00",
+        trace_id=f"trace-{index}",
+        decision_id=f"decision-{index}",
+        action_type=action.type,
+        policy_decision=PolicyDecision.DENY if index % 5 == 0 else PolicyDecision.ALLOW,
+        route_selected=[ExecutionRoute.LOCAL, ExecutionRoute.HYBRID][index % 2],
+        cost_vector=CostVector(100 + index, 0.1, 0.2, 0.01 * index),
+        reason="ok",
+        inputs_redacted=redact_inputs(context, action),
+    )
+
+
+def _log(tmp_path, count: int):
+    log = tmp_path / "audit.jsonl"
+    with AuditChain(log) as chain:
+        chain.extend(_event(index) for index in range(count))
+    return log
+
+
+def _expected(log) -> dict[str, list[object]]:
+    rows = [flatten_record(json.loads(line)) for line in log.read_text().splitlines()]
+    return {name: [row[i] for row in rows] for i, (name, _) in enumerate(COLUMNS)}
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_npz_export_round_trips_through_numpy(tmp_path, compress) -> None:
+    log = _log(tmp_path, 23)
+    result = export_columnar(
+        log, tmp_path / "audit.npz", format="npz", row_group_size=5, compress=compress
+    )
+    assert (result.rows, result.row_groups) == (23, 5)
+
+    columns = load_npz(result.path)
+    expected = _expected(log)
+    for name, kind in COLUMNS:
+        values = columns[name].tolist()
+        if kind == "float64":
+            assert columns[name].dtype == np.float64
+            assert values == [float(v) for v in expected[name]]
+        else:
+            assert values == expected[name], name
+    assert columns["prev_hash"][0] is None
+    assert columns["inputs_redacted.context.network_available"].dtype == np.bool_
+
+    with np.load(result.path) as archive:
+        assert archive["rg00000/policy_decision"].dtype == np.int32
+        categories = archive["policy_decision.categories"].tobytes().decode()
+        low, middle, high = archive["policy_decision.categories.offsets"].tolist()
+        assert sorted([categories[low:middle], categories[middle:high]]) == ["ALLOW", "DENY"]
+        assert archive["rg00000/hash"].dtype == np.uint8
+        assert archive["rg00000/hash.offsets"].dtype == np.int64
+        assert "rg00001/prev_hash.mask" not in archive.files
+
+
+def test_export_handles_missing_fields_and_empty_logs(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    log.write_text('{"decision_id": "x", "cost_vector": {}}\n')
+    columns = load_npz(export_columnar(log, tmp_path / "one.npz", format="npz").path)
+    assert columns["decision_id"].tolist() == ["x"]
+    assert columns["route_selected"].tolist() == [None]
+    assert math.isnan(columns["cost_vector.latency_ms"][0])
+    assert columns["inputs_redacted.context.user_present"].tolist() == [None]
+
+    log.write_text("")
+    result = export_columnar(log, tmp_path / "empty.npz", format="npz")
+    assert result.rows == 0 and load_npz(result.path)["hash"].tolist() == []
+
+
+def test_npz_string_size_tracks_input_size(tmp_path) -> None:
+    log = _log(tmp_path, 200)
+    lines = log.read_text(encoding="utf-8").splitlines()
+    record = json.loads(lines[7])
+    record["reason"] = "é" * 100_000
+    record["trace_id"] = "t" * 100_000
+    lines[7] = json.dumps(record, ensure_ascii=False)
+    log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    result = export_columnar(log, tmp_path / "audit.npz", format="npz", row_group_size=50)
+    assert result.path.stat().st_size < 2 * log.stat().st_size
+    columns = load_npz(result.path, ["reason", "trace_id", "decision_id"])
+    assert columns["reason"][7] == "é" * 100_000
+    assert columns["trace_id"][7] == "t" * 100_000
+    assert columns["trace_id"][8] == "trace-8"
+
+
+def test_export_validates_arguments(tmp_path) -> None:
+    log = _log(tmp_path, 1)
+    with pytest.raises(ValueError, match="format"):
+        export_columnar(log, tmp_path / "out", format="csv")
+    with pytest.raises(ValueError, match="row_group_size"):
+        export_columnar(log, tmp_path / "out.npz", format="npz", row_group_size=0)
+    if export_module.pq is None:
+        assert export_columnar(log, tmp_path / "auto.npz").format == "npz"
+        with pytest.raises(ValueError, match="pyarrow"):
+            export_columnar(log, tmp_path / "out.parquet", format="parquet")
+
+
+def test_parquet_export_matches_npz(tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    log = _log(tmp_path, 23)
+    result = export_columnar(log, tmp_path / "audit.parquet", format="parquet", row_group_size=5)
+    assert pq.ParquetFile(result.path).metadata.num_row_groups == 5
+    table = pq.read_table(result.path)
+    expected = _expected(log)
+    for name, kind in COLUMNS:
+        wanted = [float(v) for v in expected[name]] if kind == "float64" else expected[name]
+        assert table.column(name).to_pylist() == wanted
@@ -0,0 +1,120 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.index import AuditIndex
+from decision_policy_engine.audit.trace import AuditChain, redact_inputs
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
+
+ROUTES = [ExecutionRoute.LOCAL, ExecutionRoute.HYBRID, ExecutionRoute.CLOUD]
+
+
+def _event(index: int) -> AuditEvent:
+    context = Context(
+        network_available=True,
+        rtt_ms=50,
+        battery_level=0.8,
+        user_present=True,
+        supervised_mode=True,
+    )
+    action = ProposedAction(type="DATA_PROCESS", risk_level="LOW")
+    return AuditEvent(
+        timestamp_iso=f"2024-01-01T{index // 60:02d}:{index % 60:02d}:00+00:00",
+        trace_id=f"trace-{index // 2}",
+        decision_id=f"decision-{index}",
+        action_type=action.type,
+        policy_decision=PolicyDecision.DENY if index % 5 == 0 else PolicyDecision.ALLOW,
+        route_selected=ROUTES[index % 3],
+        cost_vector=CostVector(100, 0.1, 0.1, 0.1),
+        reason="ok",
+        inputs_redacted=redact_inputs(context, action),
+    )
+
+
+def test_index_queries_by_field_and_time(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    with AuditChain(log) as chain:
+        sealed = chain.extend(_event(index) for index in range(150))
+
+    with AuditIndex(log) as index:
+        assert index.update() == 150
+        assert [e.decision_id for e in index.find(trace_id="trace-7")] == [
+            "decision-14",
+            "decision-15",
+        ]
+        assert index.find(decision_id="decision-42") == [sealed[42]]
+        assert len(index.find(route=ExecutionRoute.CLOUD)) == 50
+        assert len(index.find(policy_decision="DENY", route="LOCAL")) == 10
+        window = index.find(
+            start="2024-01-01T01:00:00+00:00",
+            end=datetime(2024, 1, 1, 1, 30, tzinfo=timezone.utc),
+        )
+        assert [e.decision_id for e in window] == [f"decision-{i}" for i in range(60, 90)]
+
+
+def test_index_updates_incrementally_and_persists(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    with AuditChain(log) as chain:
+        chain.extend(_event(index) for index in range(10))
+    with AuditIndex(log) as index:
+        index.update()
+
+    with AuditChain(log) as chain:
+        chain.append(replace(_event(10), decision_id="late"))
+    log.write_bytes(log.read_bytes() + b'{"partial": ')
+
+    with AuditIndex(log) as index:
+        assert index.indexed_bytes > 0
+        assert [e.decision_id for e in index.find(decision_id="late")] == ["late"]
+        assert index.update() == 0
+
+
+def test_index_rebuilds_after_truncation(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    with AuditChain(log) as chain:
+        chain.extend(_event(index) for index in range(10))
+    with AuditIndex(log) as index:
+        index.update()
+
+    log.write_bytes(b"".join(log.read_bytes().splitlines(keepends=True)[:3]))
+
+    with AuditIndex(log) as index:
+        assert len(index.offsets()) == 3
+
+
+def test_index_rebuilds_after_same_size_rewrite(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    with AuditChain(log) as chain:
+        chain.extend(_event(index) for index in range(4))
+    with AuditIndex(log) as index:
+        index.update()
+
+    lines = log.read_bytes().splitlines(keepends=True)
+    lines[-1] = lines[-1].replace(b"decision-3", b"decision-X")
+    log.write_bytes(b"".join(lines))
+
+    with AuditIndex(log) as index:
+        assert index.find(decision_id="decision-3") == []
+        assert [e.decision_id for e in index.find(decision_id="decision-X")] == ["decision-X"]
+        assert len(index.offsets()) == 4
+
+
+def test_index_skips_unparseable_lines(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    with AuditChain(log) as chain:
+        chain.extend([_event(0), _event(1)])
+    first, second = log.read_bytes().splitlines(keepends=True)
+    garbage = b'{"decision_id": "bad-ts", "timestamp_iso": "yesterday"}\nnot json\n[1, 2]\n'
+    log.write_bytes(first + garbage + second)
+
+    with AuditIndex(log) as index:
+        assert index.update() == 2
+        assert index.skipped_lines == 3
+        assert [e.decision_id for e in index.find()] == ["decision-0", "decision-1"]
+        assert index.update() == 0
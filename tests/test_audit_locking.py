@@ -0,0 +1,85 @@
+import json
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from decision_policy_engine.audit import trace
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import AuditChain, append_jsonl
+from decision_policy_engine.audit.verify import verify_chain
+from decision_policy_engine.models import CostVector, ExecutionRoute, PolicyDecision
+
+pytestmark = pytest.mark.skipif(trace.fcntl is None, reason="requires fcntl")
+
+
+def _event(worker: int, index: int, padding: int = 0) -> AuditEvent:
+    return AuditEvent(
+        timestamp_iso="2024-01-01T00:00:00+00:00",
+        trace_id=f"worker-{worker}",
+        decision_id=f"decision-{worker}-{index}",
+        action_type="DATA_PROCESS",
+        policy_decision=PolicyDecision.ALLOW,
+        route_selected=ExecutionRoute.LOCAL,
+        cost_vector=CostVector(100, 0.1, 0.1, 0.1),
+        reason="ok",
+        inputs_redacted={"padding": "x" * padding},
+    )
+
+
+def _shared_writer(path: str, worker: int, batches: int) -> int:
+    rng = random.Random(worker)
+    written = 0
+    with AuditChain(path, shared=True) as chain:
+        for _ in range(batches):
+            size = rng.randint(1, 5)
+            chain.extend([_event(worker, written + offset) for offset in range(size)])
+            written += size
+    return written
+
+
+def _jsonl_writer(path: str, worker: int, count: int) -> int:
+    for index in range(count):
+        append_jsonl(path, _event(worker, index, padding=20_000))
+    return count
+
+
+def test_shared_chain_stress_many_processes(tmp_path) -> None:
+    path = str(tmp_path / "audit.jsonl")
+    workers = 8
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        written = list(pool.map(_shared_writer, [path] * workers, range(workers), [60] * workers))
+
+    report = verify_chain(path)
+    assert report.ok, report.error
+    assert report.events == sum(written)
+    with open(path, encoding="utf-8") as handle:
+        ids = [json.loads(line)["decision_id"] for line in handle]
+    assert len(set(ids)) == len(ids)
+    for worker, count in enumerate(written):
+        mine = [int(i.rsplit("-", 1)[1]) for i in ids if i.startswith(f"decision-{worker}-")]
+        assert mine == list(range(count))
+
+
+def test_shared_instances_follow_each_other(tmp_path) -> None:
+    path = tmp_path / "audit.jsonl"
+    first = AuditChain(path, shared=True)
+    second = AuditChain(path, shared=True)
+    for index in range(6):
+        writer = first if index % 2 == 0 else second
+        writer.extend([_event(index % 2, index)])
+    assert first.last_hash != second.last_hash
+    assert first.append(_event(0, 99)).prev_hash == second.last_hash
+    first.close()
+    second.close()
+    report = verify_chain(path)
+    assert report.ok and report.events == 7
+
+
+def test_append_jsonl_lines_never_interleave(tmp_path) -> None:
+    path = str(tmp_path / "plain.jsonl")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_jsonl_writer, [path] * 4, range(4), [25] * 4))
+    with open(path, encoding="utf-8") as handle:
+        records = [json.loads(line) for line in handle]
+    assert len(records) == 100
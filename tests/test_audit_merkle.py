@@ -0,0 +1,95 @@
+from dataclasses import replace
+
+import pytest
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.index import AuditIndex
+from decision_policy_engine.audit.merkle import (
+    MerkleCheckpoints,
+    inclusion_path,
+    leaf_hash,
+    merkle_root,
+    node_hash,
+    root_from_path,
+    verify_inclusion,
+)
+from decision_policy_engine.audit.trace import AuditChain
+from decision_policy_engine.audit.verify import verify_chain
+from decision_policy_engine.models import CostVector, ExecutionRoute, PolicyDecision
+
+
+def _event(index: int) -> AuditEvent:
+    return AuditEvent(
+        timestamp_iso="2024-01-01T00:00:00+00:00",
+        trace_id="trace",
+        decision_id=f"decision-{index}",
+        action_type="DATA_PROCESS",
+        policy_decision=PolicyDecision.ALLOW,
+        route_selected=ExecutionRoute.LOCAL,
+        cost_vector=CostVector(100, 0.1, 0.1, 0.1),
+        reason="ok",
+        inputs_redacted={"index": index},
+    )
+
+
+def test_merkle_tree_matches_rfc6962_shape_and_paths() -> None:
+    leaves = [leaf_hash(f"{value:064x}") for value in range(7)]
+    a, b, c, d, e, f, g = leaves
+    expected = node_hash(
+        node_hash(node_hash(a, b), node_hash(c, d)), node_hash(node_hash(e, f), g)
+    )
+    assert merkle_root(leaves) == expected
+    for size in range(1, 20):
+        tree = [leaf_hash(f"{value:064x}") for value in range(size)]
+        root = merkle_root(tree)
+        for index in range(size):
+            path = inclusion_path(tree, index)
+            assert len(path) <= (size - 1).bit_length()
+            assert root_from_path(tree[index], index, size, path) == root
+            if size > 1:
+                assert root_from_path(tree[index], (index + 1) % size, size, path) != root
+
+
+def test_checkpoints_prove_every_event(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    with AuditChain(log) as chain:
+        sealed = chain.extend(_event(index) for index in range(37))
+
+    checkpoints = MerkleCheckpoints(log, batch_size=8)
+    assert [c.events for c in checkpoints.update()] == [8, 8, 8, 8]
+    with pytest.raises(KeyError):
+        checkpoints.prove("decision-33")
+    assert [c.events for c in checkpoints.update(final=True)] == [5]
+    assert checkpoints.checkpoints[-1].chain_hash == sealed[-1].hash
+
+    reopened = MerkleCheckpoints(log, batch_size=8)
+    assert reopened.covered_events == 37
+    with AuditIndex(log) as index:
+        for number, event in enumerate(sealed):
+            proof = reopened.prove(event.decision_id, index=index if number % 2 else None)
+            assert proof.event_hash == event.hash
+            assert len(proof.path) <= 3
+            assert verify_inclusion(proof)
+            assert verify_inclusion(proof, reopened.checkpoints[proof.checkpoint].root)
+
+    proof = reopened.prove("decision-10")
+    assert not verify_inclusion(replace(proof, event_hash=sealed[11].hash))
+    assert not verify_inclusion(replace(proof, leaf_index=proof.leaf_index + 1))
+    assert not verify_inclusion(proof, reopened.checkpoints[0].root)
+
+
+def test_checkpoints_extend_incrementally_and_detect_tampering(tmp_path) -> None:
+    log = tmp_path / "audit.jsonl"
+    with AuditChain(log) as chain:
+        chain.extend(_event(index) for index in range(10))
+        checkpoints = MerkleCheckpoints(log, batch_size=4)
+        checkpoints.update()
+        chain.extend(_event(index) for index in range(10, 16))
+    assert [c.first_event for c in checkpoints.update()] == [8, 12]
+    assert checkpoints.verify() is None
+    assert verify_chain(log).ok
+
+    lines = log.read_text().splitlines(keepends=True)
+    lines[5] = lines[5].replace("decision-5", "decision-X")
+    log.write_text("".join(lines))
+    assert checkpoints.verify() == 1
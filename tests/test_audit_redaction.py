@@ -0,0 +1,74 @@
+import pytest
+
+from decision_policy_engine.audit.redaction import HASH_PREFIX, Redactor, hash_value
+from decision_policy_engine.audit.trace import hash_event, redact_inputs
+from decision_policy_engine.engine import make_decision
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=False,
+)
+ACTION = ProposedAction(
+    type="DATA_EXPORT",
+    risk_level="MEDIUM",
+    metadata={"user": "alice@example.com", "payload": "x" * 5000, "size": 3, "note": "keep"},
+)
+
+
+def test_default_redactor_matches_redact_inputs() -> None:
+    redactor = Redactor()
+    assert redactor(CONTEXT, ACTION) == redact_inputs(CONTEXT, ACTION)
+    candidates = {ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02)}
+    with_redactor = make_decision(
+        CONTEXT, ACTION, candidates, trace_id="t", decision_id="d", redactor=redactor
+    ).event
+    without = make_decision(CONTEXT, ACTION, candidates, trace_id="t", decision_id="d").event
+    assert with_redactor.inputs_redacted == without.inputs_redacted
+
+
+def test_metadata_rules_are_applied() -> None:
+    redactor = Redactor(deny={"size"}, truncate={"payload": 8}, hash_keys={"user"})
+    metadata = redactor(CONTEXT, ACTION)["action"]["metadata"]
+    assert metadata == {
+        "user": hash_value("alice@example.com"),
+        "payload": "xxxxxxxx",
+        "note": "keep",
+    }
+    assert metadata["user"].startswith(HASH_PREFIX)
+    assert ACTION.metadata["payload"] == "x" * 5000
+
+    allow_only = Redactor(allow={"note", "user"}, hash_keys={"user"}, deny={"note"})
+    assert allow_only.redact_metadata(ACTION.metadata) == {"user": hash_value("alice@example.com")}
+
+
+def test_context_projection_is_reused_and_bounded() -> None:
+    redactor = Redactor(context_fields=("rtt_ms", "locale"), context_cache_size=2)
+    first = redactor(CONTEXT, ACTION)["context"]
+    assert first == {"rtt_ms": 120, "locale": "en-US"}
+    assert redactor(CONTEXT, ACTION)["context"] is first
+
+    for rtt in (1, 2):
+        redactor(Context(True, rtt, 0.6, True, False), ACTION)
+    assert redactor(CONTEXT, ACTION)["context"] is not first
+
+
+def test_redacted_events_hash_smaller_payloads() -> None:
+    candidates = {ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02)}
+    event = make_decision(
+        CONTEXT, ACTION, candidates, redactor=Redactor(truncate={"payload": 16})
+    ).event
+    assert len(event.inputs_redacted["action"]["metadata"]["payload"]) == 16
+    assert hash_event(event)
+
+
+def test_invalid_specs_are_rejected() -> None:
+    with pytest.raises(ValueError, match="context fields"):
+        Redactor(context_fields=("rtt_ms", "secret"))
+    with pytest.raises(ValueError, match="both truncated and hashed"):
+        Redactor(truncate={"k": 3}, hash_keys={"k"})
+    with pytest.raises(ValueError, match="non-negative"):
+        Redactor(truncate={"k": -1})
@@ -0,0 +1,107 @@
+import gzip
+
+import pytest
+
+from decision_policy_engine.audit import verify
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.rotation import (
+    RotatingAuditChain,
+    iter_segment_events,
+    segment_paths,
+    verify_segments,
+)
+from decision_policy_engine.audit.trace import AuditChain
+from decision_policy_engine.models import CostVector, ExecutionRoute, PolicyDecision
+
+
+def _event(index: int) -> AuditEvent:
+    return AuditEvent(
+        timestamp_iso="2024-01-01T00:00:00+00:00",
+        trace_id=f"trace-{index}",
+        decision_id=f"decision-{index}",
+        action_type="DATA_PROCESS",
+        policy_decision=PolicyDecision.ALLOW,
+        route_selected=ExecutionRoute.LOCAL,
+        cost_vector=CostVector(100, 0.1, 0.1, 0.1),
+        reason="ok",
+        inputs_redacted={"index": index},
+    )
+
+
+def test_rotation_carries_chain_and_matches_single_file(tmp_path) -> None:
+    single = AuditChain(tmp_path / "single.jsonl")
+    with RotatingAuditChain(tmp_path / "rotated", max_bytes=2048, compression="gzip") as chain:
+        for start in range(0, 60, 3):
+            batch = [_event(index) for index in range(start, start + 3)]
+            sealed = chain.extend(batch)
+            assert sealed == single.extend(batch)
+    single.close()
+
+    segments = segment_paths(tmp_path / "rotated")
+    assert len(segments) > 3
+    assert all(path.suffix == ".gz" for path in segments[:-1])
+    assert segments[-1].suffix == ".jsonl"
+    with gzip.open(segments[1], "rb") as handle:
+        first = handle.readline()
+    assert b'"prev_hash":null' not in first
+
+    report = verify_segments(tmp_path / "rotated")
+    assert report.ok and report.events == 60
+    assert report.last_hash == single.last_hash
+    assert [event.decision_id for event in iter_segment_events(tmp_path / "rotated")] == [
+        f"decision-{index}" for index in range(60)
+    ]
+    assert verify.main([str(tmp_path / "rotated")]) == 0
+
+
+def test_reopen_continues_chain_and_age_rotation(tmp_path) -> None:
+    now = [0.0]
+    with RotatingAuditChain(
+        tmp_path, max_bytes=None, max_age_s=10, compression="none", clock=lambda: now[0]
+    ) as chain:
+        chain.append(_event(0))
+        now[0] = 5
+        chain.append(_event(1))
+        assert len(chain.segments) == 1
+        now[0] = 11
+        chain.append(_event(2))
+        assert len(chain.segments) == 2
+        first_active = chain.active_path
+        assert chain.rotate() != first_active
+
+    # The empty active segment left by rotate() continues from the previous one.
+    with RotatingAuditChain(tmp_path, max_bytes=None, compression="gzip") as chain:
+        chain.append(_event(3))
+        assert chain.active_path.name == "audit_log.000003.jsonl"
+    assert [path.name for path in segment_paths(tmp_path)] == [
+        "audit_log.000001.jsonl.gz",
+        "audit_log.000002.jsonl.gz",
+        "audit_log.000003.jsonl",
+    ]
+    assert verify_segments(tmp_path).events == 4
+
+
+def test_tampering_across_segments_is_detected(tmp_path) -> None:
+    with RotatingAuditChain(tmp_path, max_bytes=1, compression="none") as chain:
+        for index in range(3):
+            chain.append(_event(index))
+    middle = segment_paths(tmp_path)[1]
+    record = middle.read_bytes().replace(b"decision-1", b"decision-X")
+    middle.write_bytes(record)
+    report = verify_segments(tmp_path)
+    assert not report.ok
+    assert report.error.line_number == 2
+
+    with pytest.raises(ValueError, match="compression"):
+        RotatingAuditChain(tmp_path, compression="lz4")
+    with pytest.raises(ValueError, match="max_bytes"):
+        RotatingAuditChain(tmp_path, max_bytes=0)
+
+
+def test_audit_chain_anchor_only_applies_to_empty_file(tmp_path) -> None:
+    with AuditChain(tmp_path / "log.jsonl", anchor="abc") as chain:
+        assert chain.append(_event(0)).prev_hash == "abc"
+        tail = chain.last_hash
+    with AuditChain(tmp_path / "log.jsonl", anchor="ignored") as chain:
+        assert chain.last_hash == tail
+        assert chain.size == (tmp_path / "log.jsonl").stat().st_size
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import AuditChain, redact_inputs
+from decision_policy_engine.audit.verify import main, verify_chain
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
+
+
+def _event(index: int) -> AuditEvent:
+    context = Context(
+        network_available=True,
+        rtt_ms=50 + index,
+        battery_level=0.8,
+        user_present=True,
+        supervised_mode=True,
+    )
+    action = ProposedAction(type="DATA_PROCESS", risk_level="LOW", metadata={10: "a", 9: "b"})
+    return AuditEvent(
+        timestamp_iso="2024-01-01T00:00:00+00:00",
+        trace_id=f"trace-{index}",
+        decision_id=f"decision-{index}",
+        action_type=action.type,
+        policy_decision=PolicyDecision.ALLOW,
+        route_selected=ExecutionRoute.LOCAL,
+        cost_vector=CostVector(100, 0.1, 0.1, 0.1),
+        reason="ok",
+        inputs_redacted=redact_inputs(context, action),
+    )
+
+
+def _write_log(path, count: int) -> list[AuditEvent]:
+    with AuditChain(path) as chain:
+        return chain.extend(_event(index) for index in range(count))
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_verify_chain_accepts_valid_log(tmp_path, workers: int) -> None:
+    path = tmp_path / "audit.jsonl"
+    events = _write_log(path, 50)
+
+    report = verify_chain(path, workers=workers)
+
+    assert report.ok
+    assert report.events == 50
+    assert report.bytes_read == path.stat().st_size
+    assert report.last_hash == events[-1].hash
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_verify_chain_reports_tampered_record(tmp_path, workers: int) -> None:
+    path = tmp_path / "audit.jsonl"
+    _write_log(path, 40)
+    lines = path.read_bytes().splitlines(keepends=True)
+    record = json.loads(lines[29])
+    record["reason"] = "tampered"
+    lines[29] = json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+    path.write_bytes(b"".join(lines))
+
+    report = verify_chain(path, workers=workers)
+
+    assert not report.ok
+    assert report.error.line_number == 30
+    assert report.error.byte_offset == sum(len(line) for line in lines[:29])
+    assert "hash" in report.error.reason
+    assert report.events == 29
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_verify_chain_reports_missing_record(tmp_path, workers: int) -> None:
+    path = tmp_path / "audit.jsonl"
+    _write_log(path, 40)
+    lines = path.read_bytes().splitlines(keepends=True)
+    del lines[20]
+    path.write_bytes(b"".join(lines))
+
+    report = verify_chain(path, workers=workers)
+
+    assert report.error.line_number == 21
+    assert "prev_hash" in report.error.reason
+
+
+def test_verify_chain_checks_anchor(tmp_path) -> None:
+    path = tmp_path / "audit.jsonl"
+    with AuditChain(path) as chain:
+        chain.append(_event(0))
+
+    assert not verify_chain(path, anchor="f" * 64).ok
+
+
+def test_verify_cli_exit_status(tmp_path, capsys) -> None:
+    path = tmp_path / "audit.jsonl"
+    _write_log(path, 5)
+
+    assert main([str(path), "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["events"] == 5
+
+    path.write_bytes(path.read_bytes() + b"{broken\n")
+    assert main([str(path)]) == 1
+    assert "line 6" in capsys.readouterr().out
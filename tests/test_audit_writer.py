@@ -0,0 +1,179 @@
+import errno
+import gc
+import os
+import time
+from dataclasses import replace
+
+import pytest
+
+from decision_policy_engine.audit import writer as writer_module
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.audit.trace import append_jsonl, hash_event, redact_inputs
+from decision_policy_engine.audit.writer import AuditWriter
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
+
+
+def _events(count: int) -> list[AuditEvent]:
+    context = Context(
+        network_available=True,
+        rtt_ms=50,
+        battery_level=0.8,
+        user_present=True,
+        supervised_mode=True,
+        locale="pt-BR",
+    )
+    action = ProposedAction(type="DATA_PROCESS", risk_level="LOW", metadata={"note": "ação"})
+    events = []
+    prev_hash = None
+    for index in range(count):
+        event = AuditEvent(
+            timestamp_iso="2024-01-01T00:00:00+00:00",
+            trace_id=f"trace-{index}",
+            decision_id=f"decision-{index}",
+            action_type=action.type,
+            policy_decision=PolicyDecision.ALLOW,
+            route_selected=ExecutionRoute.LOCAL,
+            cost_vector=CostVector(100, 0.1, 0.1, 0.1),
+            reason="ok",
+            inputs_redacted=redact_inputs(context, action),
+            prev_hash=prev_hash,
+        )
+        prev_hash = hash_event(event, prev_hash=prev_hash)
+        events.append(replace(event, hash=prev_hash))
+    return events
+
+
+def test_writer_bytes_match_append_jsonl(tmp_path) -> None:
+    events = _events(10)
+    reference = tmp_path / "reference.jsonl"
+    for event in events:
+        append_jsonl(reference, event)
+
+    with AuditWriter(tmp_path / "nested" / "buffered.jsonl", max_events=3) as writer:
+        writer.write_many(events)
+
+    assert (tmp_path / "nested" / "buffered.jsonl").read_bytes() == reference.read_bytes()
+
+
+def test_writer_flushes_by_count_and_size(tmp_path) -> None:
+    path = tmp_path / "log.jsonl"
+    events = _events(4)
+
+    writer = AuditWriter(path, max_events=2, flush_interval_s=None)
+    writer.write(events[0])
+    assert path.read_bytes() == b""
+    writer.write(events[1])
+    assert path.read_bytes().count(b"\n") == 2
+    writer.close()
+
+    writer = AuditWriter(path, max_buffer_bytes=1, flush_interval_s=None, fsync="never")
+    writer.write(events[2])
+    assert path.read_bytes().count(b"\n") == 3
+    writer.close()
+
+
+def test_writer_flushes_by_deadline(tmp_path) -> None:
+    path = tmp_path / "log.jsonl"
+    now = [0.0]
+    events = _events(3)
+
+    with AuditWriter(path, flush_interval_s=2.0, clock=lambda: now[0]) as writer:
+        writer.write(events[0])
+        now[0] = 1.0
+        writer.write(events[1])
+        assert writer.pending == 2
+        now[0] = 2.5
+        assert writer.flush_if_due()
+        assert writer.pending == 0
+        writer.write(events[2])
+
+    assert path.read_bytes().count(b"\n") == 3
+
+
+def test_writer_flushes_by_deadline_without_further_writes(tmp_path) -> None:
+    path = tmp_path / "log.jsonl"
+    now = [0.0]
+
+    with AuditWriter(path, flush_interval_s=0.01, clock=lambda: now[0]) as writer:
+        writer.write(_events(1)[0])
+        time.sleep(0.05)
+        assert writer.pending == 1
+        now[0] = 1.0
+        deadline = time.monotonic() + 5.0
+        while writer.pending and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert writer.pending == 0
+        assert path.read_bytes().count(b"\n") == 1
+
+    manual = AuditWriter(
+        tmp_path / "manual.jsonl",
+        flush_interval_s=0.01,
+        clock=lambda: now[0],
+        background_flush=False,
+    )
+    manual.write(_events(1)[0])
+    now[0] = 2.0
+    time.sleep(0.05)
+    assert manual.pending == 1
+    assert manual.flush_if_due()
+    manual.close()
+
+
+def test_writer_keeps_unwritten_events_when_a_write_fails(tmp_path, monkeypatch) -> None:
+    events = _events(3)
+    reference = tmp_path / "reference.jsonl"
+    for event in events:
+        append_jsonl(reference, event)
+    path = tmp_path / "log.jsonl"
+    real_write = os.write
+    calls = []
+
+    def failing_write(fd: int, data: bytes) -> int:
+        calls.append(len(data))
+        if len(calls) == 1:
+            return real_write(fd, bytes(data[:25]))
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    writer = AuditWriter(path, flush_interval_s=None)
+    writer.write_many(events)
+    monkeypatch.setattr(writer_module.os, "write", failing_write)
+    with pytest.raises(OSError):
+        writer.flush()
+    with pytest.raises(OSError):
+        writer.close()
+    assert writer.pending == 3
+    assert not writer.closed
+
+    monkeypatch.setattr(writer_module.os, "write", real_write)
+    writer.close()
+    assert path.read_bytes() == reference.read_bytes()
+
+
+def test_unclosed_writer_is_collected_and_flushed(tmp_path) -> None:
+    path = tmp_path / "log.jsonl"
+    writer = AuditWriter(path, flush_interval_s=60.0)
+    writer.write(_events(1)[0])
+    flusher = writer._flusher
+    del writer
+    gc.collect()
+
+    flusher.join(timeout=120)
+    assert not flusher.is_alive()
+    assert path.read_bytes().count(b"\n") == 1
+
+
+def test_writer_rejects_writes_after_close(tmp_path) -> None:
+    writer = AuditWriter(tmp_path / "log.jsonl", fsync="event")
+    writer.write(_events(1)[0])
+    writer.close()
+    writer.close()
+
+    assert writer.closed
+    with pytest.raises(ValueError):
+        writer.write(_events(1)[0])
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from decision_policy_engine.decision.compiled import CompiledRouter
+from decision_policy_engine.decision.router import TIE_BREAK_ORDER, Router
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute
+
+
+def _context(network_available: bool = True) -> Context:
+    return Context(
+        network_available=network_available,
+        rtt_ms=100,
+        battery_level=0.6,
+        user_present=True,
+        supervised_mode=True,
+    )
+
+
+def test_compiled_router_matches_router() -> None:
+    rng = random.Random(3)
+    router = CompiledRouter()
+    for _ in range(500):
+        routes = rng.sample(TIE_BREAK_ORDER, rng.randint(1, 4))
+        shared = CostVector(rng.randint(0, 2500), 0.2, 0.2, rng.uniform(0, 12))
+        candidates = {
+            route: shared
+            if rng.random() < 0.3
+            else CostVector(rng.randint(0, 2500), rng.random(), rng.random(), rng.uniform(0, 12))
+            for route in routes
+        }
+        context = _context(rng.random() < 0.7)
+        try:
+            expected = Router.select_route(context, candidates)
+        except ValueError:
+            with pytest.raises(ValueError):
+                router.select_route(context, candidates)
+            continue
+
+        route, cost, explanation = router.select_route(context, candidates)
+
+        assert (route, cost) == expected[:2]
+        assert explanation.scores == expected[2].scores
+        assert explanation.normalized == expected[2].normalized
+        assert explanation.weights == expected[2].weights
+
+
+def test_compiled_router_builds_explanation_lazily() -> None:
+    candidates = {
+        ExecutionRoute.LOCAL: CostVector(200, 0.3, 0.3, 0.3),
+        ExecutionRoute.HYBRID: CostVector(150, 0.2, 0.2, 0.2),
+    }
+
+    route, _, explanation = CompiledRouter().select_route(_context(), candidates)
+
+    assert route == ExecutionRoute.HYBRID
+    assert explanation._resolved is None
+    assert set(explanation.scores) == set(candidates)
+    assert explanation.resolve() is explanation.resolve()
+
+
+def test_compiled_router_custom_weights_tie_break() -> None:
+    router = CompiledRouter(
+        {"latency_ms": 0.0, "privacy_risk": 0.0, "reliability_risk": 0.0, "dollar_cost": 0.0}
+    )
+    candidates = {
+        ExecutionRoute.CLOUD: CostVector(50, 0.05, 0.05, 0.05),
+        ExecutionRoute.HYBRID: CostVector(100, 0.1, 0.1, 0.1),
+    }
+
+    route, _, _ = router.select_route(_context(), candidates)
+
+    assert route == ExecutionRoute.HYBRID
+
+
+def test_compiled_router_rejects_incomplete_weights() -> None:
+    with pytest.raises(ValueError, match="weights"):
+        CompiledRouter({"latency_ms": 1.0})
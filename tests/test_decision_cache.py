@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from decision_policy_engine.decision.cache import DecisionCache, Quantization
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+from decision_policy_engine.policy.policy_gate import PolicyGate
+
+
+def _context(rtt_ms: int = 100, battery_level: float = 0.6, network: bool = True) -> Context:
+    return Context(
+        network_available=network,
+        rtt_ms=rtt_ms,
+        battery_level=battery_level,
+        user_present=True,
+        supervised_mode=False,
+    )
+
+
+def _candidates(rtt_ms: int) -> dict[ExecutionRoute, CostVector]:
+    return {
+        ExecutionRoute.LOCAL: CostVector(400, 0.05, 0.10, 0.02),
+        ExecutionRoute.HYBRID: CostVector(max(200, rtt_ms), 0.15, 0.20, 0.20),
+        ExecutionRoute.CLOUD: CostVector(max(300, rtt_ms + 80), 0.35, 0.30, 0.45),
+    }
+
+
+def test_cache_matches_uncached_path_without_quantization() -> None:
+    rng = random.Random(5)
+    cache = DecisionCache(max_entries=16)
+    for _ in range(400):
+        context = _context(
+            rtt_ms=rng.choice([50, 120, 800, 1500]),
+            battery_level=rng.choice([0.05, 0.5, 0.9]),
+            network=rng.random() < 0.8,
+        )
+        action = ProposedAction(
+            type=rng.choice(["NETWORK_CALL", "DATA_PROCESS"]),
+            risk_level=rng.choice(["LOW", "HIGH"]),
+        )
+        candidates = _candidates(context.rtt_ms)
+
+        decision = cache.decide(context, action, candidates)
+
+        assert (decision.policy_decision, decision.reason) == PolicyGate.evaluate(context, action)
+        route, cost, explanation = Router.select_route(context, candidates)
+        assert (decision.route, decision.cost) == (route, cost)
+        assert decision.explanation.scores == explanation.scores
+
+    stats = cache.stats()
+    assert stats.hits > 0
+    assert stats.hits + stats.misses == 400
+    assert stats.size <= 16
+
+
+def test_cache_quantization_shares_bucket() -> None:
+    cache = DecisionCache(quantization=Quantization(rtt_ms=50, battery_level=0.1))
+    action = ProposedAction(type="DATA_PROCESS", risk_level="LOW")
+    candidates = _candidates(100)
+
+    cache.decide(_context(rtt_ms=101, battery_level=0.61), action, candidates)
+    cache.decide(_context(rtt_ms=149, battery_level=0.65), action, candidates)
+
+    assert cache.stats().hits == 1
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = DecisionCache(max_entries=2)
+    action = ProposedAction(type="DATA_PROCESS", risk_level="LOW")
+    for rtt_ms in (10, 20, 10, 30, 20):
+        cache.decide(_context(rtt_ms=rtt_ms), action, _candidates(100))
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 4, 2, 2)
+
+
+def test_cache_expires_entries_after_ttl() -> None:
+    now = [0.0]
+    cache = DecisionCache(ttl_s=5.0, clock=lambda: now[0])
+    action = ProposedAction(type="DATA_PROCESS", risk_level="LOW")
+
+    cache.decide(_context(), action, _candidates(100))
+    now[0] = 4.0
+    cache.decide(_context(), action, _candidates(100))
+    now[0] = 10.0
+    cache.decide(_context(), action, _candidates(100))
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations) == (1, 2, 1)
+
+
+def test_quantization_rejects_non_positive_width() -> None:
+    with pytest.raises(ValueError, match="rtt_ms"):
+        Quantization(rtt_ms=0)
@@ -0,0 +1,112 @@
+from dataclasses import replace
+
+import pytest
+
+from decision_policy_engine.audit.trace import AuditChain, append_jsonl, hash_event
+from decision_policy_engine.audit.writer import AuditWriter
+from decision_policy_engine.engine import make_decision
+from decision_policy_engine.metrics import METRICS, MetricsRegistry
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=True,
+)
+ACTION = ProposedAction(type="DATA_EXPORT", risk_level="HIGH")
+CANDIDATES = {
+    ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+    ExecutionRoute.HYBRID: CostVector(200, 0.15, 0.20, 0.20),
+}
+
+
+@pytest.fixture
+def metrics():
+    METRICS.reset()
+    METRICS.enable()
+    yield METRICS
+    METRICS.disable()
+    METRICS.reset()
+
+
+def _run(tmp_path, name: str) -> tuple[list[str], str]:
+    decision = make_decision(CONTEXT, ACTION, CANDIDATES, trace_id="t", decision_id="d")
+    event = replace(decision.event, timestamp_iso="2024-01-01T00:00:00+00:00")
+    path = tmp_path / f"{name}.jsonl"
+    with AuditChain(path) as chain:
+        sealed = chain.extend([event, event])
+    append_jsonl(tmp_path / f"{name}-plain.jsonl", sealed[0])
+    with AuditWriter(tmp_path / f"{name}-buffered.jsonl") as writer:
+        writer.write(sealed[1])
+    return path.read_text().splitlines(), hash_event(sealed[0])
+
+
+def test_metrics_record_hot_path_without_changing_outputs(tmp_path, metrics) -> None:
+    METRICS.disable()
+    expected = _run(tmp_path, "off")
+    assert METRICS.snapshot().counters == {}
+
+    METRICS.enable()
+    assert _run(tmp_path, "on") == expected
+
+    snapshot = metrics.snapshot()
+    assert snapshot.counters['dpe_policy_decisions_total{policy_decision="ALLOW"}'] == 1
+    assert snapshot.counters['dpe_routes_selected_total{route="LOCAL"}'] == 1
+    assert snapshot.counters['dpe_audit_events_written_total{writer="chain"}'] == 2
+    assert snapshot.counters['dpe_audit_events_written_total{writer="append_jsonl"}'] == 1
+    assert snapshot.counters['dpe_audit_events_written_total{writer="buffered"}'] == 1
+    for series in (
+        "dpe_policy_evaluation_seconds",
+        "dpe_route_selection_seconds",
+        'dpe_route_score_seconds{route="HYBRID"}',
+        "dpe_serialization_seconds",
+        "dpe_hash_seconds",
+        'dpe_audit_write_seconds{writer="chain"}',
+    ):
+        histogram = snapshot.histograms[series]
+        assert histogram.count == sum(histogram.counts) > 0
+
+
+def test_sealing_records_one_serialization_per_event(tmp_path, metrics) -> None:
+    event = make_decision(CONTEXT, ACTION, CANDIDATES).event
+    with AuditChain(tmp_path / "audit.jsonl") as chain:
+        chain.extend([event] * 5)
+    histograms = metrics.snapshot().histograms
+    assert histograms["dpe_serialization_seconds"].count == 5
+    assert histograms["dpe_hash_seconds"].count == 5
+
+
+def test_prometheus_text_format(tmp_path) -> None:
+    registry = MetricsRegistry(buckets=(0.001, 0.01))
+    registry.inc("dpe_routes_selected_total", (("route", "LOCAL"),), 3)
+    registry.observe("dpe_hash_seconds", 0.0005)
+    registry.observe("dpe_hash_seconds", 0.5)
+    assert registry.prometheus_text().splitlines() == [
+        "# HELP dpe_routes_selected_total Selected routes by ExecutionRoute.",
+        "# TYPE dpe_routes_selected_total counter",
+        'dpe_routes_selected_total{route="LOCAL"} 3',
+        "# HELP dpe_hash_seconds Time spent computing chained audit hashes.",
+        "# TYPE dpe_hash_seconds histogram",
+        'dpe_hash_seconds_bucket{le="0.001"} 1',
+        'dpe_hash_seconds_bucket{le="0.01"} 1',
+        'dpe_hash_seconds_bucket{le="+Inf"} 2',
+        "dpe_hash_seconds_sum 0.5005",
+        "dpe_hash_seconds_count 2",
+    ]
+    target = tmp_path / "metrics.prom"
+    registry.write_prometheus(target)
+    assert target.read_text() == registry.prometheus_text()
+    with pytest.raises(ValueError, match="increasing"):
+        MetricsRegistry(buckets=(0.1, 0.01))
+
+
+def test_prometheus_counters_are_exact() -> None:
+    registry = MetricsRegistry()
+    registry.inc("dpe_decisions_total", (("decision", "ALLOW"),), 1_234_567)
+    registry.inc("dpe_decisions_total", (("decision", "DENY"),), 0.1)
+    registry.inc("dpe_decisions_total", (("decision", "DENY"),), 12_345_678)
+    lines = registry.prometheus_text().splitlines()
+    assert 'dpe_decisions_total{decision="ALLOW"} 1234567' in lines
+    assert 'dpe_decisions_total{decision="DENY"} 12345678.1' in lines
@@ -0,0 +1,51 @@
+import pickle
+from dataclasses import FrozenInstanceError, asdict, fields, replace
+
+import pytest
+
+from decision_policy_engine.audit.events import AuditEvent
+from decision_policy_engine.models import (
+    Context,
+    CostVector,
+    ExecutionRoute,
+    PolicyDecision,
+    ProposedAction,
+)
+
+
+def _models() -> list[object]:
+    cost = CostVector(120, 0.05, 0.10, 0.02)
+    action = ProposedAction(type="NETWORK_CALL", risk_level="LOW", metadata={"k": 1})
+    context = Context(True, 120, 0.6, True, False)
+    event = AuditEvent(
+        timestamp_iso="2024-01-01T00:00:00+00:00",
+        trace_id="trace",
+        decision_id="decision",
+        action_type=action.type,
+        policy_decision=PolicyDecision.ALLOW,
+        route_selected=ExecutionRoute.LOCAL,
+        cost_vector=cost,
+        reason="ok",
+        inputs_redacted={"action": {"type": action.type}},
+        hash="abc",
+    )
+    return [cost, action, context, event]
+
+
+def test_models_are_slotted_and_keep_dataclass_behaviour() -> None:
+    for model in _models():
+        assert not hasattr(model, "__dict__")
+        assert pickle.loads(pickle.dumps(model)) == model
+        assert replace(model) == model
+        assert asdict(model) == asdict(pickle.loads(pickle.dumps(model)))
+        with pytest.raises(FrozenInstanceError):
+            setattr(model, fields(model)[0].name, None)
+        # Python < 3.12 raises TypeError instead of AttributeError for slotted frozen classes.
+        with pytest.raises((AttributeError, TypeError)):
+            model.extra = 1
+
+
+def test_risk_level_validation_is_unchanged() -> None:
+    assert replace(ProposedAction("DATA_EXPORT", "LOW"), risk_level="HIGH").risk_level == "HIGH"
+    with pytest.raises(ValueError, match=r"risk_level must be one of \['HIGH', 'LOW', 'MEDIUM'\]"):
+        ProposedAction("DATA_EXPORT", "CRITICAL")
@@ -0,0 +1,207 @@
+import itertools
+import json
+
+import pytest
+
+from decision_policy_engine.models import Context, PolicyDecision, ProposedAction
+from decision_policy_engine.policy import rules as rules_module
+from decision_policy_engine.policy.policy_gate import PolicyGate
+from decision_policy_engine.policy.rules import RuleTable, compile_rules, load_rules
+
+
+def _legacy_evaluate(context: Context, action: ProposedAction) -> tuple[PolicyDecision, str]:
+    if action.risk_level == "HIGH" and not context.supervised_mode:
+        return PolicyDecision.SUPERVISED, "High risk action requires supervision."
+    if action.type == "NETWORK_CALL" and not context.network_available:
+        return PolicyDecision.DENY, "Network unavailable for network call."
+    if context.battery_level < 0.10 and action.type == "NETWORK_CALL":
+        return PolicyDecision.DENY, "Battery too low for network call."
+    return PolicyDecision.ALLOW, "Action permitted."
+
+
+def _context(**overrides: object) -> Context:
+    values = {
+        "network_available": True,
+        "rtt_ms": 50,
+        "battery_level": 0.5,
+        "user_present": True,
+        "supervised_mode": True,
+    }
+    values.update(overrides)
+    return Context(**values)
+
+
+def test_default_rules_match_legacy_gate() -> None:
+    grid = itertools.product(
+        [True, False],
+        [0.0, 0.0999, 0.10, 0.5],
+        [True, False],
+        ["NETWORK_CALL", "DATA_PROCESS", "DATA_EXPORT"],
+        ["LOW", "MEDIUM", "HIGH"],
+    )
+    for network, battery, supervised, action_type, risk in grid:
+        context = _context(
+            network_available=network, battery_level=battery, supervised_mode=supervised
+        )
+        action = ProposedAction(type=action_type, risk_level=risk)
+
+        assert PolicyGate.evaluate(context, action) == _legacy_evaluate(context, action)
+
+
+def test_rules_use_metadata_and_operators() -> None:
+    table = compile_rules(
+        [
+            {
+                "name": "large_export",
+                "when": {
+                    "action.type": {"in": ["DATA_EXPORT", "DATA_SYNC"]},
+                    "action.metadata.size_mb": {"gt": 100},
+                },
+                "decision": "DENY",
+                "reason": "Export too large.",
+            },
+            {
+                "name": "tagged",
+                "when": {"action.metadata.tag": {"exists": True}},
+                "decision": "SUPERVISED",
+                "reason": "Tagged action.",
+            },
+        ]
+    )
+    context = _context()
+
+    big = ProposedAction(type="DATA_SYNC", risk_level="LOW", metadata={"size_mb": 500})
+    small = ProposedAction(type="DATA_EXPORT", risk_level="LOW", metadata={"size_mb": 5})
+    tagged = ProposedAction(type="OTHER", risk_level="MEDIUM", metadata={"tag": "x"})
+    untyped = ProposedAction(type="OTHER", risk_level="MEDIUM", metadata={"size_mb": "big"})
+
+    assert table.evaluate(context, big) == (PolicyDecision.DENY, "Export too large.")
+    assert table.evaluate(context, small) == (PolicyDecision.ALLOW, "Action permitted.")
+    assert table.evaluate(context, tagged)[0] == PolicyDecision.SUPERVISED
+    assert table.evaluate(context, untyped)[0] == PolicyDecision.ALLOW
+
+
+def test_dispatch_only_checks_applicable_rules() -> None:
+    rules = [
+        {
+            "name": f"site_{index}",
+            "when": {"action.type": f"SITE_{index}", "action.risk_level": "LOW"},
+            "decision": "DENY",
+            "reason": f"Site {index}.",
+        }
+        for index in range(500)
+    ]
+    table = RuleTable({"rules": rules})
+
+    action = ProposedAction(type="SITE_42", risk_level="LOW")
+
+    assert [rule.name for rule in table.candidates(action)] == ["site_42"]
+    assert table.evaluate(_context(), action) == (PolicyDecision.DENY, "Site 42.")
+    assert table.candidates(ProposedAction(type="SITE_42", risk_level="HIGH")) == ()
+
+
+def test_load_rules_from_json_and_toml(tmp_path) -> None:
+    json_path = tmp_path / "rules.json"
+    json_path.write_text(
+        json.dumps(
+            {
+                "rules": [
+                    {
+                        "when": {"context.rtt_ms": {"ge": 1000}},
+                        "decision": "DENY",
+                        "reason": "Too slow.",
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    toml_path = tmp_path / "rules.toml"
+    toml_path.write_text(
+        "[[rules]]\n"
+        'decision = "DENY"\n'
+        'reason = "Too slow."\n'
+        "[rules.when]\n"
+        '"context.rtt_ms" = { ge = 1000 }\n',
+        encoding="utf-8",
+    )
+    action = ProposedAction(type="DATA_PROCESS", risk_level="LOW")
+
+    paths = [json_path] if rules_module.tomllib is None else [json_path, toml_path]
+    for path in paths:
+        table = load_rules(path)
+        assert table.evaluate(_context(rtt_ms=1500), action)[0] == PolicyDecision.DENY
+        assert table.evaluate(_context(rtt_ms=10), action)[0] == PolicyDecision.ALLOW
+
+
+def test_rules_reject_unknown_fields() -> None:
+    with pytest.raises(ValueError, match="Unknown rule field"):
+        compile_rules([{"when": {"context.nope": 1}, "decision": "DENY", "reason": "x"}])
+
+
+@pytest.mark.parametrize("operand", ["NETWORK_CALL", b"NETWORK_CALL", 3, {"a": 1}])
+def test_rules_reject_non_list_membership_operands(operand: object) -> None:
+    for field_path in ("action.type", "context.rtt_ms"):
+        for op_name in ("in", "not_in"):
+            with pytest.raises(ValueError, match="list of values"):
+                compile_rules(
+                    [
+                        {
+                            "when": {field_path: {op_name: operand}},
+                            "decision": "DENY",
+                            "reason": "x",
+                        }
+                    ]
+                )
+
+
+def test_flat_and_dispatched_tables_agree() -> None:
+    rules = [
+        {
+            "when": {"context.locale": "pt-BR", "action.risk_level": {"ne": "LOW"}},
+            "decision": "SUPERVISED",
+            "reason": "Locale 'pt-BR'.",
+        },
+        {
+            "when": {"context.rtt_ms": {"ge": 200}, "action.type": {"not_in": ["LOCAL_ONLY"]}},
+            "decision": "DENY",
+            "reason": "Slow link.",
+        },
+        {
+            "when": {"action.type": {"in": ["A", "B"]}, "action.metadata.n": {"le": 3}},
+            "decision": "DENY",
+            "reason": "Small n.",
+        },
+    ]
+    padding = [
+        {"when": {"action.type": f"PAD_{index}"}, "decision": "DENY", "reason": "pad"}
+        for index in range(20)
+    ]
+    flat = compile_rules(rules)
+    dispatched = compile_rules(rules + padding)
+    grid = itertools.product(
+        ["en-US", "pt-BR"],
+        [50, 200, 500],
+        ["A", "B", "LOCAL_ONLY", "OTHER"],
+        ["LOW", "MEDIUM", "HIGH"],
+        [{}, {"n": 1}, {"n": 9}, {"n": "x"}],
+    )
+    for locale, rtt_ms, action_type, risk, metadata in grid:
+        context = _context(locale=locale, rtt_ms=rtt_ms)
+        action = ProposedAction(type=action_type, risk_level=risk, metadata=metadata)
+        assert flat.evaluate(context, action) == dispatched.evaluate(context, action)
+        assert flat.evaluator(context, action) == flat.evaluate(context, action)
+
+
+@pytest.mark.parametrize(
+    ("field_path", "condition"),
+    [
+        ("context.battery_level", {"lt": "0.1"}),
+        ("context.rtt_ms", {"ge": True}),
+        ("context.locale", {"gt": 3}),
+        ("action.type", {"lt": None}),
+    ],
+)
+def test_rules_reject_uncomparable_operands(field_path: str, condition: object) -> None:
+    with pytest.raises(ValueError, match="cannot compare"):
+        compile_rules([{"when": {field_path: condition}, "decision": "DENY", "reason": "x"}])
@@ -0,0 +1,133 @@
+import random
+
+import pytest
+
+from decision_policy_engine.audit.redaction import Redactor
+from decision_policy_engine.audit.trace import AuditChain
+from decision_policy_engine.decision.compiled import CompiledRouter
+from decision_policy_engine.engine import make_decision, replay_log
+from decision_policy_engine.engine.replay import main, reconstruct_inputs
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+from decision_policy_engine.policy.rules import DEFAULT_RULES, RuleTable
+
+ALT_WEIGHTS = {"latency_ms": 0.1, "privacy_risk": 0.1, "reliability_risk": 0.1, "dollar_cost": 0.7}
+
+
+def build_candidates(context: Context, action: ProposedAction) -> dict:
+    return {
+        ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02 + context.battery_level),
+        ExecutionRoute.HYBRID: CostVector(max(200, context.rtt_ms), 0.15, 0.20, 0.20),
+        ExecutionRoute.CLOUD: CostVector(max(300, context.rtt_ms + 80), 0.35, 0.30, 0.45),
+        ExecutionRoute.DEGRADED: CostVector(600, 0.02, 0.40, 0.00),
+    }
+
+
+def _write_log(path, count: int = 300) -> list:
+    rng = random.Random(4)
+    decisions = []
+    with AuditChain(path) as chain:
+        for index in range(count):
+            context = Context(
+                network_available=rng.random() < 0.8,
+                rtt_ms=rng.choice([30, 250, 900]),
+                battery_level=rng.random(),
+                user_present=True,
+                supervised_mode=rng.random() < 0.5,
+            )
+            action = ProposedAction(
+                type=rng.choice(["NETWORK_CALL", "DATA_PROCESS"]),
+                risk_level=rng.choice(["LOW", "HIGH"]),
+                metadata={"n": index},
+            )
+            decision = make_decision(
+                context, action, build_candidates(context, action), decision_id=f"d-{index}"
+            )
+            chain.append(decision.event)
+            decisions.append((context, action))
+    return decisions
+
+
+def test_replay_with_recorded_configuration_changes_nothing(tmp_path) -> None:
+    _write_log(tmp_path / "audit.jsonl")
+    report = replay_log(tmp_path / "audit.jsonl", candidates=build_candidates, chunk_size=32)
+    assert report.events == report.replayed == 300
+    assert report.changed == report.policy_changed == report.route_changed == 0
+    assert sum(report.route_transitions.values()) == 300
+    assert main([str(tmp_path / "audit.jsonl")]) == 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_replay_counts_changes_under_candidate_config(tmp_path, workers: int) -> None:
+    decisions = _write_log(tmp_path / "audit.jsonl")
+    spec = {"rules": list(DEFAULT_RULES["rules"]), "default": DEFAULT_RULES["default"]}
+    spec["rules"][2] = dict(
+        spec["rules"][2], when={"context.battery_level": {"lt": 0.5}, "action.type": "NETWORK_CALL"}
+    )
+    rules = RuleTable(spec)
+    baseline, router = RuleTable(DEFAULT_RULES), CompiledRouter(ALT_WEIGHTS)
+    expected_policy = sum(
+        rules.evaluate(c, a)[0] != baseline.evaluate(c, a)[0] for c, a in decisions
+    )
+    expected_route = sum(
+        router.select_route(c, build_candidates(c, a))[0]
+        != CompiledRouter().select_route(c, build_candidates(c, a))[0]
+        for c, a in decisions
+    )
+    assert expected_policy and expected_route
+
+    report = replay_log(
+        tmp_path / "audit.jsonl",
+        rules=rules,
+        weights=ALT_WEIGHTS,
+        candidates=build_candidates,
+        workers=workers,
+        chunk_size=25,
+        max_examples=5,
+    )
+    assert report.policy_changed == expected_policy
+    assert report.route_changed == expected_route
+    assert report.policy_transitions[("ALLOW", "DENY")] == expected_policy
+    assert len(report.examples) == 5
+    assert report.examples[0].decision_id == min(
+        (change.decision_id for change in report.examples), key=lambda d: int(d[2:])
+    )
+
+
+def test_replay_skips_inputs_that_cannot_be_rebuilt(tmp_path) -> None:
+    context = Context(True, 10, 0.5, True, True)
+    action = ProposedAction("DATA_PROCESS", "LOW")
+    with AuditChain(tmp_path / "audit.jsonl") as chain:
+        chain.append(make_decision(context, action, build_candidates(context, action)).event)
+        redacted = make_decision(
+            context,
+            action,
+            build_candidates(context, action),
+            redactor=Redactor(context_fields=("rtt_ms",)),
+        )
+        chain.append(redacted.event)
+    report = replay_log(tmp_path / "audit.jsonl")
+    assert (report.events, report.replayed, report.skipped) == (2, 1, 1)
+
+    with open(tmp_path / "audit.jsonl", "ab") as handle:
+        handle.write(b'{"kind": "heartbeat"}\n[1, 2]\n{"policy_decision": "ALLOW", "route_s')
+    for workers in (1, 2):
+        report = replay_log(tmp_path / "audit.jsonl", workers=workers)
+        assert (report.events, report.replayed, report.skipped) == (5, 1, 4)
+        assert report.config_hashes == {None: 2}
+    assert (
+        reconstruct_inputs(
+            {
+                "context": {
+                    "network_available": True,
+                    "rtt_ms": 1,
+                    "battery_level": 1.0,
+                    "user_present": True,
+                    "supervised_mode": False,
+                },
+                "action": {"type": "X", "risk_level": "LOW"},
+            }
+        )[1].type
+        == "X"
+    )
+    with pytest.raises(ValueError, match="candidates"):
+        replay_log(tmp_path / "audit.jsonl", weights=ALT_WEIGHTS)
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from decision_policy_engine.decision.registry import DEFAULT_ROUTE_REGISTRY, RouteRegistry
+from decision_policy_engine.decision.router import TIE_BREAK_ORDER, Router
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute
+
+
+def _context(network_available: bool = True) -> Context:
+    return Context(
+        network_available=network_available,
+        rtt_ms=100,
+        battery_level=0.6,
+        user_present=True,
+        supervised_mode=True,
+    )
+
+
+def _cost(rng: random.Random) -> CostVector:
+    return CostVector(rng.randint(0, 2500), rng.random(), rng.random(), rng.uniform(0, 12))
+
+
+def test_default_registry_matches_router() -> None:
+    rng = random.Random(5)
+    for _ in range(500):
+        shared = _cost(rng)
+        candidates = {
+            route: shared if rng.random() < 0.3 else _cost(rng)
+            for route in rng.sample(TIE_BREAK_ORDER, rng.randint(1, 4))
+        }
+        context = _context(rng.random() < 0.6)
+        try:
+            expected = Router.select_route(context, candidates)
+        except ValueError:
+            with pytest.raises(ValueError):
+                DEFAULT_ROUTE_REGISTRY.select_route(context, candidates)
+            continue
+
+        route, cost, explanation = DEFAULT_ROUTE_REGISTRY.select_route(context, candidates)
+        assert (route, cost) == expected[:2]
+        assert explanation.scores == expected[2].scores
+        assert explanation.normalized == expected[2].normalized
+        top = DEFAULT_ROUTE_REGISTRY.top_k(context, candidates, 4)
+        assert top[0].route == route
+        assert len({item.route for item in top}) == len(top)
+
+
+def test_custom_routes_select_and_rank_top_k() -> None:
+    rng = random.Random(11)
+    routes = {f"region-{index:02d}": 100 - index for index in range(60)}
+    registry = RouteRegistry(
+        routes, requires_network=["region-00", "region-01"], offline_fallbacks=["region-59"]
+    )
+    assert registry.routes[0] == "region-59"
+    shared = CostVector(100, 0.1, 0.1, 0.1)
+    candidates = {route: shared if index % 7 == 0 else _cost(rng)
+                  for index, route in enumerate(routes)}
+
+    ordered = sorted(candidates, key=lambda r: (registry.score(candidates[r]), routes[r]))
+    route, cost, _ = registry.select_route(_context(), candidates)
+    assert (route, cost) == (ordered[0], candidates[ordered[0]])
+    assert [item.route for item in registry.top_k(_context(), candidates, 5)] == ordered[:5]
+
+    offline = registry.top_k(_context(False), candidates, 3)
+    assert offline[0].route == "region-59"
+    assert registry.select_route(_context(False), candidates)[0] == "region-59"
+    online_only = {r: c for r, c in candidates.items() if r in ("region-00", "region-01")}
+    with pytest.raises(ValueError, match="No candidates"):
+        registry.select_route(_context(False), online_only)
+    assert "region-00" not in registry.explain(candidates, network_available=False).scores
+
+
+def test_registry_validation() -> None:
+    with pytest.raises(ValueError, match="unique"):
+        RouteRegistry({"a": 1, "b": 1})
+    with pytest.raises(ValueError, match="Duplicate"):
+        RouteRegistry(["a", "a"])
+    with pytest.raises(ValueError, match="not a registered route"):
+        RouteRegistry(["a"], offline_fallbacks=["b"])
+    with pytest.raises(ValueError, match="cannot require"):
+        RouteRegistry(["a"], requires_network=["a"], offline_fallbacks=["a"])
+    registry = RouteRegistry([ExecutionRoute.LOCAL])
+    with pytest.raises(ValueError, match="not a registered route"):
+        registry.select_route(_context(), {"elsewhere": CostVector(1, 0, 0, 0)})
+    with pytest.raises(ValueError, match="k must be positive"):
+        registry.top_k(_context(), {ExecutionRoute.LOCAL: CostVector(1, 0, 0, 0)}, 0)
@@ -0,0 +1,112 @@
+import random
+from array import array
+
+import pytest
+
+from decision_policy_engine.decision.router import TIE_BREAK_ORDER, Router
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute
+
+
+def _context(network_available: bool) -> Context:
+    return Context(
+        network_available=network_available,
+        rtt_ms=100,
+        battery_level=0.6,
+        user_present=True,
+        supervised_mode=True,
+    )
+
+
+def _workload(seed: int, routes: list[ExecutionRoute], n_rows: int = 200):
+    rng = random.Random(seed)
+    contexts = [_context(rng.random() < 0.7) for _ in range(n_rows)]
+    costs = []
+    for _ in range(n_rows):
+        if rng.random() < 0.2:
+            # Identical rows exercise the tie-break order.
+            cost = [rng.randint(0, 2500), 0.2, 0.2, rng.uniform(0, 12)]
+            costs.append([list(cost) for _ in routes])
+            continue
+        costs.append(
+            [
+                [rng.randint(0, 2500), rng.random(), rng.random(), rng.uniform(0, 12)]
+                for _ in routes
+            ]
+        )
+    return contexts, costs
+
+
+def _expected(contexts, costs, routes):
+    results = []
+    for context, row in zip(contexts, costs, strict=True):
+        candidates = {route: CostVector(*cost) for route, cost in zip(routes, row, strict=True)}
+        results.append(Router.select_route(context, candidates))
+    return results
+
+
+ROUTE_SETS = [
+    list(TIE_BREAK_ORDER),
+    [ExecutionRoute.DEGRADED, ExecutionRoute.CLOUD, ExecutionRoute.HYBRID],
+    [ExecutionRoute.CLOUD, ExecutionRoute.HYBRID],
+]
+
+
+@pytest.mark.parametrize("routes", ROUTE_SETS)
+def test_batch_matches_select_route_pure_python(routes) -> None:
+    contexts, costs = _workload(7, routes)
+    expected = _expected(contexts, costs, routes)
+
+    result = Router.select_routes_batch(
+        contexts, costs, routes, return_scores=True, use_numpy=False
+    )
+
+    for (route, cost, explanation), chosen, chosen_cost, scores in zip(
+        expected, result.routes, result.costs, result.scores, strict=True
+    ):
+        assert chosen == route
+        assert chosen_cost == (
+            cost.latency_ms,
+            cost.privacy_risk,
+            cost.reliability_risk,
+            cost.dollar_cost,
+        )
+        for index, candidate in enumerate(routes):
+            if candidate in explanation.scores:
+                assert scores[index] == explanation.scores[candidate]
+            else:
+                assert scores[index] != scores[index]
+
+
+@pytest.mark.parametrize("routes", ROUTE_SETS)
+def test_batch_matches_select_route_numpy(routes) -> None:
+    np = pytest.importorskip("numpy")
+    contexts, costs = _workload(11, routes)
+    expected = _expected(contexts, costs, routes)
+
+    result = Router.select_routes_batch(
+        contexts, np.asarray(costs, dtype=float), routes, return_scores=True
+    )
+
+    assert result.routes == [route for route, _, _ in expected]
+    for (_, _, explanation), scores in zip(expected, result.scores, strict=True):
+        for index, candidate in enumerate(routes):
+            if candidate in explanation.scores:
+                assert scores[index] == explanation.scores[candidate]
+
+
+def test_batch_accepts_flat_array() -> None:
+    routes = [ExecutionRoute.LOCAL, ExecutionRoute.HYBRID]
+    contexts = [_context(True), _context(True)]
+    flat = array("d", [200, 0.3, 0.3, 0.3, 150, 0.2, 0.2, 0.2] * 2)
+
+    result = Router.select_routes_batch(contexts, flat, routes)
+
+    assert result.routes == [ExecutionRoute.HYBRID, ExecutionRoute.HYBRID]
+    assert result.scores is None
+
+
+def test_batch_rejects_cloud_only_when_network_off() -> None:
+    with pytest.raises(ValueError, match="No candidates"):
+        Router.select_routes_batch(
+            [_context(False)], [[[100, 0.1, 0.1, 0.1]]], [ExecutionRoute.CLOUD]
+        )
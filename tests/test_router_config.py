@@ -0,0 +1,231 @@
+import json
+import random
+import threading
+
+import pytest
+
+from decision_policy_engine.audit.encoding import (
+    canonical_json,
+    encode_event,
+    reference_event_json,
+)
+from decision_policy_engine.audit.trace import AuditChain, parse_event
+from decision_policy_engine.audit.verify import verify_chain
+from decision_policy_engine.decision import cost as cost_module
+from decision_policy_engine.decision import router as router_module
+from decision_policy_engine.decision.compiled import CompiledRouter, router_for
+from decision_policy_engine.decision.config import DEFAULT_ROUTER_CONFIG, RouterConfig
+from decision_policy_engine.decision.registry import DEFAULT_ROUTE_REGISTRY, RouteRegistry
+from decision_policy_engine.decision.router import TIE_BREAK_ORDER, WEIGHTS, Router
+from decision_policy_engine.engine.core import make_decision
+from decision_policy_engine.engine.replay import replay_log
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=True,
+)
+ACTION = ProposedAction(type="read", risk_level="LOW")
+CANDIDATES = {
+    ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+    ExecutionRoute.HYBRID: CostVector(200, 0.15, 0.20, 0.20),
+    ExecutionRoute.CLOUD: CostVector(300, 0.35, 0.30, 0.45),
+}
+
+
+def _candidates(context: Context, action: ProposedAction) -> dict[ExecutionRoute, CostVector]:
+    return CANDIDATES
+
+
+def test_config_router_matches_router_bit_for_bit(monkeypatch: pytest.MonkeyPatch) -> None:
+    weights = {"latency_ms": 0.1, "privacy_risk": 0.2, "reliability_risk": 0.3, "dollar_cost": 0.4}
+    bounds = {"latency_min_ms": 10, "latency_max_ms": 900, "cost_min": 0.1, "cost_max": 3.3}
+    router = router_for(RouterConfig.from_weights(weights, **bounds))
+    monkeypatch.setattr(router_module, "WEIGHTS", weights)
+    monkeypatch.setattr(cost_module, "LATENCY_MIN_MS", bounds["latency_min_ms"])
+    monkeypatch.setattr(cost_module, "LATENCY_MAX_MS", bounds["latency_max_ms"])
+    monkeypatch.setattr(cost_module, "COST_MIN", bounds["cost_min"])
+    monkeypatch.setattr(cost_module, "COST_MAX", bounds["cost_max"])
+
+    rng = random.Random(3)
+    for _ in range(300):
+        candidates = {
+            route: CostVector(rng.uniform(0, 1200), rng.random(), rng.random(), rng.uniform(0, 4))
+            for route in rng.sample(TIE_BREAK_ORDER, rng.randint(1, 4))
+        }
+        expected = Router.select_route(CONTEXT, candidates)
+        route, cost, explanation = router.select_route(CONTEXT, candidates)
+        assert (route, cost) == expected[:2]
+        assert explanation.scores == expected[2].scores
+        assert explanation.normalized == expected[2].normalized
+
+
+def test_config_hash_is_stable_and_distinguishes_configs() -> None:
+    assert RouterConfig().config_hash == DEFAULT_ROUTER_CONFIG.config_hash
+    assert RouterConfig.current() == DEFAULT_ROUTER_CONFIG
+    assert RouterConfig.from_weights(WEIGHTS) == DEFAULT_ROUTER_CONFIG
+    # Ints and floats of equal value are the same configuration.
+    assert RouterConfig(cost_max=5).config_hash == RouterConfig(cost_max=5.0).config_hash
+
+    variants = {
+        DEFAULT_ROUTER_CONFIG.config_hash,
+        RouterConfig(latency_max_ms=2001).config_hash,
+        RouterConfig(weights=(0.25, 0.25, 0.25, 0.25)).config_hash,
+        RouterConfig(tie_break_order=tuple(reversed(TIE_BREAK_ORDER))).config_hash,
+    }
+    assert len(variants) == 4
+    assert json.loads(DEFAULT_ROUTER_CONFIG.canonical_json())["weights"] == WEIGHTS
+
+
+def test_router_for_shares_one_router_per_config() -> None:
+    config = RouterConfig(cost_max=7.5)
+    routers: list[CompiledRouter] = []
+    threads = [
+        threading.Thread(target=lambda: routers.append(router_for(RouterConfig(cost_max=7.5))))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(router is router_for(config) for router in routers)
+    assert router_for(config).config == config
+    assert router_for(RouterConfig(cost_max=8.0)) is not router_for(config)
+    registry = RouteRegistry(
+        TIE_BREAK_ORDER,
+        requires_network=[ExecutionRoute.CLOUD],
+        offline_fallbacks=[ExecutionRoute.LOCAL, ExecutionRoute.DEGRADED],
+        config=config,
+    )
+    assert registry.config == config
+
+
+def test_registry_config_hash_covers_its_route_rules() -> None:
+    assert DEFAULT_ROUTE_REGISTRY.config == DEFAULT_ROUTER_CONFIG
+    reversed_order = tuple(reversed(TIE_BREAK_ORDER))
+    hashes = {
+        DEFAULT_ROUTE_REGISTRY.config.config_hash,
+        RouteRegistry(
+            reversed_order,
+            requires_network=[ExecutionRoute.CLOUD],
+            offline_fallbacks=[ExecutionRoute.LOCAL, ExecutionRoute.DEGRADED],
+        ).config.config_hash,
+        RouteRegistry(
+            TIE_BREAK_ORDER, offline_fallbacks=[ExecutionRoute.LOCAL, ExecutionRoute.DEGRADED]
+        ).config.config_hash,
+        RouteRegistry(
+            TIE_BREAK_ORDER,
+            requires_network=[ExecutionRoute.CLOUD],
+            offline_fallbacks=[ExecutionRoute.DEGRADED],
+        ).config.config_hash,
+    }
+    assert len(hashes) == 4
+
+    config = RouterConfig(
+        tie_break_order=reversed_order,
+        requires_network=(ExecutionRoute.HYBRID, ExecutionRoute.CLOUD),
+        offline_fallbacks=(ExecutionRoute.DEGRADED,),
+    )
+    registry = RouteRegistry(
+        config.tie_break_order,
+        requires_network=config.requires_network,
+        offline_fallbacks=config.offline_fallbacks,
+        config=config,
+    )
+    assert registry.config == config
+    offline = Context(
+        network_available=False,
+        rtt_ms=120,
+        battery_level=0.6,
+        user_present=True,
+        supervised_mode=True,
+    )
+    rng = random.Random(9)
+    for _ in range(200):
+        candidates = {
+            route: CostVector(rng.uniform(0, 1200), rng.random(), rng.random(), rng.uniform(0, 4))
+            for route in rng.sample(TIE_BREAK_ORDER, rng.randint(1, 4))
+        }
+        for context in (CONTEXT, offline):
+            try:
+                expected = registry.select_route(context, candidates)[:2]
+            except ValueError:
+                with pytest.raises(ValueError):
+                    router_for(config).select_route(context, candidates)
+                continue
+            assert router_for(config).select_route(context, candidates)[:2] == expected
+
+
+def test_replay_uses_config_tie_break_order(tmp_path) -> None:
+    config = RouterConfig(
+        tie_break_order=tuple(reversed(TIE_BREAK_ORDER)),
+        offline_fallbacks=(ExecutionRoute.DEGRADED, ExecutionRoute.LOCAL),
+    )
+    tied = CostVector(100, 0.1, 0.1, 0.1)
+    candidates = {route: tied for route in TIE_BREAK_ORDER}
+    decision = make_decision(CONTEXT, ACTION, candidates, router=router_for(config))
+    assert decision.route is ExecutionRoute.DEGRADED
+    path = tmp_path / "audit_log.jsonl"
+    with AuditChain(path) as chain:
+        chain.append(decision.event)
+
+    report = replay_log(path, config=config, candidates=lambda context, action: candidates)
+    assert report.route_transitions == {("DEGRADED", "DEGRADED"): 1}
+    assert report.config_hashes == {config.config_hash: 1}
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"weights": (1.0, 2.0)}, "entries"),
+        ({"weights": (1.0, 2.0, float("nan"), 0.0)}, "finite"),
+        ({"cost_min": "0"}, "numbers"),
+        ({"latency_min_ms": 10, "latency_max_ms": 5}, "minimums"),
+        ({"tie_break_order": ("a", "a")}, "repeat"),
+        ({"tie_break_order": ("a",)}, "not in tie_break_order"),
+        ({"offline_fallbacks": (ExecutionRoute.CLOUD,)}, "require the network"),
+        ({"tie_break_order": ("a", object())}, "str, int or str-Enum"),
+        ({"tie_break_order": ("a", ("b", 1))}, "str, int or str-Enum"),
+        ({"tie_break_order": ("a", True)}, "str, int or str-Enum"),
+    ],
+)
+def test_router_config_rejects_invalid_values(kwargs: dict[str, object], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        RouterConfig(**kwargs)
+
+
+def test_conflicting_weights_and_config_are_rejected() -> None:
+    with pytest.raises(ValueError, match="weights"):
+        RouterConfig.from_weights({"latency_ms": 1.0})
+    with pytest.raises(ValueError):
+        CompiledRouter(WEIGHTS, config=DEFAULT_ROUTER_CONFIG)
+    with pytest.raises(ValueError):
+        RouteRegistry(TIE_BREAK_ORDER, weights=WEIGHTS, config=DEFAULT_ROUTER_CONFIG)
+
+
+def test_config_hash_is_recorded_and_replayed(tmp_path) -> None:
+    config = RouterConfig(weights=(0.1, 0.1, 0.1, 0.7))
+    path = tmp_path / "audit_log.jsonl"
+    with AuditChain(path) as chain:
+        for router in (Router, router_for(config)):
+            event = make_decision(CONTEXT, ACTION, CANDIDATES, router=router).event
+            assert canonical_json(event) == reference_event_json(event)
+            chain.append(event)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert "config_hash" not in json.loads(lines[0])
+    assert json.loads(lines[1])["config_hash"] == config.config_hash
+    recorded = parse_event(lines[1])
+    assert recorded.config_hash == config.config_hash
+    assert canonical_json(recorded, include_hash_fields=True) == lines[1]
+    head, middle, tail = encode_event(recorded).line_template()
+    assert f'{head}"{recorded.hash}"{middle}"{recorded.prev_hash}"{tail}' == lines[1]
+    assert verify_chain(path).ok
+
+    report = replay_log(path, config=config, candidates=_candidates)
+    assert report.config_hashes == {None: 1, config.config_hash: 1}
+    with pytest.raises(ValueError, match="either"):
+        replay_log(path, weights=WEIGHTS, config=config, candidates=_candidates)
@@ -0,0 +1,134 @@
+import random
+
+import pytest
+
+from decision_policy_engine.decision.registry import RouteRegistry
+from decision_policy_engine.decision.router import Router
+from decision_policy_engine.decision.session import RoutingSession
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute
+
+
+def _context(rtt_ms: int = 100, network_available: bool = True) -> Context:
+    return Context(
+        network_available=network_available,
+        rtt_ms=rtt_ms,
+        battery_level=0.6,
+        user_present=True,
+        supervised_mode=True,
+    )
+
+
+def _cost(rng: random.Random) -> CostVector:
+    return CostVector(rng.randint(0, 2500), rng.random(), rng.random(), rng.uniform(0, 12))
+
+
+def _hybrid(context: Context) -> CostVector:
+    return CostVector(max(200, context.rtt_ms), 0.15, 0.20, 0.20)
+
+
+def _cloud(context: Context) -> CostVector:
+    return CostVector(max(300, context.rtt_ms + 80), 0.35, 0.30, 0.45)
+
+
+def test_session_matches_router_across_context_and_cost_changes() -> None:
+    rng = random.Random(3)
+    session = RoutingSession(
+        {ExecutionRoute.LOCAL: _cost(rng), ExecutionRoute.DEGRADED: _cost(rng)},
+        dynamic={ExecutionRoute.HYBRID: _hybrid, ExecutionRoute.CLOUD: _cloud},
+    )
+    for _ in range(500):
+        if rng.random() < 0.2:
+            route = rng.choice([ExecutionRoute.LOCAL, ExecutionRoute.DEGRADED])
+            session.update({route: _cost(rng)})
+        context = _context(rng.choice([20, 150, 800, 2000]), rng.random() < 0.7)
+        candidates = {
+            ExecutionRoute.LOCAL: session.candidates[ExecutionRoute.LOCAL],
+            ExecutionRoute.HYBRID: _hybrid(context),
+            ExecutionRoute.CLOUD: _cloud(context),
+            ExecutionRoute.DEGRADED: session.candidates[ExecutionRoute.DEGRADED],
+        }
+        expected = Router.select_route(context, candidates)
+        route, cost, explanation = session.select_route(context)
+        assert (route, cost) == expected[:2]
+        assert explanation.scores == expected[2].scores
+        assert session.candidates == candidates
+
+
+def test_session_masks_network_routes_without_fallback() -> None:
+    rng = random.Random(9)
+    routes = [f"r{index}" for index in range(40)]
+    registry = RouteRegistry(routes, requires_network=routes[:20])
+    candidates = {route: _cost(rng) for route in routes}
+    session = RoutingSession(candidates, registry=registry)
+    for step in range(200):
+        route = rng.choice(routes)
+        candidates[route] = _cost(rng)
+        session.update({route: candidates[route]})
+        context = _context(network_available=step % 3 != 0)
+        assert session.select_route(context)[:2] == registry.select_route(context, candidates)[:2]
+
+    online = RoutingSession({routes[0]: _cost(rng)}, registry=registry)
+    with pytest.raises(ValueError, match="No candidates"):
+        online.select_route(_context(network_available=False))
+    online.update({routes[30]: _cost(rng)})
+    assert online.select_route(_context(network_available=False))[0] == routes[30]
+
+
+def test_session_explanations_survive_updates_and_validation() -> None:
+    session = RoutingSession({ExecutionRoute.LOCAL: CostVector(100, 0.1, 0.1, 0.1)})
+    _, _, explanation = session.select_route(_context())
+    session.update({ExecutionRoute.LOCAL: CostVector(900, 0.9, 0.9, 9.0)})
+    assert explanation.scores == Router.select_route(
+        _context(), {ExecutionRoute.LOCAL: CostVector(100, 0.1, 0.1, 0.1)}
+    )[2].scores
+
+    with pytest.raises(ValueError, match="static and a dynamic"):
+        RoutingSession(
+            {ExecutionRoute.CLOUD: CostVector(1, 0, 0, 0)}, dynamic={ExecutionRoute.CLOUD: _cloud}
+        )
+    with pytest.raises(ValueError, match="Unknown context field"):
+        RoutingSession({}, depends_on=["latency"])
+    with pytest.raises(ValueError, match="not a registered route"):
+        RoutingSession({"elsewhere": CostVector(1, 0, 0, 0)})
+    dynamic = RoutingSession({}, dynamic={ExecutionRoute.CLOUD: _cloud})
+    with pytest.raises(ValueError, match="dynamic candidate"):
+        dynamic.update({ExecutionRoute.CLOUD: CostVector(1, 0, 0, 0)})
+
+
+def test_session_update_with_unregistered_route_changes_nothing() -> None:
+    local = {ExecutionRoute.LOCAL: CostVector(100, 0.1, 0.1, 0.1)}
+    session = RoutingSession(local)
+    cost = CostVector(50, 0.0, 0.0, 0.0)
+    with pytest.raises(ValueError, match="not a registered route"):
+        session.update({ExecutionRoute.HYBRID: cost, "bogus": cost})
+
+    assert session.candidates == local
+    assert session.scores.keys() == {ExecutionRoute.LOCAL}
+    route, _, _ = session.select_route(_context())
+    assert route is ExecutionRoute.LOCAL
+    session.update({ExecutionRoute.HYBRID: cost})
+    assert session.select_route(_context())[:2] == Router.select_route(
+        _context(), {**local, ExecutionRoute.HYBRID: cost}
+    )[:2]
+
+
+def test_session_retries_dynamic_costs_after_a_builder_fails() -> None:
+    failures = [ConnectionError("probe timed out")]
+
+    def flaky_hybrid(context: Context) -> CostVector:
+        if context.rtt_ms == 3000 and failures:
+            raise failures.pop()
+        return _hybrid(context)
+
+    local = {ExecutionRoute.LOCAL: CostVector(1000, 0.2, 0.2, 0.2)}
+    session = RoutingSession(local, dynamic={ExecutionRoute.HYBRID: flaky_hybrid})
+    assert session.select_route(_context(100))[0] is ExecutionRoute.HYBRID
+    with pytest.raises(ConnectionError):
+        session.select_route(_context(3000))
+
+    expected = Router.select_route(
+        _context(3000), {**local, ExecutionRoute.HYBRID: _hybrid(_context(3000))}
+    )
+    assert session.select_route(_context(3000))[:2] == expected[:2]
+    assert expected[0] is ExecutionRoute.LOCAL
+    assert session.candidates[ExecutionRoute.HYBRID] == _hybrid(_context(3000))
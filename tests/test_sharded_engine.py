@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from decision_policy_engine.audit.verify import verify_chain
+from decision_policy_engine.engine import (
+    DecisionRequest,
+    ShardedDecisionEngine,
+    make_decision,
+    shard_for,
+    verify_sharded,
+)
+from decision_policy_engine.engine.sharded import read_manifest, shard_path
+from decision_policy_engine.models import Context, CostVector, ExecutionRoute, ProposedAction
+
+CONTEXT = Context(
+    network_available=True,
+    rtt_ms=120,
+    battery_level=0.6,
+    user_present=True,
+    supervised_mode=False,
+)
+ACTION = ProposedAction(type="NETWORK_CALL", risk_level="LOW")
+CANDIDATES = {
+    ExecutionRoute.LOCAL: CostVector(120, 0.05, 0.10, 0.02),
+    ExecutionRoute.HYBRID: CostVector(200, 0.15, 0.20, 0.20),
+}
+
+
+def _requests(count: int) -> list[DecisionRequest]:
+    return [
+        DecisionRequest(CONTEXT, ACTION, CANDIDATES, trace_id=f"t{i % 17}", decision_id=f"d{i}")
+        for i in range(count)
+    ]
+
+
+def test_sharded_engine_partitions_by_trace_and_verifies(tmp_path) -> None:
+    with ShardedDecisionEngine(tmp_path, shards=3) as engine:
+        decisions = engine.decide_many(_requests(120), chunk_size=7)
+        single = engine.decide(CONTEXT, ACTION, CANDIDATES, trace_id="t1", decision_id="last")
+
+    expected = make_decision(CONTEXT, ACTION, CANDIDATES)
+    assert [d.event.decision_id for d in decisions] == [f"d{i}" for i in range(120)]
+    assert all(d.route is expected.route and d.event.hash for d in decisions)
+    assert single.event.prev_hash is not None
+
+    total = 0
+    for index in range(3):
+        lines = shard_path(tmp_path, index).read_text().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert all(shard_for(r["trace_id"], 3) == index for r in records)
+        ids = [int(r["decision_id"][1:]) for r in records if r["decision_id"] != "last"]
+        assert ids == sorted(ids)
+        total += len(records)
+    assert total == 121
+
+    report = verify_sharded(tmp_path)
+    assert report.ok and report.events == 121
+    assert report.root_hash == read_manifest(tmp_path)["root_hash"]
+
+
+def test_sharded_engine_reopens_and_detects_tampering(tmp_path) -> None:
+    with ShardedDecisionEngine(tmp_path, shards=2) as engine:
+        engine.decide_many(_requests(10))
+    with ShardedDecisionEngine(tmp_path) as engine:
+        assert engine.shards == 2
+        engine.decide_many(_requests(10))
+    assert verify_sharded(tmp_path).ok
+
+    shard = shard_path(tmp_path, 0)
+    lines = shard.read_bytes().splitlines(keepends=True)
+    shard.write_bytes(b"".join(lines[:-1]))
+    assert verify_chain(shard).ok
+    report = verify_sharded(tmp_path)
+    assert not report.ok and report.error == "shard 0 tail does not match the manifest"
+
+
+def test_shard_count_must_match_existing_manifest(tmp_path) -> None:
+    with ShardedDecisionEngine(tmp_path, shards=2):
+        pass
+    with pytest.raises(ValueError, match="2 shards"):
+        ShardedDecisionEngine(tmp_path, shards=3)